@@ -30,10 +30,11 @@ def build_executable():
     script_dir = Path(__file__).parent
     os.chdir(script_dir)
     
-    # PyInstaller command with options
+    # PyInstaller command with options. Running it under -O embeds
+    # assert-stripped bytecode in the bundle.
     cmd = [
-        "pyinstaller",
-        "--onefile",             # Create a single executable file
+        sys.executable, "-O", "-m", "PyInstaller",
+        "--onedir",              # Unpacked bundle: no temp extraction on every start
         "--console",             # Keep console window (for command-line tool)
         "--name", "pogtool",     # Name of the executable
         "--distpath", "dist",    # Output directory
@@ -44,42 +45,51 @@ def build_executable():
         "--hidden-import", "click",           # Ensure click is included
         "--hidden-import", "colorama",        # Ensure colorama is included
         "--hidden-import", "dateutil",        # Ensure dateutil is included
-        "--hidden-import", "pogtool.commands.compare",  # Include all command modules
-        "--hidden-import", "pogtool.commands.merge",
-        "--hidden-import", "pogtool.commands.stats",
-        "--hidden-import", "pogtool.formatters.csv",    # Include all formatter modules
-        "--hidden-import", "pogtool.formatters.json",
-        "--hidden-import", "pogtool.formatters.text",
-        "--hidden-import", "pogtool.parsers.common",    # Include all parser modules
-        "--hidden-import", "pogtool.parsers.generic",
+        "--additional-hooks-dir", "pyinstaller_hooks",  # Collects lazily imported pogtool modules
+        "--exclude-module", "tkinter",        # Standard library modules pogtool never uses
+        "--exclude-module", "unittest",
+        "--exclude-module", "pydoc",
+        "--exclude-module", "xmlrpc",
+        "--exclude-module", "lib2to3",
+        "--exclude-module", "test",
+        "--exclude-module", "distutils",
         "pogtool.py"             # Main Python script
     ]
     
     print("Building Windows executable...")
     print(f"Command: {' '.join(cmd)}")
     
+    # Stream the build log line by line instead of buffering it until exit
     try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        print("Build successful!")
-        print("\nBuild output:")
-        print(result.stdout)
-        
-        # Check if executable was created
-        exe_path = Path("dist/pogtool.exe")
-        if exe_path.exists():
-            print(f"\n✅ Executable created successfully: {exe_path.absolute()}")
-            print(f"File size: {exe_path.stat().st_size / (1024*1024):.1f} MB")
-            return True
-        else:
-            print("❌ Executable file not found in expected location")
-            return False
-            
-    except subprocess.CalledProcessError as e:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+    except OSError as e:
         print(f"❌ Build failed: {e}")
-        if e.stdout:
-            print("STDOUT:", e.stdout)
-        if e.stderr:
-            print("STDERR:", e.stderr)
+        return False
+    
+    for line in proc.stdout:
+        sys.stdout.write(line)
+    returncode = proc.wait()
+    
+    if returncode != 0:
+        print(f"❌ Build failed: PyInstaller exited with status {returncode}")
+        return False
+    
+    print("Build successful!")
+    
+    # Check if executable was created
+    exe_path = Path("dist/pogtool/pogtool.exe")
+    if exe_path.exists():
+        print(f"\n✅ Executable created successfully: {exe_path.absolute()}")
+        print(f"File size: {exe_path.stat().st_size / (1024*1024):.1f} MB")
+        return True
+    else:
+        print("❌ Executable file not found in expected location")
         return False
 
 
@@ -101,9 +111,9 @@ def main():
     if build_executable():
         print("\n🎉 Build completed successfully!")
         print("\nTo use the executable:")
-        print("1. Navigate to the 'dist' folder")
-        print("2. Copy pogtool.exe to your desired location")
-        print("3. Add the location to your Windows PATH (optional)")
+        print("1. Navigate to the 'dist/pogtool' folder")
+        print("2. Copy the whole folder to your desired location")
+        print("3. Add that folder to your Windows PATH (optional)")
         print("4. Use: pogtool.exe [command] [options] [files...]")
         print("\nAvailable commands:")
         print("  - pogtool.exe stats app.log --levels")
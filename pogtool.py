@@ -20,4 +20,8 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from pogtool.cli import main
 
 if __name__ == "__main__":
+    if getattr(sys, "frozen", False):
+        # Lets merge's parser worker processes start from the bundled executable
+        import multiprocessing
+        multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -9,6 +9,14 @@ __version__ = "0.1.0"
 __author__ = "Pogtool Team"
 __email__ = "team@pogtool.dev"
 
-from pogtool.cli import main
+from typing import Any
 
-__all__ = ["main"]
\ No newline at end of file
+__all__ = ["main"]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``main`` on first access so importing the package stays cheap."""
+    if name == "main":
+        from pogtool.cli import main
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -5,197 +5,132 @@ This module defines the command-line interface using Click framework,
 providing the main entry point and subcommands for stats, compare, and merge operations.
 """
 
-from typing import Optional
+import importlib
+import os
+import shlex
+import sys
+from typing import Any, Dict, List, Optional
 
 import click
 
 from pogtool import __version__
 
 
-@click.group()
-@click.version_option(version=__version__, prog_name="pogtool")
-@click.help_option("-h", "--help")
-def cli() -> None:
+class LazyGroup(click.Group):
     """
-    Pogtool: A comprehensive log analysis and manipulation tool.
-    
-    Analyze, compare, and merge log files with advanced filtering capabilities.
-    
-    Use 'pogtool COMMAND --help' for detailed information about each command.
+    Click group that imports subcommand modules only when they are needed.
+
+    Subcommands are registered as ``"module.path:attribute"`` references, so
+    invoking one subcommand never constructs the options of the others.
     """
-    pass
 
+    def __init__(self, *args: Any, lazy_subcommands: Optional[Dict[str, str]] = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
 
-@cli.command(epilog="""Examples:
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """List eagerly registered and lazy subcommand names."""
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
 
-  pogtool stats app.log --levels
-    → Count log levels in a single file
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Return the named subcommand, importing its module on demand."""
+        if cmd_name in self.lazy_subcommands:
+            module_name, attr_name = self.lazy_subcommands[cmd_name].split(":", 1)
+            return getattr(importlib.import_module(module_name), attr_name)
+        return super().get_command(ctx, cmd_name)
 
-  pogtool stats app1.log app2.log -e "timeout" -e "failed"
-    → Count specific patterns across multiple files
 
-  pogtool stats app.log --group-by minute --only ERROR --json
-    → Group errors by minute with JSON output
+# Daemon command lines follow the platform's quoting: POSIX shell rules, or
+# on Windows literal backslashes (paths like C:\logs\app.log) with quotes
+# only grouping words
+_POSIX_COMMAND_LINES = os.name != "nt"
 
-  pogtool stats app.log --follow --top 5
-    → Live monitoring with top 5 messages
-""")
-@click.argument("files", nargs=-1, type=click.Path(exists=True, readable=True))
-@click.option("-l", "--levels", is_flag=True, help="Count lines by severity level (INFO, WARN, ERROR, etc.)")
-@click.option("-e", "--regex", "patterns", multiple=True, help="Count lines matching regex patterns")
-@click.option("-g", "--group-by", type=click.Choice(["minute", "hour", "day"]), help="Group counts by time interval")
-@click.option("-O", "--only", type=str, help="Only process lines containing this severity level")
-@click.option("-t", "--top", type=int, help="Show top N most frequent log messages")
-@click.option("-j", "--json", "output_json", is_flag=True, help="Output results in JSON format")
-@click.option("-c", "--csv", "output_csv", is_flag=True, help="Output results in CSV format")
-@click.option("-f", "--follow", is_flag=True, help="Live mode: update stats as log files grow")
-@click.option("-n", "--normalize-timestamps", is_flag=True, help="Normalize timestamps to standard format")
-@click.help_option("-h", "--help")
-def stats(
-    files: tuple[str, ...],
-    levels: bool,
-    patterns: tuple[str, ...],
-    group_by: Optional[str],
-    only: Optional[str],
-    top: Optional[int],
-    output_json: bool,
-    output_csv: bool,
-    follow: bool,
-    normalize_timestamps: bool,
-) -> None:
+
+def _split_command_line(line: str) -> List[str]:
     """
-    Analyze log files and generate statistics.
+    Split a daemon input line into command arguments.
+
+    Args:
+        line: Command line read from stdin
+
+    Returns:
+        Arguments for the command group
 
-    Count log entries by severity, patterns, or time intervals. Supports live
-    monitoring and multiple output formats.
+    Raises:
+        ValueError: If the line has an unbalanced quote
     """
-    from pogtool.commands.stats import StatsCommand
-    
-    command = StatsCommand()
-    command.execute(
-        files=files,
-        levels=levels,
-        patterns=patterns,
-        group_by=group_by,
-        only=only,
-        top=top,
-        output_json=output_json,
-        output_csv=output_csv,
-        follow=follow,
-        normalize_timestamps=normalize_timestamps,
-    )
-
-
-@cli.command(epilog="""Examples:
-
-  pogtool compare old.log new.log
-    → Basic comparison
-
-  pogtool compare old.log new.log --only ERROR --color
-    → Compare only ERROR entries with colors
-
-  pogtool compare old.log new.log --ignore-timestamps --summary
-    → Ignore timestamps and show summary
-
-  pogtool compare old.log new.log --fuzzy --json
-    → Fuzzy matching with JSON output
-""")
-@click.argument("file1", type=click.Path(exists=True, readable=True))
-@click.argument("file2", type=click.Path(exists=True, readable=True))
-@click.option("-O", "--only", type=str, help="Only compare lines containing this severity level")
-@click.option("-i", "--ignore-timestamps", is_flag=True, help="Ignore timestamps when comparing")
-@click.option("-c", "--color", is_flag=True, help="Colorize diff output")
-@click.option("-s", "--summary", is_flag=True, help="Show summary of differences")
-@click.option("-j", "--json", "output_json", is_flag=True, help="Output differences in JSON format")
-@click.option("-z", "--fuzzy", is_flag=True, help="Use fuzzy matching (ignore whitespace/reordering)")
-@click.help_option("-h", "--help")
-def compare(
-    file1: str,
-    file2: str,
-    only: Optional[str],
-    ignore_timestamps: bool,
-    color: bool,
-    summary: bool,
-    output_json: bool,
-    fuzzy: bool,
-) -> None:
+    args = shlex.split(line, posix=_POSIX_COMMAND_LINES)
+    if not _POSIX_COMMAND_LINES:
+        # Non-POSIX mode keeps the quotes around quoted tokens
+        args = [arg[1:-1] if len(arg) > 1 and arg[0] == arg[-1] and arg[0] in "\"'" else arg for arg in args]
+    return args
+
+
+def _run_daemon(ctx: click.Context, param: click.Parameter, value: bool) -> None:
     """
-    Compare two log files and show differences.
+    Serve commands read from stdin, one command line per input line.
 
-    Display added, removed, or modified log entries between two files. Supports
-    filtering, colorized output, and various comparison modes.
+    Modules imported by one command stay loaded for the next, so a batch of
+    invocations pays interpreter startup and import cost only once.
     """
-    from pogtool.commands.compare import CompareCommand
+    if not value or ctx.resilient_parsing:
+        return
     
-    command = CompareCommand()
-    command.execute(
-        file1=file1,
-        file2=file2,
-        only=only,
-        ignore_timestamps=ignore_timestamps,
-        color=color,
-        summary=summary,
-        output_json=output_json,
-        fuzzy=fuzzy,
-    )
-
-
-@cli.command(epilog="""Examples:
-
-  pogtool merge app1.log app2.log
-    → Merge two logs to stdout
-
-  pogtool merge *.log --tag --output merged.log
-    → Merge with filename tags to output file
-
-  pogtool merge app1.log app2.log --normalize-timestamps --deduplicate
-    → Normalize timestamps and deduplicate
-
-  pogtool merge app1.log app2.log --follow
-    → Stream mode for live merging
-""")
-@click.argument("files", nargs=-1, type=click.Path(exists=True, readable=True))
-@click.option("-o", "--output", type=click.Path(), help="Output file (default: stdout)")
-@click.option("-t", "--tag", is_flag=True, help="Add filename as tag/column to each entry")
-@click.option("-n", "--normalize-timestamps", is_flag=True, help="Normalize timestamps to standard format")
-@click.option("-d", "--deduplicate", is_flag=True, help="Remove duplicate entries")
-@click.option("-f", "--follow", is_flag=True, help="Stream mode: continuously merge growing files")
-@click.option("-e", "--pattern", type=str, help="Only merge lines containing this pattern (used with --follow)")
-@click.option("-C", "--compressed", is_flag=True, help="Support compressed input files (.gz)")
+    group = ctx.command
+    for line in iter(sys.stdin.readline, ""):
+        try:
+            args = _split_command_line(line)
+        except ValueError as e:
+            # e.g. an unbalanced quote; skip the line, keep serving
+            print(f"Error: {e}", file=sys.stderr)
+            continue
+        if not args:
+            continue
+        try:
+            group.main(args=args, prog_name="pogtool", standalone_mode=False)
+        except click.ClickException as e:
+            e.show()
+        except (click.exceptions.Exit, click.Abort):
+            pass
+        sys.stdout.flush()
+    ctx.exit()
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "stats": "pogtool.cli_cmds.stats:stats",
+        "compare": "pogtool.cli_cmds.compare:compare",
+        "merge": "pogtool.cli_cmds.merge:merge",
+    },
+)
+@click.version_option(version=__version__, prog_name="pogtool")
+@click.option(
+    "--daemon",
+    is_flag=True,
+    is_eager=True,
+    expose_value=False,
+    callback=_run_daemon,
+    help="Read commands from stdin, one per line, in a single process.",
+)
 @click.help_option("-h", "--help")
-def merge(
-    files: tuple[str, ...],
-    output: Optional[str],
-    tag: bool,
-    normalize_timestamps: bool,
-    deduplicate: bool,
-    follow: bool,
-    pattern: Optional[str],
-    compressed: bool,
-) -> None:
-    """
-    Merge multiple log files chronologically.
-
-    Combine log files by timestamp while maintaining chronological order.
-    Supports various timestamp formats and streaming mode.
+def cli() -> None:
     """
-    from pogtool.commands.merge import MergeCommand
+    Pogtool: A comprehensive log analysis and manipulation tool.
+    
+    Analyze, compare, and merge log files with advanced filtering capabilities.
     
-    command = MergeCommand()
-    command.execute(
-        files=files,
-        output=output,
-        tag=tag,
-        normalize_timestamps=normalize_timestamps,
-        deduplicate=deduplicate,
-        follow=follow,
-        pattern=pattern,
-        compressed=compressed,
-    )
+    Use 'pogtool COMMAND --help' for detailed information about each command.
+    """
+    pass
 
 
 def main() -> None:
     """Main entry point for the CLI."""
+    # Answer a bare --version without building the Click context.
+    if sys.argv[1:] == ["--version"]:
+        print(f"pogtool, version {__version__}")
+        return
     cli()
 
 
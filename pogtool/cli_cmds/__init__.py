@@ -0,0 +1,6 @@
+"""
+Click subcommand declarations for pogtool.
+
+Each module defines one subcommand and is imported lazily by
+:class:`pogtool.cli.LazyGroup` when that subcommand is invoked.
+"""
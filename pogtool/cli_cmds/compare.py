@@ -0,0 +1,63 @@
+"""
+Click declaration of the ``pogtool compare`` subcommand.
+
+The command body is imported only when Click dispatches to this subcommand.
+"""
+
+from typing import Optional
+
+import click
+
+
+@click.command(epilog="""Examples:
+
+  pogtool compare old.log new.log
+    → Basic comparison
+
+  pogtool compare old.log new.log --only ERROR --color
+    → Compare only ERROR entries with colors
+
+  pogtool compare old.log new.log --ignore-timestamps --summary
+    → Ignore timestamps and show summary
+
+  pogtool compare old.log new.log --fuzzy --json
+    → Fuzzy matching with JSON output
+""")
+@click.argument("file1", type=click.Path(exists=True, readable=True))
+@click.argument("file2", type=click.Path(exists=True, readable=True))
+@click.option("-O", "--only", type=str, help="Only compare lines containing this severity level")
+@click.option("-i", "--ignore-timestamps", is_flag=True, help="Ignore timestamps when comparing")
+@click.option("-c", "--color", is_flag=True, help="Colorize diff output")
+@click.option("-s", "--summary", is_flag=True, help="Show summary of differences")
+@click.option("-j", "--json", "output_json", is_flag=True, help="Output differences in JSON format")
+@click.option("-z", "--fuzzy", is_flag=True, help="Use fuzzy matching (ignore whitespace/reordering)")
+@click.help_option("-h", "--help")
+def compare(
+    file1: str,
+    file2: str,
+    only: Optional[str],
+    ignore_timestamps: bool,
+    color: bool,
+    summary: bool,
+    output_json: bool,
+    fuzzy: bool,
+) -> None:
+    """
+    Compare two log files and show differences.
+
+    Display added, removed, or modified log entries between two files. Supports
+    filtering, colorized output, and various comparison modes.
+    """
+    from pogtool.commands.compare import CompareCommand
+    
+    command = CompareCommand()
+    command.execute(
+        file1=file1,
+        file2=file2,
+        only=only,
+        ignore_timestamps=ignore_timestamps,
+        color=color,
+        summary=summary,
+        output_json=output_json,
+        fuzzy=fuzzy,
+    )
@@ -0,0 +1,63 @@
+"""
+Click declaration of the ``pogtool merge`` subcommand.
+
+The command body is imported only when Click dispatches to this subcommand.
+"""
+
+from typing import Optional
+
+import click
+
+
+@click.command(epilog="""Examples:
+
+  pogtool merge app1.log app2.log
+    → Merge two logs to stdout
+
+  pogtool merge *.log --tag --output merged.log
+    → Merge with filename tags to output file
+
+  pogtool merge app1.log app2.log --normalize-timestamps --deduplicate
+    → Normalize timestamps and deduplicate
+
+  pogtool merge app1.log app2.log --follow
+    → Stream mode for live merging
+""")
+@click.argument("files", nargs=-1, type=click.Path(exists=True, readable=True))
+@click.option("-o", "--output", type=click.Path(), help="Output file (default: stdout)")
+@click.option("-t", "--tag", is_flag=True, help="Add filename as tag/column to each entry")
+@click.option("-n", "--normalize-timestamps", is_flag=True, help="Normalize timestamps to standard format")
+@click.option("-d", "--deduplicate", is_flag=True, help="Remove duplicate entries")
+@click.option("-f", "--follow", is_flag=True, help="Stream mode: continuously merge growing files")
+@click.option("-e", "--pattern", type=str, help="Only merge lines containing this pattern (used with --follow)")
+@click.option("-C", "--compressed", is_flag=True, help="Support compressed input files (.gz)")
+@click.help_option("-h", "--help")
+def merge(
+    files: tuple[str, ...],
+    output: Optional[str],
+    tag: bool,
+    normalize_timestamps: bool,
+    deduplicate: bool,
+    follow: bool,
+    pattern: Optional[str],
+    compressed: bool,
+) -> None:
+    """
+    Merge multiple log files chronologically.
+
+    Combine log files by timestamp while maintaining chronological order.
+    Supports various timestamp formats and streaming mode.
+    """
+    from pogtool.commands.merge import MergeCommand
+    
+    command = MergeCommand()
+    command.execute(
+        files=files,
+        output=output,
+        tag=tag,
+        normalize_timestamps=normalize_timestamps,
+        deduplicate=deduplicate,
+        follow=follow,
+        pattern=pattern,
+        compressed=compressed,
+    )
@@ -0,0 +1,72 @@
+"""
+Click declaration of the ``pogtool stats`` subcommand.
+
+The command body is imported only when Click dispatches to this subcommand.
+"""
+
+from typing import Optional
+
+import click
+
+
+@click.command(epilog="""Examples:
+
+  pogtool stats app.log --levels
+    → Count log levels in a single file
+
+  pogtool stats app1.log app2.log -e "timeout" -e "failed"
+    → Count specific patterns across multiple files
+
+  pogtool stats app.log --group-by minute --only ERROR --json
+    → Group errors by minute with JSON output
+
+  pogtool stats app.log --follow --top 5
+    → Live monitoring with top 5 messages
+""")
+@click.argument("files", nargs=-1, type=click.Path(exists=True, readable=True))
+@click.option("-l", "--levels", is_flag=True, help="Count lines by severity level (INFO, WARN, ERROR, etc.)")
+@click.option("-e", "--regex", "patterns", multiple=True, help="Count lines matching regex patterns")
+@click.option("-g", "--group-by", type=click.Choice(["minute", "hour", "day"]), help="Group counts by time interval")
+@click.option("-O", "--only", type=str, help="Only process lines containing this severity level")
+@click.option("-t", "--top", type=int, help="Show top N most frequent log messages")
+@click.option("--approx-top", is_flag=True, help="Count top messages approximately, in bounded memory (for huge logs)")
+@click.option("-j", "--json", "output_json", is_flag=True, help="Output results in JSON format")
+@click.option("-c", "--csv", "output_csv", is_flag=True, help="Output results in CSV format")
+@click.option("-f", "--follow", is_flag=True, help="Live mode: update stats as log files grow")
+@click.option("-n", "--normalize-timestamps", is_flag=True, help="Normalize timestamps to standard format")
+@click.help_option("-h", "--help")
+def stats(
+    files: tuple[str, ...],
+    levels: bool,
+    patterns: tuple[str, ...],
+    group_by: Optional[str],
+    only: Optional[str],
+    top: Optional[int],
+    output_json: bool,
+    output_csv: bool,
+    follow: bool,
+    normalize_timestamps: bool,
+    approx_top: bool,
+) -> None:
+    """
+    Analyze log files and generate statistics.
+
+    Count log entries by severity, patterns, or time intervals. Supports live
+    monitoring and multiple output formats.
+    """
+    from pogtool.commands.stats import StatsCommand
+    
+    command = StatsCommand()
+    command.execute(
+        files=files,
+        levels=levels,
+        patterns=patterns,
+        group_by=group_by,
+        only=only,
+        top=top,
+        output_json=output_json,
+        output_csv=output_csv,
+        follow=follow,
+        normalize_timestamps=normalize_timestamps,
+        approx_top=approx_top,
+    )
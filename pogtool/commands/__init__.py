@@ -5,12 +5,28 @@ This module contains the concrete implementations of all commands
 that integrate the various components to provide the CLI functionality.
 """
 
-from pogtool.commands.stats import StatsCommand
-from pogtool.commands.compare import CompareCommand
-from pogtool.commands.merge import MergeCommand
+import importlib
+from typing import Any
+
+# Command classes are imported on first access so that ``pogtool --help``
+# does not pull in every formatter, parser and reader.
+_LAZY = {
+    "StatsCommand": "pogtool.commands.stats",
+    "CompareCommand": "pogtool.commands.compare",
+    "MergeCommand": "pogtool.commands.merge",
+}
 
 __all__ = [
     "StatsCommand",
     "CompareCommand",
     "MergeCommand",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import command classes lazily on attribute access."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return getattr(importlib.import_module(module_name), name)
@@ -5,14 +5,17 @@ This module implements the comparison command that compares two log files
 and shows differences, additions, and removals with various output options.
 """
 
+import sys
 from typing import Optional
 
+from pogtool.commands.defaults import (
+    DEFAULT_FILE_READER,
+    DEFAULT_LOG_FORMATTER,
+    DEFAULT_LOG_PARSER,
+    DEFAULT_LOG_PROCESSOR,
+)
 from pogtool.core.interfaces import Command
 from pogtool.formatters.text import TextFormatter
-from pogtool.formatters.json import JsonFormatter
-from pogtool.parsers.generic import GenericLogParser
-from pogtool.processors import StandardLogProcessor
-from pogtool.readers import MultiFileReader
 
 
 class CompareCommand(Command):
@@ -25,16 +28,11 @@ class CompareCommand(Command):
     
     def __init__(self) -> None:
         """Initialize the compare command with default dependencies."""
-        file_reader = MultiFileReader()
-        log_parser = GenericLogParser()
-        log_processor = StandardLogProcessor()
-        log_formatter = TextFormatter()
-        
         super().__init__(
-            file_reader=file_reader,
-            log_parser=log_parser,
-            log_formatter=log_formatter,
-            log_processor=log_processor,
+            file_reader=DEFAULT_FILE_READER,
+            log_parser=DEFAULT_LOG_PARSER,
+            log_formatter=DEFAULT_LOG_FORMATTER,
+            log_processor=DEFAULT_LOG_PROCESSOR,
         )
     
     def execute(
@@ -62,28 +60,11 @@ class CompareCommand(Command):
             fuzzy: Use fuzzy matching (ignore whitespace differences)
         """
         try:
-            # Parse both files into log entries
-            entries1 = list(self._parse_files([file1], follow=False))
-            entries2 = list(self._parse_files([file2], follow=False))
-            
-            if not entries1 and not entries2:
-                print("No log entries found in either file")
-                return
-            
-            # Apply filtering if specified
-            if only:
-                entries1 = list(
-                    self._log_processor.filter_entries(
-                        iter(entries1), 
-                        level=only
-                    )
-                )
-                entries2 = list(
-                    self._log_processor.filter_entries(
-                        iter(entries2), 
-                        level=only
-                    )
-                )
+            # Parse both files lazily (in worker processes when they are
+            # large); the level filter is applied while reading so lines that
+            # cannot match are never parsed
+            entries1 = self._parse_files_parallel([file1], only=only)
+            entries2 = self._parse_files_parallel([file2], only=only)
             
             # Prepare comparison options
             comparison_options = {
@@ -91,6 +72,19 @@ class CompareCommand(Command):
                 'fuzzy': fuzzy,
             }
             
+            # A summary only needs counts, so skip building the line lists
+            if summary:
+                added, removed, modified, common = self._log_processor.compare_counts(
+                    entries1,
+                    entries2,
+                    **comparison_options
+                )
+                if not (added or removed or common) and self._inputs_empty(file1, file2, only):
+                    print("No log entries found in either file")
+                    return
+                self._show_summary(added, removed, modified, common)
+                return
+            
             # Perform comparison
             result = self._log_processor.compare_entries(
                 entries1, 
@@ -98,21 +92,45 @@ class CompareCommand(Command):
                 **comparison_options
             )
             
+            if not (result.added_lines or result.removed_lines or result.common_lines) and self._inputs_empty(file1, file2, only):
+                print("No log entries found in either file")
+                return
+            
             # Choose appropriate formatter
             formatter = self._get_formatter(output_json, color)
-            
-            # Show summary or full results
-            if summary:
-                self._show_summary(result)
-            else:
-                output = formatter.format_comparison(result)
-                print(output)
+            output = formatter.format_comparison(result)
+            print(output)
                 
-        except FileNotFoundError as e:
-            print(f"Error: {e}")
-        except Exception as e:
+        except (OSError, ValueError) as e:
+            # I/O (including missing files) and decoding problems are
+            # reported; anything else is a bug and should surface with its
+            # traceback
             print(f"Error: {e}")
     
+    def _inputs_empty(self, file1: str, file2: str, only: Optional[str]) -> bool:
+        """
+        Check whether a comparison without any lines had no entries to compare.
+        
+        With a level filter, an empty comparison may just mean that nothing
+        matched; that is reported as an (empty) comparison, and only inputs
+        without any entries at all count as empty.
+        
+        Args:
+            file1: Path to first file
+            file2: Path to second file
+            only: Level filter of the comparison, if any
+            
+        Returns:
+            True if neither file has a non-blank line
+        """
+        if not only:
+            return True
+        for file_path in (file1, file2):
+            for line in self._file_reader.read_lines(file_path):
+                if line and not line.isspace():
+                    return False
+        return True
+    
     def _get_formatter(self, output_json: bool, color: bool) -> object:
         """
         Get the appropriate formatter based on output options.
@@ -125,27 +143,33 @@ class CompareCommand(Command):
             Appropriate formatter instance
         """
         if output_json:
+            from pogtool.formatters.json import JsonFormatter
             return JsonFormatter()
         else:
             return TextFormatter(use_colors=color)
     
-    def _show_summary(self, result) -> None:
+    def _show_summary(self, added: int, removed: int, modified: int, common: int) -> None:
         """
         Show a brief summary of comparison results.
         
         Args:
-            result: Comparison result to summarize
+            added: Number of added lines
+            removed: Number of removed lines
+            modified: Number of modified lines
+            common: Number of common lines
         """
-        print("Comparison Summary:")
-        print("=" * 30)
-        print(f"Added lines:     {len(result.added_lines):>6}")
-        print(f"Removed lines:   {len(result.removed_lines):>6}")
-        print(f"Modified lines:  {len(result.modified_lines):>6}")
-        print(f"Common lines:    {len(result.common_lines):>6}")
-        print("-" * 30)
-        print(f"Total differences: {result.total_differences:>4}")
+        total_differences = added + removed + modified
         
-        if result.has_differences:
-            print("\nFiles are different")
-        else:
-            print("\nFiles are identical")
\ No newline at end of file
+        lines = [
+            "Comparison Summary:",
+            "=" * 30,
+            f"Added lines:     {added:>6}",
+            f"Removed lines:   {removed:>6}",
+            f"Modified lines:  {modified:>6}",
+            f"Common lines:    {common:>6}",
+            "-" * 30,
+            f"Total differences: {total_differences:>4}",
+            "",
+            "Files are different" if total_differences > 0 else "Files are identical",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
\ No newline at end of file
@@ -0,0 +1,17 @@
+"""
+Shared default dependencies for the built-in commands.
+
+The default reader, parser, processor and formatter keep no per-run state,
+so a single instance of each is created on first import and reused by every
+command in the process (for example across commands served by --daemon).
+"""
+
+from pogtool.formatters.text import TextFormatter
+from pogtool.parsers.generic import GenericLogParser
+from pogtool.processors import StandardLogProcessor
+from pogtool.readers import MultiFileReader
+
+DEFAULT_FILE_READER = MultiFileReader()
+DEFAULT_LOG_PARSER = GenericLogParser()
+DEFAULT_LOG_PROCESSOR = StandardLogProcessor()
+DEFAULT_LOG_FORMATTER = TextFormatter()
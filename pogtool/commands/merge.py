@@ -5,14 +5,33 @@ This module implements the merge command that combines multiple log files
 chronologically while maintaining proper ordering and supporting various options.
 """
 
-from typing import Optional
+import heapq
+import sys
+from contextlib import ExitStack
+from typing import Callable, Iterable, Iterator, List, Optional, Set
 
+from pogtool.commands.defaults import (
+    DEFAULT_FILE_READER,
+    DEFAULT_LOG_FORMATTER,
+    DEFAULT_LOG_PARSER,
+    DEFAULT_LOG_PROCESSOR,
+)
 from pogtool.core.interfaces import Command
-from pogtool.formatters.text import TextFormatter
-from pogtool.parsers.generic import GenericLogParser
-from pogtool.parsers.common import CommonLogParser
-from pogtool.processors import StandardLogProcessor
-from pogtool.readers import MultiFileReader
+from pogtool.core.models import LogEntry, LogLevel
+from pogtool.parallel import create_parse_executor, parse_lines_in_pool
+from pogtool.processors import chronological_key, dedup_key
+from pogtool.readers import FileTailer
+from pogtool.watchers import create_watcher
+
+# Merged output is written in blocks of this many lines through a large buffer
+_WRITE_BATCH_LINES = 4096
+_OUTPUT_BUFFER_SIZE = 1 << 20
+
+# "[LEVEL]" tags for normalized output, built once instead of per entry
+_LEVEL_TAGS = {level: f"[{level.name}]" for level in LogLevel}
+
+# Batches parsed ahead of the merge for each file when using worker processes
+_PARSE_BATCHES_IN_FLIGHT = 2
 
 
 class MergeCommand(Command):
@@ -25,16 +44,11 @@ class MergeCommand(Command):
     
     def __init__(self) -> None:
         """Initialize the merge command with default dependencies."""
-        file_reader = MultiFileReader()
-        log_parser = GenericLogParser()
-        log_processor = StandardLogProcessor()
-        log_formatter = TextFormatter()
-        
         super().__init__(
-            file_reader=file_reader,
-            log_parser=log_parser,
-            log_formatter=log_formatter,
-            log_processor=log_processor,
+            file_reader=DEFAULT_FILE_READER,
+            log_parser=DEFAULT_LOG_PARSER,
+            log_formatter=DEFAULT_LOG_FORMATTER,
+            log_processor=DEFAULT_LOG_PROCESSOR,
         )
     
     def execute(
@@ -104,35 +118,47 @@ class MergeCommand(Command):
             normalize_timestamps: Whether to normalize timestamps
             deduplicate: Whether to remove duplicates
         """
-        # Parse all files into separate iterators
-        entry_iterators = []
-        
-        for file_path in files:
-            entries = list(self._parse_files([file_path], follow=False))
-            entry_iterators.append(iter(entries))
-        
-        # Merge entries chronologically
-        merge_options = {
-            'tag_source': tag,
-            'deduplicate': deduplicate,
-        }
-        
-        merged_entries = self._log_processor.merge_entries(
-            entry_iterators, 
-            **merge_options
-        )
-        
-        # Output merged entries
-        if output:
-            with open(output, 'w', encoding='utf-8') as f:
-                for entry in merged_entries:
-                    formatted_line = self._format_entry(entry, normalize_timestamps)
-                    f.write(formatted_line + '\n')
-            print(f"Merged {len(files)} files into {output}")
-        else:
-            for entry in merged_entries:
-                formatted_line = self._format_entry(entry, normalize_timestamps)
-                print(formatted_line)
+        with ExitStack() as stack:
+            executor = create_parse_executor(files, max_workers=len(files))
+            
+            if executor is not None:
+                # Parse batches of lines in worker processes, a few batches
+                # ahead of the merge for each file
+                stack.enter_context(executor)
+                entry_iterators = [
+                    parse_lines_in_pool(
+                        self._file_reader.read_lines(file_path),
+                        self._log_parser,
+                        file_path,
+                        executor,
+                        _PARSE_BATCHES_IN_FLIGHT,
+                    )
+                    for file_path in files
+                ]
+            else:
+                # Parse each file lazily; the merge only holds one pending entry per file
+                entry_iterators = [self._parse_files([file_path], follow=False) for file_path in files]
+            
+            # Merge entries chronologically
+            merge_options = {
+                'tag_source': tag,
+                'deduplicate': deduplicate,
+            }
+            
+            merged_entries = self._log_processor.merge_entries(
+                entry_iterators, 
+                **merge_options
+            )
+            
+            # Output merged entries in large batches rather than line by line
+            format_entry = self._entry_formatter(normalize_timestamps, tag=False)
+            chunks = self._format_chunks(merged_entries, format_entry)
+            if output:
+                with open(output, 'w', encoding='utf-8', buffering=_OUTPUT_BUFFER_SIZE) as f:
+                    f.writelines(chunks)
+                print(f"Merged {len(files)} files into {output}")
+            else:
+                sys.stdout.writelines(chunks)
     
     def _merge_follow_mode(
         self,
@@ -156,109 +182,186 @@ class MergeCommand(Command):
             deduplicate: Whether to remove duplicates
             pattern: Only merge lines containing this pattern
         """
-        import time
-        from collections import deque
-        
         print(f"Following {len(files)} files for new entries (Ctrl+C to stop)...")
         
-        # Initialize file positions to current end of files (skip existing content)
-        file_positions = {}
+        # Start each file at its current end (skip existing content)
+        tailed_files = []
         for file_path in files:
+            tailed = FileTailer(file_path)
             try:
-                # Get current entry count to skip existing content
-                existing_entries = list(self._parse_files([file_path], follow=False))
-                file_positions[file_path] = len(existing_entries)
-                print(f"Skipping {len(existing_entries)} existing entries in {file_path}")
-            except Exception as e:
+                tailed.open(at_end=True)
+                print(f"Skipping existing content in {file_path}")
+            except OSError as e:
                 print(f"Warning: Error reading {file_path}: {e}")
-                file_positions[file_path] = 0
+            tailed_files.append(tailed)
         
-        seen_entries = set() if deduplicate else None
+        # Digests of the messages seen so far; unlike the messages themselves
+        # these stay small however long the session runs
+        seen_entries: Optional[Set[bytes]] = set() if deduplicate else None
         
         # Open output file if specified
         output_file = None
         if output:
             output_file = open(output, 'w', encoding='utf-8')
         
+        # Wake up as soon as a followed file is written to where the platform
+        # allows it; the timeout doubles as a periodic re-check of every file
+        watcher = create_watcher(files)
+        changed_paths = set(files)
+        format_entry = self._entry_formatter(False, tag)
+        
         try:
             while True:
                 new_entries = []
                 
-                # Check each file for new content
-                for file_path in files:
+                # Check each changed file for new content
+                for tailed in tailed_files:
+                    file_path = tailed.path
+                    if file_path not in changed_paths:
+                        continue
+                    file_entries: List[LogEntry] = []
                     try:
-                        entries = list(self._parse_files([file_path], follow=False))
-                        
-                        # Get only new entries since last check
-                        current_count = len(entries)
-                        last_position = file_positions.get(file_path, 0)
-                        
-                        if current_count > last_position:
-                            new_file_entries = entries[last_position:]
-                            
-                            for entry in new_file_entries:
-                                # Filter by pattern if specified
-                                if pattern and pattern not in entry.raw_line:
-                                    continue
-                                
-                                # Tag with source if requested
-                                if tag:
-                                    from dataclasses import replace
-                                    entry = replace(entry, message=f"[{file_path}] {entry.message}")
-                                
-                                # Check for duplicates
-                                if deduplicate and seen_entries is not None:
-                                    entry_key = entry.normalized_message
-                                    if entry_key in seen_entries:
-                                        continue
-                                    seen_entries.add(entry_key)
-                                
-                                new_entries.append(entry)
-                            
-                            file_positions[file_path] = current_count
-                    
+                        file_entries = self._process_new_lines(
+                            tailed.read_new_lines(), file_path, pattern, seen_entries
+                        )
                     except Exception as e:
                         print(f"Warning: Error reading {file_path}: {e}")
+                    
+                    if file_entries:
+                        new_entries.append(file_entries)
                 
-                # Sort new entries by timestamp and output
+                # Merge each file's (already chronological) new entries by
+                # timestamp; entries without timestamps go to the end
                 if new_entries:
-                    # Sort by timestamp (entries without timestamps go to end)
-                    new_entries.sort(
-                        key=lambda e: e.timestamp.timestamp() if e.timestamp else float('inf')
-                    )
-                    
-                    for entry in new_entries:
-                        formatted_line = self._format_entry(entry, False)
-                        
-                        if output_file:
-                            output_file.write(formatted_line + '\n')
-                            output_file.flush()
-                        else:
-                            print(formatted_line)
+                    merged = heapq.merge(*new_entries, key=chronological_key)
+                    stream = output_file or sys.stdout
+                    stream.writelines(self._format_chunks(merged, format_entry))
+                    stream.flush()
                 
-                time.sleep(0.5)  # Check every 500ms
+                changed_paths = watcher.wait(0.5) or set(files)
                 
         finally:
+            watcher.close()
+            for tailed in tailed_files:
+                tailed.close()
             if output_file:
                 output_file.close()
     
-    def _format_entry(self, entry, normalize_timestamps: bool) -> str:
+    def _process_new_lines(
+        self,
+        lines: List[str],
+        file_path: str,
+        pattern: Optional[str],
+        seen_entries: Optional[Set[bytes]],
+    ) -> List[LogEntry]:
+        """
+        Filter, parse and deduplicate one file's new lines in follow mode.
+        
+        Each step runs over the whole batch with locally bound callables,
+        keeping attribute lookups and flag checks out of the per-line work.
+        
+        Args:
+            lines: Lines appended to the file since the last check
+            file_path: Path of the file the lines came from
+            pattern: Only keep lines containing this pattern
+            seen_entries: Message digests seen so far, or None to keep duplicates
+            
+        Returns:
+            New entries from this file, in file order
+        """
+        # Filter by pattern if specified (a plain substring test is already
+        # a fast C search, quicker than a compiled regex)
+        if pattern:
+            lines = [line for line in lines if pattern in line]
+        
+        parse_line = self._log_parser.parse_line
+        entries = [parse_line(line, source_file=file_path) for line in lines if line and not line.isspace()]
+        
+        if seen_entries is None:
+            return entries
+        
+        # Drop duplicates (the source tag, if any, is only added when the
+        # entry is formatted, so it does not affect the key)
+        unique_entries = []
+        for entry in entries:
+            entry_key = dedup_key(entry)
+            if entry_key not in seen_entries:
+                seen_entries.add(entry_key)
+                unique_entries.append(entry)
+        return unique_entries
+    
+    def _entry_formatter(self, normalize_timestamps: bool, tag: bool) -> Callable[[LogEntry], str]:
+        """
+        Pick the per-entry formatting function once for a whole merge.
+        
+        Args:
+            normalize_timestamps: Whether to normalize timestamp format
+            tag: Whether to prefix each line with the entry's source file
+            
+        Returns:
+            Function formatting a single entry
+        """
+        format_entry = self._format_entry
+        
+        if tag:
+            return lambda entry: format_entry(entry, normalize_timestamps, entry.source_file)
+        if normalize_timestamps:
+            return lambda entry: format_entry(entry, True)
+        
+        def format_plain(entry: LogEntry) -> str:
+            # Same as _format_entry without normalization or tagging
+            message = entry.message
+            return message if message != entry.raw_line.strip() else entry.raw_line
+        
+        return format_plain
+    
+    def _format_chunks(self, entries: Iterable[LogEntry], format_entry: Callable[[LogEntry], str]) -> Iterator[str]:
+        """
+        Format entries into newline-terminated chunks of many lines each.
+        
+        Args:
+            entries: LogEntries to format
+            format_entry: Function formatting a single entry
+            
+        Yields:
+            Blocks of formatted lines, each ending with a newline
+        """
+        batch: List[str] = []
+        append = batch.append
+        for entry in entries:
+            append(format_entry(entry))
+            if len(batch) == _WRITE_BATCH_LINES:
+                batch.append('')
+                yield '\n'.join(batch)
+                batch.clear()
+        
+        if batch:
+            batch.append('')
+            yield '\n'.join(batch)
+    
+    def _format_entry(self, entry, normalize_timestamps: bool, source: Optional[str] = None) -> str:
         """
         Format a log entry for output.
         
         Args:
             entry: LogEntry to format
             normalize_timestamps: Whether to normalize timestamp format
+            source: Source tag to prefix to the message, if any
             
         Returns:
             Formatted string
         """
-        if normalize_timestamps and entry.timestamp:
+        message = f"[{source}] {entry.message}" if source else entry.message
+        
+        timestamp = entry.timestamp
+        if normalize_timestamps and timestamp:
             # Use normalized timestamp format
-            timestamp_str = entry.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-            level_str = f"[{entry.level.name}]" if entry.level else ""
-            parts = [timestamp_str, level_str, entry.message or entry.raw_line]
-            return " ".join(filter(None, parts))
+            level = entry.level
+            if level:
+                return f"{timestamp:%Y-%m-%d %H:%M:%S} {_LEVEL_TAGS[level]} {message or entry.raw_line}"
+            return f"{timestamp:%Y-%m-%d %H:%M:%S} {message or entry.raw_line}"
+        elif source:
+            return message
         else:
             # Use message if it was modified (e.g., for tagging), otherwise use raw line
             return entry.message if entry.message != entry.raw_line.strip() else entry.raw_line
\ No newline at end of file
@@ -5,17 +5,26 @@ This module implements the statistics command that analyzes log files
 and generates comprehensive statistics including counts, patterns, and trends.
 """
 
-from typing import Optional
+import os
+from functools import partial
+from itertools import count
+from typing import Any, Dict, List, Optional
 
-from pogtool.core.interfaces import Command
+from pogtool.commands.defaults import (
+    DEFAULT_FILE_READER,
+    DEFAULT_LOG_FORMATTER,
+    DEFAULT_LOG_PARSER,
+    DEFAULT_LOG_PROCESSOR,
+)
+from pogtool.core.interfaces import Command, StatsAccumulator
 from pogtool.core.models import TimeInterval
 from pogtool.formatters.text import TextFormatter
-from pogtool.formatters.json import JsonFormatter
-from pogtool.formatters.csv import CsvFormatter
-from pogtool.parsers.generic import GenericLogParser
-from pogtool.parsers.common import CommonLogParser
-from pogtool.processors import StandardLogProcessor
-from pogtool.readers import MultiFileReader
+from pogtool.parallel import create_parse_executor, stats_lines_in_pool
+from pogtool.readers import FileTailer
+from pogtool.watchers import create_watcher
+
+# Minimum number of seconds between redraws of the statistics in follow mode
+_REFRESH_INTERVAL = 1.0
 
 
 class StatsCommand(Command):
@@ -28,16 +37,11 @@ class StatsCommand(Command):
     
     def __init__(self) -> None:
         """Initialize the stats command with default dependencies."""
-        file_reader = MultiFileReader()
-        log_parser = GenericLogParser()
-        log_processor = StandardLogProcessor()
-        log_formatter = TextFormatter()
-        
         super().__init__(
-            file_reader=file_reader,
-            log_parser=log_parser,
-            log_formatter=log_formatter,
-            log_processor=log_processor,
+            file_reader=DEFAULT_FILE_READER,
+            log_parser=DEFAULT_LOG_PARSER,
+            log_formatter=DEFAULT_LOG_FORMATTER,
+            log_processor=DEFAULT_LOG_PROCESSOR,
         )
     
     def execute(
@@ -52,6 +56,7 @@ class StatsCommand(Command):
         output_csv: bool,
         follow: bool,
         normalize_timestamps: bool,
+        approx_top: bool = False,
     ) -> None:
         """
         Execute the stats command with given arguments.
@@ -67,28 +72,13 @@ class StatsCommand(Command):
             output_csv: Output in CSV format
             follow: Follow files for new content (live mode)
             normalize_timestamps: Normalize timestamps to standard format
+            approx_top: Count top messages approximately in bounded memory
         """
         if not files:
             print("Error: No input files specified")
             return
         
         try:
-            # Parse all files into log entries
-            entries = list(self._parse_files(list(files), follow=follow))
-            
-            if not entries:
-                print("No log entries found in the specified files")
-                return
-            
-            # Apply filtering if specified
-            if only:
-                entries = list(
-                    self._log_processor.filter_entries(
-                        iter(entries), 
-                        level=only
-                    )
-                )
-            
             # Prepare analysis options
             analysis_options = {}
             
@@ -98,11 +88,20 @@ class StatsCommand(Command):
             if top:
                 analysis_options['top_n'] = top
             
+            if approx_top:
+                analysis_options['approx_top'] = True
+            
             if patterns:
                 analysis_options['patterns'] = list(patterns)
             
-            # Compute statistics
-            stats = self._log_processor.compute_stats(iter(entries), **analysis_options)
+            # Compute statistics of the current contents of all files, keeping
+            # the running counters for follow mode (which picks up appended
+            # lines afterwards)
+            accumulator = self._log_processor.create_stats_accumulator(**analysis_options)
+            if not self._accumulate_files(list(files), accumulator, analysis_options, only):
+                print("No log entries found in the specified files")
+                return
+            stats = accumulator.summary()
             
             # Choose appropriate formatter
             formatter = self._get_formatter(output_json, output_csv)
@@ -132,7 +131,7 @@ class StatsCommand(Command):
             # In follow mode, keep monitoring and updating stats
             if follow:
                 print("\n--- Following files for new entries (Ctrl+C to stop) ---")
-                self._follow_mode(list(files), analysis_options, formatter)
+                self._follow_mode(list(files), accumulator, formatter, only)
                 
         except FileNotFoundError as e:
             print(f"Error: {e}")
@@ -141,6 +140,53 @@ class StatsCommand(Command):
         except Exception as e:
             print(f"Error: {e}")
     
+    def _accumulate_files(self, files: List[str], accumulator: StatsAccumulator, analysis_options: Dict[str, Any], only: Optional[str]) -> int:
+        """
+        Add the entries of all files to the running statistics.
+        
+        Large inputs are split into batches whose statistics are computed in
+        worker processes; only the counters come back and are merged in
+        order, so the result is the same as counting in-process.
+        
+        Args:
+            files: List of file paths to analyze
+            accumulator: Statistics to add the entries to
+            analysis_options: Options the accumulator was created with
+            only: Optional log level filter
+            
+        Returns:
+            Number of entries parsed, before level filtering
+        """
+        workers = os.cpu_count() or 1
+        executor = create_parse_executor(files, max_workers=workers)
+        if executor is None:
+            entries = self._parse_files(files, follow=False)
+            if not only:
+                return accumulator.add(entries)
+            # Count entries as they stream past, ahead of the level filter;
+            # zip advances the counter once per entry parsed
+            parsed = count()
+            entries = (entry for entry, _ in zip(entries, parsed))
+            accumulator.add(self._log_processor.filter_entries(entries, level=only))
+            return next(parsed)
+        
+        new_accumulator = partial(self._log_processor.create_stats_accumulator, **analysis_options)
+        parsed = 0
+        with executor:
+            for file_path in files:
+                for batch_parsed, batch_stats in stats_lines_in_pool(
+                    self._file_reader.read_lines(file_path),
+                    self._log_parser,
+                    file_path,
+                    executor,
+                    workers,
+                    new_accumulator,
+                    only=only,
+                ):
+                    parsed += batch_parsed
+                    accumulator.merge(batch_stats)
+        return parsed
+    
     def _get_formatter(self, output_json: bool, output_csv: bool) -> object:
         """
         Get the appropriate formatter based on output options.
@@ -153,43 +199,82 @@ class StatsCommand(Command):
             Appropriate formatter instance
         """
         if output_json:
+            from pogtool.formatters.json import JsonFormatter
             return JsonFormatter()
         elif output_csv:
+            from pogtool.formatters.csv import CsvFormatter
             return CsvFormatter()
         else:
             return TextFormatter(use_colors=True)
     
-    def _follow_mode(self, files: list[str], analysis_options: dict, formatter: object) -> None:
+    def _follow_mode(self, files: list[str], accumulator: StatsAccumulator, formatter: object, only: Optional[str]) -> None:
         """
         Run in follow mode, continuously updating statistics.
         
+        Only lines appended since the last check are parsed and added to the
+        running statistics; the output is refreshed only when some were. All
+        files share one watcher (a single inotify descriptor on Linux), so new
+        lines are picked up as soon as they are written, while the display is
+        still redrawn at most once per refresh interval.
+        
         Args:
             files: List of files to follow
-            analysis_options: Analysis configuration
+            accumulator: Statistics of the content read so far
             formatter: Output formatter to use
+            only: Optional log level filter
         """
         import time
         
+        tailers = []
+        for file_path in files:
+            tailer = FileTailer(file_path)
+            tailer.open(at_end=True)
+            tailers.append(tailer)
+        
+        parse_line = self._log_parser.parse_line
+        
+        watcher = create_watcher(files)
+        changed_paths = set(files)
+        pending = False
+        last_refresh = 0.0
+        
         try:
-            last_stats = None
-            
             while True:
-                # Re-parse files to get latest content
-                entries = list(self._parse_files(files, follow=False))
-                
-                if entries:
-                    # Compute fresh statistics
-                    stats = self._log_processor.compute_stats(iter(entries), **analysis_options)
+                for tailer in tailers:
+                    if tailer.path not in changed_paths:
+                        continue
+                    try:
+                        lines = tailer.read_new_lines()
+                    except OSError as e:
+                        print(f"Warning: Error reading {tailer.path}: {e}")
+                        continue
+                    
+                    new_entries = (parse_line(line, source_file=tailer.path) for line in lines if line and not line.isspace())
+                    if only:
+                        new_entries = self._log_processor.filter_entries(new_entries, level=only)
                     
-                    # Only update if stats have changed
-                    if last_stats is None or stats.to_dict() != last_stats.to_dict():
-                        # Clear screen and show updated stats
-                        print("\033[2J\033[H")  # ANSI escape codes to clear screen
-                        print(f"Last updated: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-                        print(formatter.format_stats(stats))
-                        last_stats = stats
+                    if accumulator.add(new_entries):
+                        pending = True
+                
+                # Only update if stats have changed, and not more than once
+                # per refresh interval
+                now = time.monotonic()
+                if pending and now - last_refresh >= _REFRESH_INTERVAL:
+                    # Clear screen and show updated stats
+                    print("\033[2J\033[H")  # ANSI escape codes to clear screen
+                    print(f"Last updated: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+                    print(formatter.format_stats(accumulator.summary()))
+                    pending = False
+                    last_refresh = now
                 
-                time.sleep(1)  # Update every second
+                # Wait for a followed file to change; a timeout re-checks every
+                # file, and with a refresh held back, ends when it is due
+                timeout = _REFRESH_INTERVAL - (now - last_refresh) if pending else _REFRESH_INTERVAL
+                changed_paths = watcher.wait(timeout) or set(files)
                 
         except KeyboardInterrupt:
-            pass
\ No newline at end of file
+            pass
+        finally:
+            watcher.close()
+            for tailer in tailers:
+                tailer.close()
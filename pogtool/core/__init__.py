@@ -12,6 +12,7 @@ from pogtool.core.interfaces import (
     LogFormatter,
     LogProcessor,
     FileReader,
+    StatsAccumulator,
 )
 
 __all__ = [
@@ -23,4 +24,5 @@ __all__ = [
     "LogFormatter",
     "LogProcessor",
     "FileReader",
+    "StatsAccumulator",
 ]
\ No newline at end of file
@@ -5,10 +5,13 @@ This module defines the contracts and abstractions that enable
 dependency inversion and testability throughout the application.
 """
 
+import os
+import sys
 from abc import ABC, abstractmethod
-from typing import Iterator, List, Dict, Any, Optional, TextIO
+from typing import Callable, Iterable, Iterator, List, Dict, Any, Optional, TextIO, Tuple
 
 from pogtool.core.models import LogEntry, StatsSummary, ComparisonResult
+from pogtool.parallel import create_parse_executor, parse_lines_in_pool
 
 
 class FileReader(ABC):
@@ -64,6 +67,22 @@ class LogParser(ABC):
             True if this parser can handle the format
         """
         pass
+    
+    def level_prefilter(self, level_filter: str) -> Optional[Callable[[str], bool]]:
+        """
+        Build a cheap raw-line check that lines must pass to match a level.
+        
+        Parsers whose levels come from words in the line can reject lines
+        without those words before parsing them. Parsers that derive levels
+        otherwise (e.g. from HTTP status codes) keep this default.
+        
+        Args:
+            level_filter: Log level name to filter on
+            
+        Returns:
+            Picklable check over raw lines, or None if every line must be parsed
+        """
+        return None
 
 
 class LogFormatter(ABC):
@@ -85,16 +104,103 @@ class LogFormatter(ABC):
         pass
 
 
+class StatsAccumulator(ABC):
+    """Abstract interface for statistics that are built up incrementally."""
+    
+    @abstractmethod
+    def add(self, entries: Iterable[LogEntry]) -> int:
+        """
+        Add log entries to the running statistics.
+        
+        Args:
+            entries: Log entries to add
+            
+        Returns:
+            Number of entries added
+        """
+        pass
+    
+    @abstractmethod
+    def summary(self) -> StatsSummary:
+        """
+        Build a summary of everything added so far.
+        
+        Returns:
+            Statistics summary
+        """
+        pass
+    
+    @abstractmethod
+    def merge(self, other: "StatsAccumulator") -> None:
+        """
+        Add the statistics of another accumulator built with the same options.
+        
+        Args:
+            other: Statistics of further entries, e.g. computed in a worker
+        """
+        pass
+
+
+class _CollectingStatsAccumulator(StatsAccumulator):
+    """Statistics accumulator that recomputes a processor's stats over all entries added."""
+    
+    def __init__(self, compute_stats: Callable[..., StatsSummary], options: Dict[str, Any]) -> None:
+        """
+        Initialize empty statistics.
+        
+        Args:
+            compute_stats: Processor's ``compute_stats``
+            options: Analysis options passed to ``compute_stats``
+        """
+        self._compute_stats = compute_stats
+        self._options = options
+        self._entries: List[LogEntry] = []
+    
+    def add(self, entries: Iterable[LogEntry]) -> int:
+        """
+        Add log entries to the running statistics.
+        
+        Args:
+            entries: Log entries to add
+            
+        Returns:
+            Number of entries added
+        """
+        count = len(self._entries)
+        self._entries.extend(entries)
+        return len(self._entries) - count
+    
+    def summary(self) -> StatsSummary:
+        """
+        Build a summary of everything added so far.
+        
+        Returns:
+            Statistics summary
+        """
+        return self._compute_stats(self._entries, **self._options)
+    
+    def merge(self, other: StatsAccumulator) -> None:
+        """
+        Add the entries of another accumulator built with the same options.
+        
+        Args:
+            other: Statistics of further entries, e.g. computed in a worker
+        """
+        if not isinstance(other, _CollectingStatsAccumulator):
+            raise TypeError(f"Cannot merge {type(other).__name__} into {type(self).__name__}")
+        self._entries.extend(other._entries)
+
+
 class LogProcessor(ABC):
     """Abstract interface for processing log entries."""
     
     @abstractmethod
-    def filter_entries(self, entries: Iterator[LogEntry], **filters: Any) -> Iterator[LogEntry]:
+    def filter_entries(self, entries: Iterable[LogEntry], **filters: Any) -> Iterator[LogEntry]:
         """
         Filter log entries based on criteria.
         
         Args:
-            entries: Iterator of log entries to filter
+            entries: Log entries to filter
             **filters: Filter criteria (level, patterns, etc.)
             
         Yields:
@@ -103,12 +209,12 @@ class LogProcessor(ABC):
         pass
     
     @abstractmethod
-    def compute_stats(self, entries: Iterator[LogEntry], **options: Any) -> StatsSummary:
+    def compute_stats(self, entries: Iterable[LogEntry], **options: Any) -> StatsSummary:
         """
         Compute statistics for log entries.
         
         Args:
-            entries: Iterator of log entries to analyze
+            entries: Log entries to analyze
             **options: Analysis options (group_by, top_n, etc.)
             
         Returns:
@@ -116,11 +222,29 @@ class LogProcessor(ABC):
         """
         pass
     
+    def create_stats_accumulator(self, **options: Any) -> StatsAccumulator:
+        """
+        Create running statistics that can be updated with new entries.
+        
+        The default keeps every added entry and runs ``compute_stats`` over
+        all of them for each summary; processors that can count
+        incrementally override this.
+        
+        Args:
+            **options: Analysis options (group_by, top_n, etc.)
+            
+        Returns:
+            Empty statistics accumulator
+        """
+        return _CollectingStatsAccumulator(self.compute_stats, options)
+    
     @abstractmethod
-    def compare_entries(self, entries1: List[LogEntry], entries2: List[LogEntry], **options: Any) -> ComparisonResult:
+    def compare_entries(self, entries1: Iterable[LogEntry], entries2: Iterable[LogEntry], **options: Any) -> ComparisonResult:
         """
         Compare two sets of log entries.
         
+        Implementations must consume each input only once.
+        
         Args:
             entries1: First set of entries
             entries2: Second set of entries
@@ -131,6 +255,29 @@ class LogProcessor(ABC):
         """
         pass
     
+    def compare_counts(self, entries1: Iterable[LogEntry], entries2: Iterable[LogEntry], **options: Any) -> Tuple[int, int, int, int]:
+        """
+        Count differences between two sets of log entries.
+        
+        The default counts the lists built by ``compare_entries``; processors
+        that can count without keeping the entries override this.
+        
+        Args:
+            entries1: First set of entries
+            entries2: Second set of entries
+            **options: Comparison options (ignore_timestamps, fuzzy, etc.)
+            
+        Returns:
+            Tuple of (added, removed, modified, common) line counts
+        """
+        result = self.compare_entries(entries1, entries2, **options)
+        return (
+            len(result.added_lines),
+            len(result.removed_lines),
+            len(result.modified_lines),
+            len(result.common_lines),
+        )
+    
     @abstractmethod
     def merge_entries(self, entry_iterators: List[Iterator[LogEntry]], **options: Any) -> Iterator[LogEntry]:
         """
@@ -177,26 +324,73 @@ class Command(ABC):
         """
         pass
     
-    def _parse_files(self, file_paths: List[str], follow: bool = False) -> Iterator[LogEntry]:
+    def _parse_files(self, file_paths: List[str], follow: bool = False, only: Optional[str] = None) -> Iterator[LogEntry]:
         """
         Helper method to parse multiple files into log entries.
         
         Args:
             file_paths: List of file paths to parse
             follow: Whether to follow files for new content
+            only: Optional log level filter; lines that cannot match it are
+                skipped before parsing
             
         Yields:
             Parsed log entries
         """
         if not self._file_reader or not self._log_parser:
             raise RuntimeError("FileReader and LogParser must be provided")
+        
+        prefilter = self._log_parser.level_prefilter(only) if only else None
+        read_lines = self._file_reader.read_lines
+        parse_line = self._log_parser.parse_line
             
         for file_path in file_paths:
-            line_number = 0
-            for line in self._file_reader.read_lines(file_path, follow=follow):
-                line_number += 1
-                if line.strip():  # Skip empty lines
-                    yield self._log_parser.parse_line(line, source_file=file_path, line_number=line_number)
+            for line_number, line in enumerate(read_lines(file_path, follow=follow), 1):
+                if not line or line.isspace():  # Skip empty lines without a stripped copy
+                    continue
+                if prefilter is not None and not prefilter(line):
+                    continue
+                entry = parse_line(line, source_file=file_path, line_number=line_number)
+                if only and not entry.matches_level(only):
+                    continue
+                yield entry
+    
+    def _parse_files_parallel(self, file_paths: List[str], only: Optional[str] = None) -> Iterator[LogEntry]:
+        """
+        Parse files like ``_parse_files``, using worker processes for large inputs.
+        
+        Files are still yielded one after another in line order; within each
+        file, batches of lines are parsed on all CPUs. Small inputs are
+        parsed in-process, where starting a pool would cost more than it saves.
+        
+        Args:
+            file_paths: List of file paths to parse
+            only: Optional log level filter
+            
+        Yields:
+            Parsed log entries
+        """
+        if not self._file_reader or not self._log_parser:
+            raise RuntimeError("FileReader and LogParser must be provided")
+        
+        workers = os.cpu_count() or 1
+        executor = create_parse_executor(file_paths, max_workers=workers)
+        if executor is None:
+            yield from self._parse_files(file_paths, follow=False, only=only)
+            return
+        
+        prefilter = self._log_parser.level_prefilter(only) if only else None
+        with executor:
+            for file_path in file_paths:
+                yield from parse_lines_in_pool(
+                    self._file_reader.read_lines(file_path),
+                    self._log_parser,
+                    file_path,
+                    executor,
+                    workers,
+                    line_filter=prefilter,
+                    only=only,
+                )
     
     def _write_output(self, content: str, output_path: Optional[str]) -> None:
         """
@@ -231,15 +425,24 @@ class StdoutWriter(OutputWriter):
     """Writer that outputs to stdout."""
     
     def write(self, content: str) -> None:
-        print(content, end='')
+        # Straight to the stream; print() would add argument handling and
+        # separator/end writes on every call
+        sys.stdout.write(content)
     
     def flush(self) -> None:
-        import sys
         sys.stdout.flush()
 
 
 class FileWriter(OutputWriter):
-    """Writer that outputs to a file."""
+    """
+    Writer that outputs to a file.
+    
+    Writes go through a large buffer so that many small writes turn into a
+    few big ones. Use it as a context manager to flush and close the file
+    deterministically.
+    """
+    
+    BUFFER_SIZE = 1 << 18
     
     def __init__(self, file_path: str) -> None:
         self.file_path = file_path
@@ -247,13 +450,24 @@ class FileWriter(OutputWriter):
     
     def write(self, content: str) -> None:
         if self._file is None:
-            self._file = open(self.file_path, 'w', encoding='utf-8')
+            self._file = open(self.file_path, 'w', encoding='utf-8', buffering=self.BUFFER_SIZE)
         self._file.write(content)
     
     def flush(self) -> None:
         if self._file:
             self._file.flush()
     
-    def __del__(self) -> None:
+    def close(self) -> None:
+        """Flush and close the file, if it was opened."""
         if self._file:
-            self._file.close()
\ No newline at end of file
+            self._file.close()
+            self._file = None
+    
+    def __enter__(self) -> "FileWriter":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def __del__(self) -> None:
+        self.close()
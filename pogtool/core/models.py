@@ -5,10 +5,13 @@ This module defines the fundamental data structures and value objects
 used throughout the application for representing log entries and related concepts.
 """
 
+import math
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 
 
 class LogLevel(Enum):
@@ -23,21 +26,50 @@ class LogLevel(Enum):
     FATAL = 50
     CRITICAL = 50  # Alias for FATAL
     
+    # Members are singletons compared by identity, so the C-level identity
+    # hash is valid; Enum's default hashes the name in Python, which made
+    # every per-entry dict lookup keyed by level (names, tags, counters) slow
+    __hash__ = object.__hash__
+    
     @classmethod
+    @lru_cache(maxsize=64)
     def from_string(cls, level_str: str) -> Optional["LogLevel"]:
-        """Parse log level from string, case-insensitive."""
-        try:
-            return cls[level_str.upper()]
-        except KeyError:
-            # Try common variations
-            variations = {
-                "WARN": cls.WARNING,
-                "WARNING": cls.WARNING,
-                "ERR": cls.ERROR,
-                "CRIT": cls.CRITICAL,
-                "CRITICAL": cls.CRITICAL,
-            }
-            return variations.get(level_str.upper())
+        """Parse log level from string, case-insensitive (memoized per string)."""
+        return _LEVEL_LOOKUP.get(level_str.upper())
+
+
+# Upper-case level names, aliases and common variations -> level
+_LEVEL_LOOKUP: Dict[str, LogLevel] = {
+    **LogLevel.__members__,
+    "ERR": LogLevel.ERROR,
+    "CRIT": LogLevel.CRITICAL,
+}
+
+# Level names by member; a dict lookup is cheaper than Enum.name per entry
+LEVEL_NAMES: Dict[LogLevel, str] = {level: level.name for level in LogLevel}
+
+
+_cached_isoformat = lru_cache(maxsize=1024)(datetime.isoformat)
+
+
+def iso_timestamp(timestamp: datetime) -> str:
+    """
+    Return ``timestamp.isoformat()``, cached for repeated naive timestamps.
+    
+    Log lines often share a timestamp (several lines logged in the same
+    second), so output formatters reuse the formatted string. Aware
+    timestamps are not cached: equal instants with different UTC offsets
+    compare equal but format differently.
+    
+    Args:
+        timestamp: Timestamp to format
+        
+    Returns:
+        ISO 8601 representation of the timestamp
+    """
+    if timestamp.tzinfo is None:
+        return _cached_isoformat(timestamp)
+    return timestamp.isoformat()
 
 
 class TimeInterval(Enum):
@@ -48,27 +80,146 @@ class TimeInterval(Enum):
     DAY = "day"
 
 
-@dataclass(frozen=True)
+# strftime format producing the time grouping key for each interval
+TIME_GROUP_FORMATS: Dict[TimeInterval, str] = {
+    TimeInterval.MINUTE: "%Y-%m-%d %H:%M",
+    TimeInterval.HOUR: "%Y-%m-%d %H:00",
+    TimeInterval.DAY: "%Y-%m-%d",
+}
+
+
+# Shared extra_fields value for entries without extra fields
+_EMPTY_FIELDS: Mapping[str, Any] = MappingProxyType({})
+
+
+def _posix_epoch(timestamp: datetime) -> float:
+    """POSIX timestamp for ordering; infinity if it cannot be represented."""
+    try:
+        return timestamp.timestamp()
+    except (ValueError, OverflowError, OSError):
+        # e.g. a fuzzily parsed UTC offset of a day or more
+        return math.inf
+
+
 class LogEntry:
     """
     Represents a single log entry with parsed components.
     
     This is the core domain object that encapsulates all information
     about a log line, including metadata and parsed content.
+    
+    Uses ``__slots__`` rather than a dataclass: entries are created once per
+    log line and large comparisons hold millions of them, so dropping the
+    per-instance ``__dict__`` matters for memory and attribute access.
     """
     
-    raw_line: str
-    timestamp: Optional[datetime] = None
-    level: Optional[LogLevel] = None
-    message: str = ""
-    source_file: Optional[str] = None
-    line_number: Optional[int] = None
-    extra_fields: Dict[str, Any] = None
+    __slots__ = (
+        "raw_line",
+        "timestamp",
+        "level",
+        "message",
+        "source_file",
+        "line_number",
+        "extra_fields",
+        "display",
+        "_epoch",
+        "_raw_upper",
+    )
+    
+    def __init__(
+        self,
+        raw_line: str,
+        timestamp: Optional[datetime] = None,
+        level: Optional[LogLevel] = None,
+        message: str = "",
+        source_file: Optional[str] = None,
+        line_number: Optional[int] = None,
+        extra_fields: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        self.raw_line = raw_line
+        self.timestamp = timestamp
+        self.level = level
+        self.message = message
+        self.source_file = source_file
+        self.line_number = line_number
+        # Most lines have no extra fields; share one read-only empty mapping
+        # instead of allocating a dict per entry (see set_extra)
+        self.extra_fields: Mapping[str, Any] = extra_fields if extra_fields else _EMPTY_FIELDS
+        # Text shown for the entry in reports: its message, else the raw line
+        self.display = message or raw_line
+        self._epoch: Optional[float] = None
+        self._raw_upper: Optional[str] = None
+    
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Rebuild from the constructor arguments: the shared empty mapping
+        # cannot be pickled, and derived slots are recomputed on load
+        return (
+            LogEntry,
+            (
+                self.raw_line,
+                self.timestamp,
+                self.level,
+                self.message,
+                self.source_file,
+                self.line_number,
+                self.extra_fields or None,
+            ),
+        )
+    
+    def _fields(self) -> Tuple[Any, ...]:
+        """Field values that define an entry's identity."""
+        return (
+            self.raw_line,
+            self.timestamp,
+            self.level,
+            self.message,
+            self.source_file,
+            self.line_number,
+            self.extra_fields,
+        )
+    
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()  # type: ignore[attr-defined]
     
-    def __post_init__(self) -> None:
-        """Initialize extra_fields as empty dict if None."""
-        if self.extra_fields is None:
-            object.__setattr__(self, "extra_fields", {})
+    # Mutable extra_fields make entries unhashable, as they were as a dataclass
+    __hash__ = None  # type: ignore[assignment]
+    
+    def __repr__(self) -> str:
+        return (
+            f"LogEntry(raw_line={self.raw_line!r}, timestamp={self.timestamp!r}, "
+            f"level={self.level!r}, message={self.message!r}, "
+            f"source_file={self.source_file!r}, line_number={self.line_number!r}, "
+            f"extra_fields={self.extra_fields!r})"
+        )
+    
+    def set_extra(self, key: str, value: Any) -> None:
+        """Set an extra field, giving the entry its own mapping on first write."""
+        if self.extra_fields is _EMPTY_FIELDS:
+            self.extra_fields = {}
+        self.extra_fields[key] = value  # type: ignore[index]
+    
+    def with_message(self, message: str) -> "LogEntry":
+        """Return a copy of this entry with a different message."""
+        return LogEntry(
+            self.raw_line,
+            self.timestamp,
+            self.level,
+            message,
+            self.source_file,
+            self.line_number,
+            # Copy so that set_extra on either entry leaves the other alone
+            dict(self.extra_fields) if self.extra_fields else None,
+        )
+    
+    @property
+    def epoch(self) -> float:
+        """Get the POSIX timestamp used for chronological ordering, computed on first use."""
+        epoch = self._epoch
+        if epoch is None:
+            epoch = self._epoch = _posix_epoch(self.timestamp) if self.timestamp else math.inf
+        return epoch
     
     @property
     def normalized_message(self) -> str:
@@ -88,21 +239,25 @@ class LogEntry:
         """Get time grouping key for specified interval."""
         if not self.timestamp:
             return "unknown"
-            
-        if interval == TimeInterval.MINUTE:
-            return self.timestamp.strftime("%Y-%m-%d %H:%M")
-        elif interval == TimeInterval.HOUR:
-            return self.timestamp.strftime("%Y-%m-%d %H:00")
-        elif interval == TimeInterval.DAY:
-            return self.timestamp.strftime("%Y-%m-%d")
-        else:
+        
+        time_format = TIME_GROUP_FORMATS.get(interval)
+        if time_format is None:
             return "unknown"
+        return self.timestamp.strftime(time_format)
+    
+    @property
+    def raw_upper(self) -> str:
+        """Get the upper-cased raw line, computed on first use."""
+        raw_upper = self._raw_upper
+        if raw_upper is None:
+            raw_upper = self._raw_upper = self.raw_line.upper()
+        return raw_upper
     
     def matches_level(self, level_filter: str) -> bool:
         """Check if this entry matches the given level filter."""
         if not self.level:
-            return level_filter.upper() in self.raw_line.upper()
-        return self.level.name.upper() == level_filter.upper()
+            return level_filter.upper() in self.raw_upper
+        return LEVEL_NAMES[self.level] == level_filter.upper()
     
     def matches_pattern(self, pattern: str) -> bool:
         """Check if this entry matches the given pattern (substring match)."""
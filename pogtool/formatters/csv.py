@@ -7,10 +7,16 @@ making them suitable for import into spreadsheets and data analysis tools.
 
 import csv
 import io
-from typing import List
+from functools import partial
+from operator import attrgetter
+from typing import Any, Iterable, Iterator, List, Tuple
 
 from pogtool.core.interfaces import LogFormatter
-from pogtool.core.models import StatsSummary, ComparisonResult, LogEntry
+from pogtool.core.models import LEVEL_NAMES, StatsSummary, ComparisonResult, LogEntry, iso_timestamp
+
+# Fields written for each entry row, fetched with a single C-level call
+_entry_fields = attrgetter('timestamp', 'level', 'source_file', 'line_number', 'message', 'raw_line')
+_comparison_fields = attrgetter('timestamp', 'level', 'source_file', 'line_number', 'display')
 
 
 class CsvFormatter(LogFormatter):
@@ -99,46 +105,10 @@ class CsvFormatter(LogFormatter):
         # Detailed differences
         writer.writerow(['Type', 'Timestamp', 'Level', 'Source File', 'Line Number', 'Message'])
         
-        # Added lines
-        for entry in result.added_lines:
-            writer.writerow([
-                'ADDED',
-                entry.timestamp.isoformat() if entry.timestamp else '',
-                entry.level.name if entry.level else '',
-                entry.source_file or '',
-                entry.line_number or '',
-                entry.message or entry.raw_line
-            ])
-        
-        # Removed lines
-        for entry in result.removed_lines:
-            writer.writerow([
-                'REMOVED',
-                entry.timestamp.isoformat() if entry.timestamp else '',
-                entry.level.name if entry.level else '',
-                entry.source_file or '',
-                entry.line_number or '',
-                entry.message or entry.raw_line
-            ])
-        
-        # Modified lines (old and new as separate rows)
-        for old_entry, new_entry in result.modified_lines:
-            writer.writerow([
-                'MODIFIED_OLD',
-                old_entry.timestamp.isoformat() if old_entry.timestamp else '',
-                old_entry.level.name if old_entry.level else '',
-                old_entry.source_file or '',
-                old_entry.line_number or '',
-                old_entry.message or old_entry.raw_line
-            ])
-            writer.writerow([
-                'MODIFIED_NEW',
-                new_entry.timestamp.isoformat() if new_entry.timestamp else '',
-                new_entry.level.name if new_entry.level else '',
-                new_entry.source_file or '',
-                new_entry.line_number or '',
-                new_entry.message or new_entry.raw_line
-            ])
+        # Added, removed and modified lines (old and new as separate rows)
+        writer.writerows(map(partial(_comparison_row, 'ADDED'), result.added_lines))
+        writer.writerows(map(partial(_comparison_row, 'REMOVED'), result.removed_lines))
+        writer.writerows(_modified_rows(result.modified_lines))
         
         return output.getvalue()
     
@@ -158,15 +128,65 @@ class CsvFormatter(LogFormatter):
         # Header
         writer.writerow(['Timestamp', 'Level', 'Source File', 'Line Number', 'Message', 'Raw Line'])
         
-        # Entries
-        for entry in entries:
-            writer.writerow([
-                entry.timestamp.isoformat() if entry.timestamp else '',
-                entry.level.name if entry.level else '',
-                entry.source_file or '',
-                entry.line_number or '',
-                entry.message or '',
-                entry.raw_line
-            ])
-        
-        return output.getvalue()
\ No newline at end of file
+        # Entries (writerows drives the generator from C)
+        writer.writerows(_entry_rows(entries))
+        
+        return output.getvalue()
+
+
+def _entry_rows(entries: Iterable[LogEntry]) -> Iterator[Tuple[Any, ...]]:
+    """
+    Build one CSV row per entry.
+    
+    Args:
+        entries: Log entries to convert
+        
+    Yields:
+        Row tuples matching the entries CSV header
+    """
+    for timestamp, level, source_file, line_number, message, raw_line in map(_entry_fields, entries):
+        yield (
+            iso_timestamp(timestamp) if timestamp else '',
+            LEVEL_NAMES[level] if level else '',
+            source_file or '',
+            line_number or '',
+            message or '',
+            raw_line,
+        )
+
+
+def _comparison_row(kind: str, entry: LogEntry) -> Tuple[Any, ...]:
+    """
+    Build one row of the comparison details table.
+    
+    Args:
+        kind: Difference type written in the first column
+        entry: Log entry to describe
+        
+    Returns:
+        Row tuple matching the comparison details header
+    """
+    timestamp, level, source_file, line_number, display = _comparison_fields(entry)
+    return (
+        kind,
+        iso_timestamp(timestamp) if timestamp else '',
+        LEVEL_NAMES[level] if level else '',
+        source_file or '',
+        line_number or '',
+        display,
+    )
+
+
+def _modified_rows(pairs: Iterable[Tuple[LogEntry, LogEntry]]) -> Iterator[Tuple[Any, ...]]:
+    """
+    Build comparison detail rows for modified lines, old row before new.
+    
+    Args:
+        pairs: (old, new) entry pairs
+        
+    Yields:
+        Row tuples matching the comparison details header
+    """
+    for old_entry, new_entry in pairs:
+        yield _comparison_row('MODIFIED_OLD', old_entry)
+        yield _comparison_row('MODIFIED_NEW', new_entry)
@@ -6,10 +6,10 @@ making them suitable for consumption by other tools and scripts.
 """
 
 import json
-from typing import List, Dict, Any
+from typing import Any, Dict, List
 
 from pogtool.core.interfaces import LogFormatter
-from pogtool.core.models import StatsSummary, ComparisonResult, LogEntry
+from pogtool.core.models import LEVEL_NAMES, StatsSummary, ComparisonResult, LogEntry, iso_timestamp
 
 
 class JsonFormatter(LogFormatter):
@@ -120,10 +120,10 @@ class JsonFormatter(LogFormatter):
         }
         
         if entry.timestamp:
-            result["timestamp"] = entry.timestamp.isoformat()
+            result["timestamp"] = iso_timestamp(entry.timestamp)
         
         if entry.level:
-            result["level"] = entry.level.name
+            result["level"] = LEVEL_NAMES[entry.level]
         
         if entry.source_file:
             result["source_file"] = entry.source_file
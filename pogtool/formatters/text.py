@@ -10,11 +10,22 @@ from typing import List
 from colorama import Fore, Style, init
 
 from pogtool.core.interfaces import LogFormatter
-from pogtool.core.models import StatsSummary, ComparisonResult, LogEntry
+from pogtool.core.models import LEVEL_NAMES, StatsSummary, ComparisonResult, LogEntry
 
 # Initialize colorama for cross-platform colored output
 init(autoreset=True)
 
+_LEVEL_COLORS = {
+    'ERROR': Fore.RED,
+    'FATAL': Fore.RED,
+    'CRITICAL': Fore.RED,
+    'WARN': Fore.YELLOW,
+    'WARNING': Fore.YELLOW,
+    'INFO': Fore.GREEN,
+    'DEBUG': Fore.BLUE,
+    'TRACE': Fore.CYAN,
+}
+
 
 class TextFormatter(LogFormatter):
     """Formatter for human-readable text output with optional colors."""
@@ -64,15 +75,19 @@ class TextFormatter(LogFormatter):
         # Pattern matches
         if show_patterns and stats.pattern_counts:
             lines.append(self._colorize("Pattern Matches:", Fore.YELLOW, bold=True))
-            for pattern, count in stats.pattern_counts.items():
-                lines.append(f"  {pattern:20}: {self._colorize(str(count), Fore.GREEN)}")
+            lines.extend(
+                f"  {pattern:20}: {self._colorize(str(count), Fore.GREEN)}"
+                for pattern, count in stats.pattern_counts.items()
+            )
             lines.append("")
         
         # Time grouping
         if show_time_groups and stats.time_groups:
             lines.append(self._colorize("Time Distribution:", Fore.YELLOW, bold=True))
-            for time_key, count in sorted(stats.time_groups.items()):
-                lines.append(f"  {time_key:20}: {self._colorize(str(count), Fore.BLUE)}")
+            lines.extend(
+                f"  {time_key:20}: {self._colorize(str(count), Fore.BLUE)}"
+                for time_key, count in sorted(stats.time_groups.items())
+            )
             lines.append("")
         
         # Top messages
@@ -114,8 +129,7 @@ class TextFormatter(LogFormatter):
         # Added lines
         if result.added_lines:
             lines.append(self._colorize("Added Lines:", Fore.GREEN, bold=True))
-            for entry in result.added_lines[:20]:  # Limit output
-                lines.append(f"+ {entry.raw_line}")
+            lines.extend(f"+ {entry.raw_line}" for entry in result.added_lines[:20])  # Limit output
             if len(result.added_lines) > 20:
                 lines.append(f"... and {len(result.added_lines) - 20} more added lines")
             lines.append("")
@@ -123,8 +137,7 @@ class TextFormatter(LogFormatter):
         # Removed lines
         if result.removed_lines:
             lines.append(self._colorize("Removed Lines:", Fore.RED, bold=True))
-            for entry in result.removed_lines[:20]:  # Limit output
-                lines.append(f"- {entry.raw_line}")
+            lines.extend(f"- {entry.raw_line}" for entry in result.removed_lines[:20])  # Limit output
             if len(result.removed_lines) > 20:
                 lines.append(f"... and {len(result.removed_lines) - 20} more removed lines")
             lines.append("")
@@ -133,9 +146,7 @@ class TextFormatter(LogFormatter):
         if result.modified_lines:
             lines.append(self._colorize("Modified Lines:", Fore.YELLOW, bold=True))
             for old_entry, new_entry in result.modified_lines[:10]:  # Limit output
-                lines.append(f"- {old_entry.raw_line}")
-                lines.append(f"+ {new_entry.raw_line}")
-                lines.append("")
+                lines.extend((f"- {old_entry.raw_line}", f"+ {new_entry.raw_line}", ""))
         
         return "\n".join(lines)
     
@@ -151,24 +162,32 @@ class TextFormatter(LogFormatter):
         """
         lines = []
         
+        # Level tags only depend on the level, so colorize each one once
+        level_tags = {
+            level: self._colorize(f"[{level_str}]", self._get_level_color(level_str))
+            for level, level_str in LEVEL_NAMES.items()
+        }
+        
+        append = lines.append
         for entry in entries:
             # Format with timestamp and level if available
             parts = []
             
-            if entry.timestamp:
-                parts.append(entry.timestamp.strftime("%Y-%m-%d %H:%M:%S"))
+            timestamp = entry.timestamp
+            if timestamp:
+                parts.append(timestamp.strftime("%Y-%m-%d %H:%M:%S"))
             
-            if entry.level:
-                level_str = entry.level.name
-                color = self._get_level_color(level_str)
-                parts.append(self._colorize(f"[{level_str}]", color))
+            level = entry.level
+            if level:
+                parts.append(level_tags[level])
             
-            if entry.source_file:
-                parts.append(f"({entry.source_file})")
+            source_file = entry.source_file
+            if source_file:
+                parts.append(f"({source_file})")
             
-            parts.append(entry.message or entry.raw_line)
+            parts.append(entry.display)
             
-            lines.append(" ".join(parts))
+            append(" ".join(parts))
         
         return "\n".join(lines)
     
@@ -187,11 +206,9 @@ class TextFormatter(LogFormatter):
         if not self.use_colors:
             return text
         
-        result = color + text
         if bold:
-            result = Style.BRIGHT + result
-        result += Style.RESET_ALL
-        return result
+            return f"{Style.BRIGHT}{color}{text}{Style.RESET_ALL}"
+        return f"{color}{text}{Style.RESET_ALL}"
     
     def _get_level_color(self, level: str) -> str:
         """
@@ -203,14 +220,4 @@ class TextFormatter(LogFormatter):
         Returns:
             Color code
         """
-        level_colors = {
-            'ERROR': Fore.RED,
-            'FATAL': Fore.RED,
-            'CRITICAL': Fore.RED,
-            'WARN': Fore.YELLOW,
-            'WARNING': Fore.YELLOW,
-            'INFO': Fore.GREEN,
-            'DEBUG': Fore.BLUE,
-            'TRACE': Fore.CYAN,
-        }
-        return level_colors.get(level.upper(), Fore.WHITE)
\ No newline at end of file
+        return _LEVEL_COLORS.get(level.upper(), Fore.WHITE)
\ No newline at end of file
@@ -0,0 +1,221 @@
+"""
+Parallel parsing helpers.
+
+This module contains the process pool plumbing used to parse large inputs
+in worker processes: lines are read in the calling process and handed to
+the workers in batches, and parsed entries (or, for statistics, partial
+counts) come back in file order.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Deque, Iterable, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    # Annotations only: pogtool.core.interfaces imports this module
+    from pogtool.core.interfaces import LogParser, StatsAccumulator
+    from pogtool.core.models import LogEntry
+
+# Inputs of at least this much data are parsed in worker processes; below
+# it, starting the pool costs more than parsing in parallel saves
+PARALLEL_MIN_BYTES = 8 << 20
+PARSE_BATCH_LINES = 20000
+
+
+def parse_batch(
+    parser: "LogParser",
+    lines: List[str],
+    source_file: str,
+    first_line_number: int,
+    line_filter: Optional[Callable[[str], object]] = None,
+    only: Optional[str] = None,
+) -> List["LogEntry"]:
+    """
+    Parse a batch of raw lines (runs in a worker process).
+    
+    Args:
+        parser: Parser to apply to each line
+        lines: Consecutive raw lines from one file
+        source_file: Path of the file the lines came from
+        first_line_number: Line number of the first line in the batch
+        line_filter: Optional raw-line check; lines failing it are not parsed
+        only: Optional log level that parsed entries must match
+    
+    Returns:
+        Parsed log entries, skipping empty and filtered lines
+    """
+    parse_line = parser.parse_line
+    entries: List["LogEntry"] = []
+    for line_number, line in enumerate(lines, first_line_number):
+        if not line or line.isspace():
+            continue
+        if line_filter is not None and not line_filter(line):
+            continue
+        entry = parse_line(line, source_file=source_file, line_number=line_number)
+        if only and not entry.matches_level(only):
+            continue
+        entries.append(entry)
+    return entries
+
+
+def stats_batch(
+    new_accumulator: Callable[[], "StatsAccumulator"],
+    parser: "LogParser",
+    lines: List[str],
+    source_file: str,
+    first_line_number: int,
+    only: Optional[str] = None,
+) -> Tuple[int, "StatsAccumulator"]:
+    """
+    Parse a batch of raw lines into partial statistics (runs in a worker process).
+    
+    Only the counters travel back to the calling process, not the entries.
+    
+    Args:
+        new_accumulator: Factory for an empty statistics accumulator
+        parser: Parser to apply to each line
+        lines: Consecutive raw lines from one file
+        source_file: Path of the file the lines came from
+        first_line_number: Line number of the first line in the batch
+        only: Optional log level that counted entries must match
+    
+    Returns:
+        Tuple of (number of entries parsed before level filtering, statistics
+        of the batch)
+    """
+    entries = parse_batch(parser, lines, source_file, first_line_number)
+    accumulator = new_accumulator()
+    if only:
+        accumulator.add(entry for entry in entries if entry.matches_level(only))
+    else:
+        accumulator.add(entries)
+    return len(entries), accumulator
+
+
+def create_parse_executor(file_paths: List[str], max_workers: int) -> Optional[ProcessPoolExecutor]:
+    """
+    Create a process pool for parsing, if the input is worth it.
+    
+    Args:
+        file_paths: Files that will be parsed
+        max_workers: Upper bound on the number of worker processes
+    
+    Returns:
+        A process pool, or None to parse in-process
+    """
+    workers = min(max_workers, os.cpu_count() or 1)
+    if workers < 2:
+        return None
+    
+    try:
+        total_size = sum(os.path.getsize(file_path) for file_path in file_paths)
+    except OSError:
+        # Let the normal parsing path report missing files
+        return None
+    
+    if total_size < PARALLEL_MIN_BYTES:
+        return None
+    
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def parse_lines_in_pool(
+    lines: Iterable[str],
+    parser: "LogParser",
+    source_file: str,
+    executor: Executor,
+    batches_in_flight: int,
+    line_filter: Optional[Callable[[str], object]] = None,
+    only: Optional[str] = None,
+) -> Iterator["LogEntry"]:
+    """
+    Parse lines in batches on an executor, yielding entries in line order.
+    
+    At most ``batches_in_flight`` batches wait ahead of the consumer, so
+    memory stays bounded however large the input is.
+    
+    Args:
+        lines: Raw lines of one file
+        parser: Parser to apply to each line
+        source_file: Path of the file the lines came from
+        executor: Executor running the parse batches
+        batches_in_flight: Number of batches submitted ahead of the consumer
+        line_filter: Optional raw-line check applied before parsing
+        only: Optional log level that parsed entries must match
+    
+    Yields:
+        Parsed log entries
+    """
+    task = partial(parse_batch, parser, source_file=source_file, line_filter=line_filter, only=only)
+    for entries in _run_batches(lines, executor, batches_in_flight, task):
+        yield from entries
+
+
+def stats_lines_in_pool(
+    lines: Iterable[str],
+    parser: "LogParser",
+    source_file: str,
+    executor: Executor,
+    batches_in_flight: int,
+    new_accumulator: Callable[[], "StatsAccumulator"],
+    only: Optional[str] = None,
+) -> Iterator[Tuple[int, "StatsAccumulator"]]:
+    """
+    Compute statistics of lines in batches on an executor.
+    
+    Args:
+        lines: Raw lines of one file
+        parser: Parser to apply to each line
+        source_file: Path of the file the lines came from
+        executor: Executor running the batches
+        batches_in_flight: Number of batches submitted ahead of the consumer
+        new_accumulator: Factory for an empty statistics accumulator (must be
+            picklable)
+        only: Optional log level that counted entries must match
+    
+    Yields:
+        Tuples of (entries parsed, partial statistics), in line order
+    """
+    task = partial(stats_batch, new_accumulator, parser, source_file=source_file, only=only)
+    yield from _run_batches(lines, executor, batches_in_flight, task)
+
+
+def _run_batches(
+    lines: Iterable[str],
+    executor: Executor,
+    batches_in_flight: int,
+    task: Callable[..., Any],
+) -> Iterator[Any]:
+    """
+    Run a task over consecutive batches of lines, yielding results in order.
+    
+    Args:
+        lines: Raw lines of one file
+        executor: Executor running the batches
+        batches_in_flight: Number of batches submitted ahead of the consumer
+        task: Called as ``task(lines=batch, first_line_number=number)``
+    
+    Yields:
+        Task results, one per batch
+    """
+    pending: Deque["Future[Any]"] = deque()
+    batch: List[str] = []
+    first_line_number = 1
+    
+    for line_number, line in enumerate(lines, 1):
+        batch.append(line)
+        if len(batch) == PARSE_BATCH_LINES:
+            pending.append(executor.submit(task, lines=batch, first_line_number=first_line_number))
+            batch = []
+            first_line_number = line_number + 1
+            
+            if len(pending) > batches_in_flight:
+                yield pending.popleft().result()
+    
+    if batch:
+        pending.append(executor.submit(task, lines=batch, first_line_number=first_line_number))
+    
+    while pending:
+        yield pending.popleft().result()
@@ -7,12 +7,26 @@ used by web servers like Apache and Nginx.
 
 import re
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Match, Optional
 
 from pogtool.core.interfaces import LogParser
 from pogtool.core.models import LogEntry, LogLevel
 
 
+@lru_cache(maxsize=4096)
+def _parse_clf_timestamp(timestamp_str: str) -> Optional[datetime]:
+    """Parse a CLF timestamp, memoized since neighbouring lines share them."""
+    try:
+        # Remove timezone offset for simplicity
+        if '+' in timestamp_str or '-' in timestamp_str[-5:]:
+            timestamp_str = timestamp_str.rsplit(None, 1)[0]
+        
+        return datetime.strptime(timestamp_str, '%d/%b/%Y:%H:%M:%S')
+    except ValueError:
+        return None
+
+
 class CommonLogParser(LogParser):
     """
     Parser for Common Log Format and Combined Log Format.
@@ -27,6 +41,10 @@ class CommonLogParser(LogParser):
         r'^(\S+) (\S+) (\S+) \[([^\]]+)\] "([^"]*)" (\d{3}) (\S+)(?: "([^"]*)" "([^"]*)")?'
     )
     
+    # Literal text every CLF line contains (around "[timestamp] \"request"),
+    # checked before running the regex so other lines are rejected cheaply
+    CLF_MARKERS = (' [', '] "')
+    
     def __init__(self) -> None:
         """Initialize the common log parser."""
         pass
@@ -45,7 +63,7 @@ class CommonLogParser(LogParser):
         """
         line = line.rstrip('\n\r')
         
-        match = self.CLF_PATTERN.match(line)
+        match = self._match(line)
         if not match:
             # Fall back to treating entire line as message
             return LogEntry(
@@ -55,16 +73,9 @@ class CommonLogParser(LogParser):
                 line_number=line_number,
             )
         
-        # Extract components
-        host = match.group(1)
-        ident = match.group(2) 
-        authuser = match.group(3)
-        timestamp_str = match.group(4)
-        request = match.group(5)
-        status_code = int(match.group(6))
-        size = match.group(7)
-        referer = match.group(8) if match.group(8) else None
-        user_agent = match.group(9) if match.group(9) else None
+        # Extract components with a single groups() call
+        host, ident, authuser, timestamp_str, request, status, size, referer, user_agent = match.groups()
+        status_code = int(status)
         
         # Parse timestamp
         timestamp = self._parse_timestamp(timestamp_str)
@@ -114,23 +125,23 @@ class CommonLogParser(LogParser):
             return False
             
         # Check if at least 70% of sample lines match CLF pattern
-        matches = sum(1 for line in sample_lines[:10] if self.CLF_PATTERN.match(line.strip()))
+        matches = sum(1 for line in sample_lines[:10] if self._match(line.strip()))
         return matches >= len(sample_lines[:10]) * 0.7
     
+    def _match(self, line: str) -> Optional[Match[str]]:
+        """Match a line against the CLF pattern, skipping the regex for lines without its markers."""
+        for marker in self.CLF_MARKERS:
+            if marker not in line:
+                return None
+        return self.CLF_PATTERN.match(line)
+    
     def _parse_timestamp(self, timestamp_str: str) -> Optional[datetime]:
         """
         Parse Apache/Nginx timestamp format.
         
         Format: 09/Sep/2023:23:20:15 +0000
         """
-        try:
-            # Remove timezone offset for simplicity
-            if '+' in timestamp_str or '-' in timestamp_str[-5:]:
-                timestamp_str = timestamp_str.rsplit(None, 1)[0]
-            
-            return datetime.strptime(timestamp_str, '%d/%b/%Y:%H:%M:%S')
-        except ValueError:
-            return None
+        return _parse_clf_timestamp(timestamp_str)
     
     def _status_to_level(self, status_code: int) -> Optional[LogLevel]:
         """
@@ -5,9 +5,11 @@ This parser uses regular expressions to extract timestamps, log levels,
 and messages from various log formats.
 """
 
+import os
 import re
-from datetime import datetime
-from typing import List, Optional
+from datetime import date, datetime, time
+from functools import lru_cache, partial
+from typing import Any, Callable, List, Optional, Tuple
 
 from dateutil.parser import parse as parse_date
 
@@ -15,6 +17,90 @@ from pogtool.core.interfaces import LogParser
 from pogtool.core.models import LogEntry, LogLevel
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso_timestamp(timestamp_str: str) -> datetime:
+    """Parse an ISO 8601 timestamp matched by the ISO/common patterns."""
+    if timestamp_str[-1] in 'Zz':
+        # fromisoformat only accepts a "Z" suffix from Python 3.11
+        timestamp_str = timestamp_str[:-1] + '+00:00'
+    return datetime.fromisoformat(timestamp_str)
+
+
+@lru_cache(maxsize=4096)
+def _parse_apache_timestamp(timestamp_str: str) -> datetime:
+    """Parse an Apache timestamp such as 09/Sep/2023:23:20:15 +0000."""
+    return datetime.strptime(timestamp_str, '%d/%b/%Y:%H:%M:%S %z')
+
+
+def _parse_syslog_timestamp(timestamp_str: str) -> datetime:
+    """Parse a syslog timestamp such as Sep  9 23:20:15 in the current year."""
+    # Not cached: like dateutil, the missing year is taken from today
+    return datetime.strptime(f"{date.today().year} {timestamp_str}", '%Y %b %d %H:%M:%S')
+
+
+def _parse_time_of_day(timestamp_str: str) -> datetime:
+    """Parse a bare time such as 23:20:15 as that time today."""
+    return datetime.combine(date.today(), time.fromisoformat(timestamp_str))
+
+
+# Environment variable naming the regex engine for the parser's patterns
+REGEX_ENGINE_VARIABLE = 'POGTOOL_REGEX_ENGINE'
+
+
+def _case_insensitive_compiler(engine: str) -> Tuple[str, Callable[[str], Any]]:
+    """
+    Get a case-insensitive pattern compiler for a regex engine.
+    
+    Args:
+        engine: 're', 'regex' (the third-party module) or 're2' (RE2 bindings)
+        
+    Returns:
+        Tuple of (engine actually used, compiler); engines that are unknown
+        or not installed fall back to re
+    """
+    if engine == 'regex':
+        try:
+            import regex
+        except ImportError:
+            pass
+        else:
+            return engine, lambda pattern: regex.compile(pattern, regex.IGNORECASE)
+    elif engine == 're2':
+        try:
+            import re2
+        except ImportError:
+            pass
+        else:
+            # Inline flag: RE2 bindings differ in how they accept flags
+            return engine, lambda pattern: re2.compile('(?i)' + pattern)
+    return 're', lambda pattern: re.compile(pattern, re.IGNORECASE)
+
+
+def _mentions_any(names: Tuple[str, ...], line: str) -> bool:
+    """
+    Check whether a line contains any of the given upper-case names, ignoring case.
+    
+    Upper-casing the line once and testing substrings is several times faster
+    than a case-insensitive regex alternation. Every line that can satisfy
+    LogEntry.matches_level passes: level names are compared upper-cased there
+    as well.
+    """
+    upper_line = line.upper()
+    for name in names:
+        if name in upper_line:
+            return True
+    return False
+
+
+# Level name captured by the level patterns -> level, for the usual
+# spellings; other case mixes fall back to LogLevel.from_string
+_LEVEL_BY_NAME = {
+    spelling: LogLevel.from_string(name)
+    for name in ('TRACE', 'DEBUG', 'INFO', 'WARN', 'WARNING', 'ERROR', 'FATAL', 'CRITICAL')
+    for spelling in (name, name.lower(), name.capitalize())
+}
+
+
 class GenericLogParser(LogParser):
     """
     Generic log parser that can handle most common log formats.
@@ -37,6 +123,17 @@ class GenericLogParser(LogParser):
         r'(\d{2}:\d{2}:\d{2})',
     ]
     
+    # Direct parser for each timestamp pattern above. These give the same
+    # result as dateutil for the shapes they accept and raise ValueError
+    # otherwise, falling back to dateutil.
+    TIMESTAMP_PARSERS: List[Callable[[str], datetime]] = [
+        _parse_iso_timestamp,
+        _parse_iso_timestamp,
+        _parse_apache_timestamp,
+        _parse_syslog_timestamp,
+        _parse_time_of_day,
+    ]
+    
     # Log level patterns (case insensitive)
     LEVEL_PATTERNS = [
         r'\b(TRACE|DEBUG|INFO|WARN|WARNING|ERROR|FATAL|CRITICAL)\b',
@@ -44,10 +141,24 @@ class GenericLogParser(LogParser):
         r'(TRACE|DEBUG|INFO|WARN|WARNING|ERROR|FATAL|CRITICAL):',
     ]
     
-    def __init__(self) -> None:
-        """Initialize the generic parser with compiled regex patterns."""
-        self._timestamp_regexes = [re.compile(pattern, re.IGNORECASE) for pattern in self.TIMESTAMP_PATTERNS]
-        self._level_regexes = [re.compile(pattern, re.IGNORECASE) for pattern in self.LEVEL_PATTERNS]
+    def __init__(self, regex_engine: Optional[str] = None) -> None:
+        """
+        Initialize the generic parser with compiled regex patterns.
+        
+        Args:
+            regex_engine: Regex engine for the patterns ('re', 'regex' or
+                're2'); defaults to $POGTOOL_REGEX_ENGINE, else re
+        """
+        requested = regex_engine or os.environ.get(REGEX_ENGINE_VARIABLE, 're')
+        self.regex_engine, compile_pattern = _case_insensitive_compiler(requested)
+        self._timestamp_regexes = [compile_pattern(pattern) for pattern in self.TIMESTAMP_PATTERNS]
+        self._timestamp_parsers = list(zip(self._timestamp_regexes, self.TIMESTAMP_PARSERS))
+        self._level_regexes = [compile_pattern(pattern) for pattern in self.LEVEL_PATTERNS]
+    
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Recompile in the receiving process (worker pools): patterns of
+        # third-party engines are not necessarily picklable
+        return (self.__class__, (self.regex_engine,))
     
     def parse_line(self, line: str, source_file: Optional[str] = None, line_number: Optional[int] = None) -> LogEntry:
         """
@@ -64,13 +175,13 @@ class GenericLogParser(LogParser):
         line = line.rstrip('\n\r')
         
         # Extract timestamp
-        timestamp = self._extract_timestamp(line)
+        timestamp, first_timestamp_pattern = self._find_timestamp(line)
         
         # Extract log level
-        level = self._extract_level(line)
+        level, first_level_pattern = self._find_level(line)
         
         # Extract message (remove timestamp and level if found)
-        message = self._extract_message(line, timestamp, level)
+        message = self._extract_message(line, timestamp, level, first_timestamp_pattern, first_level_pattern)
         
         return LogEntry(
             raw_line=line,
@@ -94,15 +205,64 @@ class GenericLogParser(LogParser):
         # Generic parser can attempt to parse any format
         return True
     
+    def level_prefilter(self, level_filter: str) -> Optional[Callable[[str], bool]]:
+        """
+        Build a cheap raw-line check for a level filter.
+        
+        Levels only come from level words in the line, so a line can only
+        match ``level_filter`` if it mentions the level name or one of its
+        aliases (e.g. CRITICAL for FATAL); other lines need not be parsed.
+        
+        Args:
+            level_filter: Log level name to filter on
+            
+        Returns:
+            Case-insensitive check over raw lines (picklable, for worker processes)
+        """
+        names = {level_filter.upper()}
+        level = LogLevel.from_string(level_filter)
+        if level is not None:
+            names.update(name for name, member in LogLevel.__members__.items() if member is level)
+        return partial(_mentions_any, tuple(sorted(names)))
+    
     def _extract_timestamp(self, line: str) -> Optional[datetime]:
         """Extract timestamp from log line."""
-        for regex in self._timestamp_regexes:
+        return self._find_timestamp(line)[0]
+    
+    def _find_timestamp(self, line: str) -> Tuple[Optional[datetime], int]:
+        """
+        Extract timestamp from log line.
+        
+        Args:
+            line: Log line text
+            
+        Returns:
+            Tuple of (timestamp or None, index of the first timestamp pattern
+            matching the line, or the number of patterns if none does)
+        """
+        first_match = len(self._timestamp_parsers)
+        
+        # Every timestamp pattern contains a colon; skip the scans without one
+        if ':' not in line:
+            return None, first_match
+        
+        # Patterns are tried in priority order (the first pattern that matches
+        # anywhere wins), which a single leftmost-match alternation would not
+        # preserve
+        for index, (regex, parse_timestamp) in enumerate(self._timestamp_parsers):
             match = regex.search(line)
             if match:
+                first_match = min(first_match, index)
                 timestamp_str = match.group(1)
+                try:
+                    # Parse the known shape directly (memoized for absolute
+                    # timestamps, which repeat heavily)
+                    return parse_timestamp(timestamp_str), first_match
+                except ValueError:
+                    pass
                 try:
                     # Use dateutil parser for flexible timestamp parsing
-                    return parse_date(timestamp_str, fuzzy=True)
+                    return parse_date(timestamp_str, fuzzy=True), first_match
                 except (ValueError, TypeError):
                     # If dateutil fails, try some common formats manually
                     try:
@@ -117,37 +277,77 @@ class GenericLogParser(LogParser):
                         ]
                         for fmt in formats:
                             try:
-                                return datetime.strptime(timestamp_str, fmt)
+                                return datetime.strptime(timestamp_str, fmt), first_match
                             except ValueError:
                                 continue
                     except (ValueError, TypeError):
                         pass
-        return None
+        return None, first_match
     
     def _extract_level(self, line: str) -> Optional[LogLevel]:
         """Extract log level from log line."""
-        for regex in self._level_regexes:
+        return self._find_level(line)[0]
+    
+    def _find_level(self, line: str) -> Tuple[Optional[LogLevel], int]:
+        """
+        Extract log level from log line.
+        
+        Args:
+            line: Log line text
+            
+        Returns:
+            Tuple of (level or None, index of the level pattern that matched,
+            or the number of patterns if none did)
+        """
+        for index, regex in enumerate(self._level_regexes):
             match = regex.search(line)
             if match:
                 level_str = match.group(1)
-                return LogLevel.from_string(level_str)
-        return None
+                return _LEVEL_BY_NAME.get(level_str) or LogLevel.from_string(level_str), index
+        return None, len(self._level_regexes)
     
-    def _extract_message(self, line: str, timestamp: Optional[datetime], level: Optional[LogLevel]) -> str:
+    def _extract_message(
+        self,
+        line: str,
+        timestamp: Optional[datetime],
+        level: Optional[LogLevel],
+        first_timestamp_pattern: int = 0,
+        first_level_pattern: int = 0,
+    ) -> str:
         """
         Extract the message part of the log line.
         
         Removes timestamp and level information to get the core message.
+        Patterns before the first one known to match the original line are
+        skipped while the message is still the original line, since they
+        cannot match it.
+        
+        Args:
+            line: Log line text
+            timestamp: Extracted timestamp, if any
+            level: Extracted log level, if any
+            first_timestamp_pattern: Index of the first timestamp pattern matching the line
+            first_level_pattern: Index of the first level pattern matching the line
+            
+        Returns:
+            Message text
         """
         message = line
         
         # Remove timestamp if found
-        for regex in self._timestamp_regexes:
+        for regex in self._timestamp_regexes[first_timestamp_pattern:]:
+            # Every timestamp pattern contains a colon
+            if ':' not in message:
+                break
             message = regex.sub('', message, count=1)
         
-        # Remove level if found
+        # Remove level if found. Level patterns the original line did not match
+        # can match once a timestamp has been cut out, so only skip them if
+        # nothing was removed (removals always shorten the message)
         if level:
-            for regex in self._level_regexes:
+            if len(message) != len(line):
+                first_level_pattern = 0
+            for regex in self._level_regexes[first_level_pattern:]:
                 message = regex.sub('', message, count=1)
         
         # Clean up whitespace and common separators
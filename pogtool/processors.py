@@ -5,43 +5,91 @@ This module contains concrete implementations for processing log entries
 including statistics computation, filtering, comparison, and merging.
 """
 
+import hashlib
 import heapq
 import re
 from collections import Counter, defaultdict
 from difflib import unified_diff
-from typing import Iterator, List, Dict, Any, Set, Tuple
+from itertools import islice
+from operator import attrgetter
+from typing import Callable, Iterable, Iterator, List, Dict, Any, Set, Tuple
 
-from pogtool.core.interfaces import LogProcessor
-from pogtool.core.models import LogEntry, StatsSummary, ComparisonResult, TimeInterval
+from pogtool.core.interfaces import LogProcessor, StatsAccumulator
+from pogtool.core.models import LEVEL_NAMES, TIME_GROUP_FORMATS, LogEntry, StatsSummary, ComparisonResult, TimeInterval
+
+
+# Sort key ordering entries by timestamp, with untimestamped entries last
+chronological_key = attrgetter('epoch')
+
+_normalized_message = attrgetter('normalized_message')
+
+
+def dedup_key(entry: LogEntry) -> bytes:
+    """
+    Key identifying an entry's message for deduplication.
+    
+    A 128-bit digest keeps the seen-set small however long the messages are,
+    while (unlike ``hash``) being stable across processes and wide enough
+    that distinct messages do not collide in practice.
+    
+    Args:
+        entry: Log entry
+        
+    Returns:
+        Digest of the entry's normalized message
+    """
+    message = entry.normalized_message.encode('utf-8', 'surrogatepass')
+    return hashlib.blake2b(message, digest_size=16).digest()
+
+# Entries tallied per Counter.update call when accumulating stats
+_COUNT_CHUNK_ENTRIES = 4096
+
+# With approximate top messages, this many candidates are kept per message
+# shown; the counter is pruned back once it holds twice as many
+_APPROX_TOP_FACTOR = 100
+
+# Level name patterns for lines without a parsed level, compiled once
+_LEVEL_SEARCHES = [
+    re.compile(pattern, re.IGNORECASE).search
+    for pattern in (
+        r'\b(TRACE|DEBUG|INFO|WARN|WARNING|ERROR|FATAL|CRITICAL)\b',
+        r'\[(TRACE|DEBUG|INFO|WARN|WARNING|ERROR|FATAL|CRITICAL)\]',
+        r'(TRACE|DEBUG|INFO|WARN|WARNING|ERROR|FATAL|CRITICAL):',
+    )
+]
 
 
 class StandardLogProcessor(LogProcessor):
     """Standard implementation of log processing operations."""
     
-    def filter_entries(self, entries: Iterator[LogEntry], **filters: Any) -> Iterator[LogEntry]:
+    def filter_entries(self, entries: Iterable[LogEntry], **filters: Any) -> Iterator[LogEntry]:
         """
         Filter log entries based on criteria.
         
         Args:
-            entries: Iterator of log entries to filter
+            entries: Log entries to filter
             **filters: Filter criteria (level, patterns, etc.)
             
         Yields:
             Filtered log entries
         """
         level_filter = filters.get('level')
-        patterns = filters.get('patterns', [])
+        if level_filter:
+            level_filter = level_filter.upper()
+        needles = [pattern.lower() for pattern in filters.get('patterns', [])]
         
         for entry in entries:
             # Apply level filter
             if level_filter and not entry.matches_level(level_filter):
                 continue
             
-            # Apply pattern filters (all patterns must match)
-            if patterns:
+            # Apply pattern filters (all patterns must match), lower-casing
+            # the line once rather than once per pattern
+            if needles:
+                raw_lower = entry.raw_line.lower()
                 matches_all = True
-                for pattern in patterns:
-                    if not entry.matches_pattern(pattern):
+                for needle in needles:
+                    if needle not in raw_lower:
                         matches_all = False
                         break
                 if not matches_all:
@@ -49,74 +97,40 @@ class StandardLogProcessor(LogProcessor):
             
             yield entry
     
-    def compute_stats(self, entries: Iterator[LogEntry], **options: Any) -> StatsSummary:
+    def compute_stats(self, entries: Iterable[LogEntry], **options: Any) -> StatsSummary:
         """
         Compute statistics for log entries.
         
         Args:
-            entries: Iterator of log entries to analyze
+            entries: Log entries to analyze
             **options: Analysis options (group_by, top_n, etc.)
             
         Returns:
             Statistics summary
         """
-        # Convert to list to allow multiple passes
-        entry_list = list(entries)
-        
-        # Basic counts
-        total_lines = len(entry_list)
-        level_counts: Dict[str, int] = Counter()
-        pattern_counts: Dict[str, int] = Counter()
-        time_groups: Dict[str, int] = Counter()
-        message_counts: Counter[str] = Counter()
+        accumulator = self.create_stats_accumulator(**options)
+        accumulator.add(entries)
+        return accumulator.summary()
+    
+    def create_stats_accumulator(self, **options: Any) -> "StandardStatsAccumulator":
+        """
+        Create running statistics that can be updated with new entries.
         
-        # Extract options
-        group_by = options.get('group_by')
-        top_n = options.get('top_n', 10)
-        patterns = options.get('patterns', [])
-        
-        # Process entries
-        for entry in entry_list:
-            # Count by level
-            if entry.level:
-                level_counts[entry.level.name] += 1
-            else:
-                # Try to extract level from raw line
-                level_name = self._extract_level_from_line(entry.raw_line)
-                if level_name:
-                    level_counts[level_name] += 1
-                else:
-                    level_counts['UNKNOWN'] += 1
-            
-            # Count patterns
-            for pattern in patterns:
-                if entry.matches_pattern(pattern):
-                    pattern_counts[pattern] += 1
-            
-            # Group by time
-            if group_by and entry.timestamp:
-                interval = TimeInterval(group_by) if isinstance(group_by, str) else group_by
-                time_key = entry.get_time_group(interval)
-                time_groups[time_key] += 1
+        Args:
+            **options: Analysis options (group_by, top_n, etc.)
             
-            # Count messages for top N
-            message_counts[entry.normalized_message] += 1
-        
-        # Get top N messages
-        top_messages = message_counts.most_common(top_n)
-        
-        return StatsSummary(
-            total_lines=total_lines,
-            level_counts=dict(level_counts),
-            pattern_counts=dict(pattern_counts),
-            time_groups=dict(time_groups),
-            top_messages=top_messages,
-        )
+        Returns:
+            Empty statistics accumulator
+        """
+        return StandardStatsAccumulator(self._extract_level_from_line, **options)
     
-    def compare_entries(self, entries1: List[LogEntry], entries2: List[LogEntry], **options: Any) -> ComparisonResult:
+    def compare_entries(self, entries1: Iterable[LogEntry], entries2: Iterable[LogEntry], **options: Any) -> ComparisonResult:
         """
         Compare two sets of log entries.
         
+        Both inputs are consumed exactly once, so generators can be passed
+        straight from the parser without materializing them first.
+        
         Args:
             entries1: First set of entries
             entries2: Second set of entries
@@ -128,22 +142,22 @@ class StandardLogProcessor(LogProcessor):
         ignore_timestamps = options.get('ignore_timestamps', False)
         fuzzy = options.get('fuzzy', False)
         
-        # Convert entries to comparable strings
-        lines1 = [self._entry_to_comparable_string(entry, ignore_timestamps, fuzzy) for entry in entries1]
-        lines2 = [self._entry_to_comparable_string(entry, ignore_timestamps, fuzzy) for entry in entries2]
+        key_fn = self._comparable_key_fn(ignore_timestamps, fuzzy)
         
-        # Create sets for comparison
-        set1 = set(lines1)
-        set2 = set(lines2)
+        # Pair each entry with its comparable string in a single pass
+        keyed1 = [(key_fn(entry), entry) for entry in entries1]
+        keyed2 = [(key_fn(entry), entry) for entry in entries2]
         
-        # Find differences
-        added_indices = [i for i, line in enumerate(lines2) if line not in set1]
-        removed_indices = [i for i, line in enumerate(lines1) if line not in set2]
-        common_indices1 = [i for i, line in enumerate(lines1) if line in set2]
+        # Create sets for comparison
+        set1 = {line for line, _ in keyed1}
+        set2 = {line for line, _ in keyed2}
         
-        added_lines = [entries2[i] for i in added_indices]
-        removed_lines = [entries1[i] for i in removed_indices]
-        common_lines = [entries1[i] for i in common_indices1]
+        # Find differences, splitting the first side in a single pass
+        added_lines = [entry for line, entry in keyed2 if line not in set1]
+        removed_lines: List[LogEntry] = []
+        common_lines: List[LogEntry] = []
+        for line, entry in keyed1:
+            (common_lines if line in set2 else removed_lines).append(entry)
         
         # For modified lines, we'll use a simple heuristic
         # In a more sophisticated implementation, we'd use proper diff algorithms
@@ -156,6 +170,35 @@ class StandardLogProcessor(LogProcessor):
             common_lines=common_lines,
         )
     
+    def compare_counts(self, entries1: Iterable[LogEntry], entries2: Iterable[LogEntry], **options: Any) -> Tuple[int, int, int, int]:
+        """
+        Count differences between two sets of log entries.
+        
+        Produces the same counts as ``compare_entries`` but only keeps a
+        multiset of comparison keys per side instead of lists of entries.
+        
+        Args:
+            entries1: First set of entries
+            entries2: Second set of entries
+            **options: Comparison options (ignore_timestamps, fuzzy, etc.)
+            
+        Returns:
+            Tuple of (added, removed, modified, common) line counts
+        """
+        ignore_timestamps = options.get('ignore_timestamps', False)
+        fuzzy = options.get('fuzzy', False)
+        
+        key_fn = self._comparable_key_fn(ignore_timestamps, fuzzy)
+        
+        counts1 = Counter(map(key_fn, entries1))
+        counts2 = Counter(map(key_fn, entries2))
+        
+        added = sum(count for line, count in counts2.items() if line not in counts1)
+        removed = sum(count for line, count in counts1.items() if line not in counts2)
+        common = sum(count for line, count in counts1.items() if line in counts2)
+        
+        return added, removed, 0, common
+    
     def merge_entries(self, entry_iterators: List[Iterator[LogEntry]], **options: Any) -> Iterator[LogEntry]:
         """
         Merge multiple iterators of log entries chronologically.
@@ -170,88 +213,260 @@ class StandardLogProcessor(LogProcessor):
         deduplicate = options.get('deduplicate', False)
         tag_source = options.get('tag_source', False)
         
-        # Convert iterators to lists for easier handling
-        entry_lists = [list(it) for it in entry_iterators]
-        
-        # Create a priority queue for merging
-        # Each item is (timestamp, list_index, entry_index, entry)
-        heap: List[Tuple[Any, int, int, LogEntry]] = []
-        seen_lines: Set[str] = set() if deduplicate else set()
-        
-        # Initialize heap with first entry from each list
-        for list_idx, entries in enumerate(entry_lists):
-            if entries:
-                entry = entries[0]
-                timestamp = entry.timestamp.timestamp() if entry.timestamp else float('inf')
-                heapq.heappush(heap, (timestamp, list_idx, 0, entry))
+        # Only message digests are kept, so memory per distinct message is a
+        # short bytes object rather than a copy of the message
+        seen_lines: Set[bytes] = set()
+        # Source tags, built once per source file rather than per entry
+        tags: Dict[str, str] = {}
         
-        # Merge entries in chronological order
-        while heap:
-            timestamp, list_idx, entry_idx, entry = heapq.heappop(heap)
-            
+        # Inputs are individually chronological, so a lazy k-way merge is
+        # enough; heapq.merge keeps ties in input order like a stable sort
+        for entry in heapq.merge(*entry_iterators, key=chronological_key):
             # Check for duplicates
             if deduplicate:
-                line_key = entry.normalized_message
+                line_key = dedup_key(entry)
                 if line_key in seen_lines:
-                    # Skip duplicate, but continue to next entry
-                    next_entry_idx = entry_idx + 1
-                    if next_entry_idx < len(entry_lists[list_idx]):
-                        next_entry = entry_lists[list_idx][next_entry_idx]
-                        next_timestamp = next_entry.timestamp.timestamp() if next_entry.timestamp else float('inf')
-                        heapq.heappush(heap, (next_timestamp, list_idx, next_entry_idx, next_entry))
                     continue
                 seen_lines.add(line_key)
             
             # Tag with source if requested
             if tag_source and entry.source_file:
-                # Modify the entry to include source tag
-                # Since LogEntry is frozen, we need to create a new one
-                from dataclasses import replace
-                entry = replace(entry, message=f"[{entry.source_file}] {entry.message}")
+                tag = tags.get(entry.source_file)
+                if tag is None:
+                    tag = tags[entry.source_file] = f"[{entry.source_file}] "
+                # Tag a copy so the caller's entry is left untouched
+                entry = entry.with_message(tag + str(entry.message))
             
             yield entry
-            
-            # Add next entry from same list to heap
-            next_entry_idx = entry_idx + 1
-            if next_entry_idx < len(entry_lists[list_idx]):
-                next_entry = entry_lists[list_idx][next_entry_idx]
-                next_timestamp = next_entry.timestamp.timestamp() if next_entry.timestamp else float('inf')
-                heapq.heappush(heap, (next_timestamp, list_idx, next_entry_idx, next_entry))
     
     def _extract_level_from_line(self, line: str) -> str:
         """Extract log level from raw line using regex patterns."""
-        patterns = [
-            r'\b(TRACE|DEBUG|INFO|WARN|WARNING|ERROR|FATAL|CRITICAL)\b',
-            r'\[(TRACE|DEBUG|INFO|WARN|WARNING|ERROR|FATAL|CRITICAL)\]',
-            r'(TRACE|DEBUG|INFO|WARN|WARNING|ERROR|FATAL|CRITICAL):',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
+        # Patterns keep their priority order: the first one matching anywhere
+        # wins, which one leftmost-match alternation would not preserve
+        for search in _LEVEL_SEARCHES:
+            match = search(line)
             if match:
                 return match.group(1).upper()
         
         return 'UNKNOWN'
     
-    def _entry_to_comparable_string(self, entry: LogEntry, ignore_timestamps: bool, fuzzy: bool) -> str:
+    def _comparable_key_fn(self, ignore_timestamps: bool, fuzzy: bool) -> Callable[[LogEntry], str]:
         """
-        Convert log entry to string for comparison.
+        Build the function that converts a log entry to a string for comparison.
+        
+        The flags are resolved once here rather than for every entry. In fuzzy
+        mode the normalized form is memoized per source string, so lines shared
+        by both inputs are only normalized once.
         
         Args:
-            entry: Log entry to convert
             ignore_timestamps: Whether to ignore timestamps
             fuzzy: Whether to apply fuzzy matching (normalize whitespace)
             
         Returns:
-            Comparable string representation
+            Function mapping a log entry to its comparable string
         """
-        if ignore_timestamps:
-            comparable = entry.normalized_message
-        else:
-            comparable = entry.raw_line
+        source = attrgetter('normalized_message' if ignore_timestamps else 'raw_line')
+        
+        if not fuzzy:
+            return source
         
-        if fuzzy:
-            # Normalize whitespace and convert to lowercase for fuzzy matching
-            comparable = ' '.join(comparable.split()).lower()
+        cache: Dict[str, str] = {}
         
-        return comparable
\ No newline at end of file
+        def fuzzy_key(entry: LogEntry) -> str:
+            text = source(entry)
+            key = cache.get(text)
+            if key is None:
+                # Normalize whitespace and convert to lowercase for fuzzy matching
+                key = cache[text] = ' '.join(text.split()).lower()
+            return key
+        
+        return fuzzy_key
+
+
+class StandardStatsAccumulator(StatsAccumulator):
+    """
+    Running statistics that can be fed log entries in several batches.
+    
+    Keeps the full counters (including every message count) so that the
+    summary after each batch equals computing the stats over all entries
+    added so far, without re-reading earlier entries.
+    
+    With the ``approx_top`` option, only the most frequent message candidates
+    are kept, which bounds memory on logs with millions of distinct messages
+    at the cost of possibly undercounting messages that were rare early on.
+    """
+    
+    def __init__(self, extract_level: Callable[[str], str], **options: Any) -> None:
+        """
+        Initialize empty statistics.
+        
+        Args:
+            extract_level: Fallback level extraction for entries without a level
+            **options: Analysis options (group_by, top_n, approx_top, etc.)
+        """
+        self._extract_level = extract_level
+        
+        # Extract options
+        group_by = options.get('group_by')
+        self._interval = TimeInterval(group_by) if isinstance(group_by, str) else group_by
+        self._top_n = options.get('top_n', 10)
+        self._patterns = options.get('patterns', [])
+        self._message_capacity = max(self._top_n, 1) * _APPROX_TOP_FACTOR if options.get('approx_top') else 0
+        
+        self.total_lines = 0
+        # Parsed levels are counted by LogLevel and named in summary(); levels
+        # extracted from raw lines are counted by name
+        self.level_counts: Counter[Any] = Counter()
+        self.pattern_counts: Counter[str] = Counter()
+        # Naive timestamps, or (timestamp, UTC offset) pairs for aware ones
+        self.timestamp_counts: Counter[Any] = Counter()
+        self.message_counts: Counter[str] = Counter()
+        self._time_group_keys: Dict[Any, str] = {}
+    
+    def add(self, entries: Iterable[LogEntry]) -> int:
+        """
+        Add log entries to the running statistics.
+        
+        Args:
+            entries: Log entries to add
+            
+        Returns:
+            Number of entries added
+        """
+        level_counts = self.level_counts
+        pattern_counts = self.pattern_counts
+        timestamp_counts = self.timestamp_counts
+        extract_level = self._extract_level
+        message_counts = self.message_counts
+        needles = [(pattern, pattern.lower()) for pattern in self._patterns]
+        interval = self._interval
+        added = 0
+        
+        # Work through the entries in chunks so that the level and message
+        # tallies can be handed to Counter.update, which counts in C
+        entries = iter(entries)
+        while True:
+            chunk = list(islice(entries, _COUNT_CHUNK_ENTRIES))
+            if not chunk:
+                break
+            added += len(chunk)
+            
+            levels: List[Any] = []
+            for entry in chunk:
+                # Count by level, trying to extract one from the raw line if
+                # the entry has none
+                levels.append(entry.level or extract_level(entry.raw_line) or 'UNKNOWN')
+                
+                # Count patterns against a single lower-cased copy of the line
+                if needles:
+                    raw_lower = entry.raw_line.lower()
+                    for pattern, needle in needles:
+                        if needle in raw_lower:
+                            pattern_counts[pattern] += 1
+                
+                # Group by time: count timestamps here and format each distinct
+                # one only once in summary(). Aware timestamps also key on their
+                # UTC offset, since equal instants with different offsets hash
+                # alike but fall into different wall-clock groups.
+                timestamp = entry.timestamp
+                if interval and timestamp:
+                    if timestamp.tzinfo is None:
+                        timestamp_counts[timestamp] += 1
+                    else:
+                        timestamp_counts[(timestamp, timestamp.utcoffset())] += 1
+            
+            level_counts.update(levels)
+            # Count messages for top N
+            message_counts.update(map(_normalized_message, chunk))
+            if self._message_capacity and len(message_counts) > 2 * self._message_capacity:
+                message_counts = self._prune_messages()
+        
+        self.total_lines += added
+        return added
+    
+    def merge(self, other: StatsAccumulator) -> None:
+        """
+        Add the statistics of another accumulator built with the same options.
+        
+        Merging partial statistics in input order gives the same summary as
+        adding all of their entries to one accumulator.
+        
+        Args:
+            other: Statistics of further entries, e.g. computed in a worker
+        """
+        if not isinstance(other, StandardStatsAccumulator):
+            raise TypeError(f"Cannot merge {type(other).__name__} into StandardStatsAccumulator")
+        
+        self.total_lines += other.total_lines
+        self.level_counts.update(other.level_counts)
+        self.pattern_counts.update(other.pattern_counts)
+        self.timestamp_counts.update(other.timestamp_counts)
+        self.message_counts.update(other.message_counts)
+        if self._message_capacity and len(self.message_counts) > 2 * self._message_capacity:
+            self._prune_messages()
+    
+    def summary(self) -> StatsSummary:
+        """
+        Build a summary of everything added so far.
+        
+        Returns:
+            Statistics summary
+        """
+        return StatsSummary(
+            total_lines=self.total_lines,
+            level_counts=self._collect_level_counts(),
+            pattern_counts=dict(self.pattern_counts),
+            time_groups=self._collect_time_groups(),
+            top_messages=self.message_counts.most_common(self._top_n),
+        )
+    
+    def _collect_level_counts(self) -> Dict[str, int]:
+        """
+        Build level counts by name from the per-level counts.
+        
+        Returns:
+            Entry counts by level name, in first-seen order
+        """
+        level_counts: Dict[str, int] = {}
+        for level, count in self.level_counts.items():
+            name = LEVEL_NAMES.get(level, level)
+            level_counts[name] = level_counts.get(name, 0) + count
+        return level_counts
+    
+    def _prune_messages(self) -> Counter[str]:
+        """
+        Drop all but the most frequent message candidates.
+        
+        Survivors keep their first-seen order, so ties in the top messages
+        still resolve the same way as with the full counter.
+        
+        Returns:
+            The pruned message counter
+        """
+        keep = {message for message, _ in self.message_counts.most_common(self._message_capacity)}
+        self.message_counts = Counter({
+            message: count for message, count in self.message_counts.items() if message in keep
+        })
+        return self.message_counts
+    
+    def _collect_time_groups(self) -> Dict[str, int]:
+        """
+        Build time group counts from the per-timestamp counts.
+        
+        Each distinct timestamp is formatted with strftime only once over the
+        accumulator's lifetime, instead of once per entry.
+        
+        Returns:
+            Entry counts by time grouping key
+        """
+        time_groups: Counter[str] = Counter()
+        if self.timestamp_counts:
+            time_format = TIME_GROUP_FORMATS[self._interval]
+            keys = self._time_group_keys
+            for timestamp, count in self.timestamp_counts.items():
+                key = keys.get(timestamp)
+                if key is None:
+                    moment = timestamp[0] if isinstance(timestamp, tuple) else timestamp
+                    key = keys[timestamp] = moment.strftime(time_format)
+                time_groups[key] += count
+        return dict(time_groups)
@@ -5,12 +5,173 @@ This module contains concrete implementations for reading log files
 with support for compression, streaming, and following files.
 """
 
+import bz2
 import gzip
-import time
-from pathlib import Path
-from typing import Iterator
+import lzma
+import os
+from functools import lru_cache
+from typing import BinaryIO, Dict, Iterator, List, Optional, TextIO, Tuple
 
 from pogtool.core.interfaces import FileReader
+from pogtool.watchers import PollingWatcher, create_watcher
+
+try:
+    # ISA-L's igzip inflates gzip data several times faster than zlib
+    from isal import igzip as fast_gzip
+except ImportError:
+    fast_gzip = gzip
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Compression format implied by a file name extension
+_COMPRESSED_EXTENSIONS: Dict[str, str] = {
+    '.gz': 'gzip',
+    '.gzip': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'xz',
+    '.zst': 'zstd',
+}
+
+# Leading bytes identifying each compression format (bzip2's "BZh" is
+# followed by a block size digit, checked separately)
+_COMPRESSION_MAGIC: Tuple[Tuple[bytes, str], ...] = (
+    (b'\x1f\x8b', 'gzip'),
+    (b'\xfd7zXZ\x00', 'xz'),
+    (b'\x28\xb5\x2f\xfd', 'zstd'),
+    (b'BZh', 'bz2'),
+)
+_MAGIC_PROBE_BYTES = 6
+_MIN_MAGIC_BYTES = 2
+
+# Skips access-time updates while reading; Linux only allows it on files the
+# caller owns, so opening falls back to plain flags otherwise
+_O_NOATIME = getattr(os, 'O_NOATIME', 0)
+
+
+def _open_for_reading(file_path: str, flags: int) -> int:
+    """
+    Opener for open() used when reading a log file.
+    
+    Avoids access-time writes where allowed and tells the kernel the file
+    will be read sequentially, so it reads ahead more aggressively.
+    
+    Args:
+        file_path: Path of the file to open
+        flags: Flags chosen by open()
+        
+    Returns:
+        Open file descriptor
+    """
+    if _O_NOATIME:
+        try:
+            fd = os.open(file_path, flags | _O_NOATIME)
+        except PermissionError:
+            fd = os.open(file_path, flags)
+    else:
+        fd = os.open(file_path, flags)
+    
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            # Advice is optional (e.g. not supported for pipes)
+            pass
+    return fd
+
+
+def _stat_existing(file_path: str) -> os.stat_result:
+    """
+    Stat a file that is about to be read.
+    
+    Args:
+        file_path: Path of the file
+        
+    Returns:
+        Result of ``os.stat``, for callers that need size or mtime
+        
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    try:
+        return os.stat(file_path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"File not found: {file_path}") from None
+
+
+def _compression_from_extension(file_path: str) -> Optional[str]:
+    """Compression format implied by a file's extension, if any."""
+    return _COMPRESSED_EXTENSIONS.get(os.path.splitext(file_path)[1].lower())
+
+
+def _compression_from_magic(file_path: str, stat: Optional[os.stat_result] = None) -> Optional[str]:
+    """Compression format identified by a file's magic bytes (None if unreadable)."""
+    if stat is None:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+    if stat.st_size < _MIN_MAGIC_BYTES:
+        # Too short to hold any magic bytes; no need to open it
+        return None
+    return _probe_magic(file_path, stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=1024)
+def _probe_magic(file_path: str, size: int, mtime_ns: int) -> Optional[str]:
+    """
+    Read a file's magic bytes, memoized per path and version of the file.
+    
+    Size and modification time are part of the cache key only so that a
+    rewritten file is probed again.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            head = f.read(_MAGIC_PROBE_BYTES)
+    except OSError:
+        return None
+    
+    for magic, compression in _COMPRESSION_MAGIC:
+        if head.startswith(magic):
+            if compression == 'bz2' and not head[3:4].isdigit():
+                # Plain text that merely starts with "BZh"
+                return None
+            return compression
+    return None
+
+
+def _read_compressed(file_path: str, compression: str) -> Iterator[str]:
+    """
+    Read decoded text lines from a compressed file.
+    
+    Args:
+        file_path: Path of the file
+        compression: Compression format ('gzip', 'bz2', 'xz' or 'zstd')
+        
+    Yields:
+        Lines of the decompressed content
+        
+    Raises:
+        ValueError: If the format cannot be read (zstd without zstandard)
+    """
+    if compression == 'gzip':
+        open_text = fast_gzip.open
+    elif compression == 'bz2':
+        open_text = bz2.open
+    elif compression == 'xz':
+        open_text = lzma.open
+    elif compression == 'zstd':
+        if zstandard is None:
+            raise ValueError(f"Reading zstd-compressed {file_path} requires the 'zstandard' package")
+        open_text = zstandard.open
+    else:
+        raise ValueError(f"Unsupported compression: {compression}")
+    
+    with open(file_path, 'rb', opener=_open_for_reading) as raw:
+        with open_text(raw, 'rt', encoding='utf-8', errors='replace') as f:
+            yield from f
 
 
 class StandardFileReader(FileReader):
@@ -27,33 +188,77 @@ class StandardFileReader(FileReader):
         Yields:
             Lines from the file
         """
-        path = Path(file_path)
-        
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+        # Opening reports a missing file; no separate stat is needed
+        try:
+            f = open(file_path, 'r', encoding='utf-8', errors='replace', opener=_open_for_reading)
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(f"File not found: {file_path}") from None
         
-        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+        with f:
             # Read existing content
-            for line in f:
-                yield line
+            yield from f
             
             # Follow mode: keep reading new lines
             if follow:
                 f.seek(0, 2)  # Seek to end of file
-                while True:
-                    line = f.readline()
-                    if line:
-                        yield line
-                    else:
-                        time.sleep(0.1)  # Short sleep to avoid busy waiting
+                yield from self._follow(f, file_path)
     
     def supports_compression(self) -> bool:
         """Whether this reader supports compressed files."""
         return False
+    
+    def _follow(self, f: TextIO, file_path: str) -> Iterator[str]:
+        """
+        Yield lines appended to an open file, blocking until it changes.
+        
+        Waits on a file watcher (inotify on Linux) instead of sleeping, so new
+        lines are delivered as soon as they are written and an idle file costs
+        no wakeups. If the file is replaced (rotated), the new file is read
+        from the beginning.
+        
+        Args:
+            f: File opened in text mode, positioned where following starts
+            file_path: Path of the file
+            
+        Yields:
+            Appended lines
+        """
+        watcher = create_watcher([file_path])
+        # The watcher timeout only bounds how long a missed event can delay
+        # a read; polling needs the short interval for responsiveness
+        timeout = 0.1 if isinstance(watcher, PollingWatcher) else 1.0
+        current = f
+        
+        try:
+            while True:
+                # Drain everything appended so far through the file
+                # iterator rather than one readline() call per line
+                yield from current
+                
+                if self._is_replaced(current, file_path):
+                    if current is not f:
+                        current.close()
+                    current = open(file_path, 'r', encoding='utf-8', errors='replace', opener=_open_for_reading)
+                    continue
+                
+                watcher.wait(timeout)
+        finally:
+            watcher.close()
+            if current is not f:
+                current.close()
+    
+    @staticmethod
+    def _is_replaced(f: TextIO, file_path: str) -> bool:
+        """Whether the path now refers to a different file than the open one."""
+        try:
+            return os.stat(file_path).st_ino != os.fstat(f.fileno()).st_ino
+        except FileNotFoundError:
+            # Moved away and not recreated yet; keep reading the old file
+            return False
 
 
 class CompressedFileReader(FileReader):
-    """File reader that supports gzip compressed files."""
+    """File reader that supports gzip, bzip2, xz and zstd compressed files."""
     
     def read_lines(self, file_path: str, follow: bool = False) -> Iterator[str]:
         """
@@ -66,51 +271,37 @@ class CompressedFileReader(FileReader):
         Yields:
             Lines from the file
         """
-        path = Path(file_path)
-        
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+        stat = _stat_existing(file_path)
         
         if follow:
             raise NotImplementedError("Follow mode is not supported for compressed files")
         
-        # Determine if file is compressed by extension or magic bytes
-        is_compressed = (
-            file_path.endswith('.gz') or 
-            file_path.endswith('.gzip') or
-            self._is_gzip_file(file_path)
-        )
-        
-        if is_compressed:
-            with gzip.open(file_path, 'rt', encoding='utf-8', errors='replace') as f:
-                for line in f:
-                    yield line
+        # Determine the compression by extension or magic bytes
+        compression = _compression_from_extension(file_path) or self._detect_format(file_path, stat)
+        
+        if compression:
+            yield from _read_compressed(file_path, compression)
         else:
             # Fall back to standard reading
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                for line in f:
-                    yield line
+            with open(file_path, 'r', encoding='utf-8', errors='replace', opener=_open_for_reading) as f:
+                yield from f
     
     def supports_compression(self) -> bool:
         """Whether this reader supports compressed files."""
         return True
     
-    def _is_gzip_file(self, file_path: str) -> bool:
+    def _detect_format(self, file_path: str, stat: Optional[os.stat_result] = None) -> Optional[str]:
         """
-        Check if file is gzip compressed by reading magic bytes.
+        Detect a file's compression format by reading its magic bytes.
         
         Args:
             file_path: Path to the file to check
+            stat: Result of ``os.stat`` for the file, if already known
             
         Returns:
-            True if file appears to be gzip compressed
+            Compression format ('gzip', 'bz2', 'xz' or 'zstd'), or None
         """
-        try:
-            with open(file_path, 'rb') as f:
-                magic = f.read(2)
-                return magic == b'\x1f\x8b'
-        except (OSError, IOError):
-            return False
+        return _compression_from_magic(file_path, stat)
 
 
 class MultiFileReader(FileReader):
@@ -136,13 +327,15 @@ class MultiFileReader(FileReader):
         Yields:
             Lines from the file
         """
-        # Check if file appears to be compressed
-        if self._is_compressed_file(file_path):
-            if follow:
-                # Can't follow compressed files, so fall back to standard reader
-                yield from self._standard_reader.read_lines(file_path, follow=False)
-            else:
-                yield from self._compressed_reader.read_lines(file_path, follow=False)
+        # One stat serves both the existence check and magic-byte detection
+        stat = _stat_existing(file_path)
+        
+        compression = self._detect_compression(file_path, stat)
+        if compression:
+            # Compressed files can't be followed, so they are read once.
+            # Detection is done; read them directly rather than through the
+            # compressed reader, which would detect the format again
+            yield from _read_compressed(file_path, compression)
         else:
             yield from self._standard_reader.read_lines(file_path, follow=follow)
     
@@ -160,16 +353,125 @@ class MultiFileReader(FileReader):
         Returns:
             True if file appears to be compressed
         """
-        # Check by extension first
-        compressed_extensions = {'.gz', '.gzip', '.bz2', '.xz'}
-        path = Path(file_path)
-        if path.suffix.lower() in compressed_extensions:
-            return True
+        return self._detect_compression(file_path) is not None
+    
+    def _detect_compression(
+        self,
+        file_path: str,
+        stat: Optional[os.stat_result] = None,
+    ) -> Optional[str]:
+        """
+        Detect a file's compression format.
+        
+        The extension decides when it names a compressed format; otherwise
+        the magic bytes are checked.
+        
+        Args:
+            file_path: Path to the file to check
+            stat: Result of ``os.stat`` for the file, if already known
+            
+        Returns:
+            Compression format ('gzip', 'bz2', 'xz' or 'zstd'), or None for
+            plain text
+        """
+        return _compression_from_extension(file_path) or _compression_from_magic(file_path, stat)
+
+
+class FileTailer:
+    """
+    Incremental reader for a file being followed.
+    
+    Keeps the file open and remembers how many bytes have been consumed, so
+    each poll reads only what was appended since the previous one instead
+    of re-parsing the whole file. A partial trailing line is held back until
+    its newline arrives. Truncation and rotation (a new file at the same
+    path) restart reading from the beginning.
+    """
+    
+    def __init__(self, path: str) -> None:
+        """
+        Initialize the tail state for a file without opening it.
+        
+        Args:
+            path: Path of the file to follow
+        """
+        self.path = path
+        self._handle: Optional[BinaryIO] = None
+        self._inode = 0
+        self._offset = 0
+        self._pending = b""
+        self._signature: Optional[Tuple[int, int, int]] = None
+    
+    def open(self, at_end: bool) -> None:
+        """
+        (Re)open the file.
+        
+        Args:
+            at_end: Start after the existing content instead of at the beginning
+        """
+        handle = open(self.path, 'rb')
+        stat = os.fstat(handle.fileno())
+        self.close()
+        self._handle = handle
+        self._inode = stat.st_ino
+        self._offset = stat.st_size if at_end else 0
+        self._pending = b""
+    
+    def close(self) -> None:
+        """Close the underlying file handle, if open."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+    
+    def read_new_lines(self) -> List[str]:
+        """
+        Read the complete lines appended since the last call.
+        
+        Returns:
+            Newly appended lines, without their trailing newline
+        """
+        if self._handle is None:
+            # The file could not be opened at startup; take all of it now
+            self.open(at_end=False)
         
-        # Check by magic bytes for gzip
         try:
-            with open(file_path, 'rb') as f:
-                magic = f.read(2)
-                return magic == b'\x1f\x8b'
-        except (OSError, IOError):
-            return False
\ No newline at end of file
+            stat: Optional[os.stat_result] = os.stat(self.path)
+        except FileNotFoundError:
+            # Moved away and not recreated yet; keep reading the old file
+            stat = None
+        
+        if stat is not None:
+            # Same file, size and mtime as last time: nothing can be new, so
+            # skip reading altogether (the common case for idle files)
+            signature = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+            if signature == self._signature:
+                return []
+            self._signature = signature
+        
+        lines = self._read_appended()
+        
+        if stat is not None and stat.st_ino != self._inode:
+            self.open(at_end=False)
+            lines.extend(self._read_appended())
+        
+        return lines
+    
+    def _read_appended(self) -> List[str]:
+        """Read and split the bytes between the stored offset and end of file."""
+        assert self._handle is not None
+        size = os.fstat(self._handle.fileno()).st_size
+        
+        if size < self._offset:
+            # Truncated in place (e.g. copytruncate rotation)
+            self._offset = 0
+            self._pending = b""
+        
+        if size == self._offset:
+            return []
+        
+        self._handle.seek(self._offset)
+        data = self._handle.read(size - self._offset)
+        self._offset += len(data)
+        
+        *complete, self._pending = (self._pending + data).split(b"\n")
+        return [line.decode('utf-8', errors='replace') for line in complete]
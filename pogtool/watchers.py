@@ -0,0 +1,168 @@
+"""
+File change watchers used by follow modes.
+
+This module contains strategies for waiting until followed files may have
+changed: an inotify-based watcher on Linux and a plain polling fallback
+everywhere else.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from typing import Dict, List, Set, Tuple, Union
+
+
+class PollingWatcher:
+    """Watcher that simply sleeps and reports every file as possibly changed."""
+    
+    def __init__(self, paths: List[str]) -> None:
+        """
+        Initialize the watcher.
+        
+        Args:
+            paths: Paths of the files being followed
+        """
+        self._paths = set(paths)
+    
+    def wait(self, timeout: float) -> Set[str]:
+        """
+        Wait until followed files may have changed.
+        
+        Args:
+            timeout: Maximum number of seconds to wait
+        
+        Returns:
+            Paths that may have changed
+        """
+        time.sleep(timeout)
+        return set(self._paths)
+    
+    def close(self) -> None:
+        """Release watcher resources."""
+        pass
+
+
+class InotifyWatcher:
+    """
+    Watcher that wakes up as soon as a followed file is written to.
+    
+    Watches the directory of each followed file rather than the file itself,
+    so a file that is rotated (renamed away and recreated) is still noticed.
+    """
+    
+    IN_MODIFY = 0x00000002
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_NONBLOCK = os.O_NONBLOCK
+    IN_CLOEXEC = getattr(os, 'O_CLOEXEC', 0o2000000)
+    
+    _EVENT_HEADER = struct.Struct('iIII')
+    
+    def __init__(self, paths: List[str]) -> None:
+        """
+        Create an inotify instance with a watch on each followed directory.
+        
+        Args:
+            paths: Paths of the files being followed
+        
+        Raises:
+            OSError: If inotify is unavailable or a watch cannot be added
+        """
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        
+        self._fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        
+        # (directory, file name) -> followed path, and watch descriptor -> directory
+        self._paths: Dict[Tuple[str, str], str] = {}
+        self._directories: Dict[int, str] = {}
+        
+        try:
+            watched: Dict[str, int] = {}
+            for path in paths:
+                directory, name = os.path.split(os.path.abspath(path))
+                self._paths[(directory, name)] = path
+                if directory not in watched:
+                    watched[directory] = self._watch(directory)
+                    self._directories[watched[directory]] = directory
+        except OSError:
+            self.close()
+            raise
+    
+    def _watch(self, directory: str) -> int:
+        """Add a watch for writes and renames in a directory."""
+        mask = self.IN_MODIFY | self.IN_MOVED_TO | self.IN_CREATE
+        wd = self._add_watch(self._fd, os.fsencode(directory), mask)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), directory)
+        return int(wd)
+    
+    def wait(self, timeout: float) -> Set[str]:
+        """
+        Wait until a followed file changes or the timeout expires.
+        
+        Args:
+            timeout: Maximum number of seconds to wait
+        
+        Returns:
+            Paths of followed files that changed (empty on timeout)
+        """
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+        
+        changed: Set[str] = set()
+        header_size = self._EVENT_HEADER.size
+        while True:
+            try:
+                data = os.read(self._fd, 4096)
+            except BlockingIOError:
+                break
+            
+            offset = 0
+            while offset + header_size <= len(data):
+                wd, _mask, _cookie, length = self._EVENT_HEADER.unpack_from(data, offset)
+                offset += header_size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                
+                directory = self._directories.get(wd)
+                path = self._paths.get((directory, os.fsdecode(name))) if directory else None
+                if path is not None:
+                    changed.add(path)
+        
+        return changed
+    
+    def close(self) -> None:
+        """Close the inotify file descriptor."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(paths: List[str]) -> Union[InotifyWatcher, PollingWatcher]:
+    """
+    Create the best available watcher for the current platform.
+    
+    Args:
+        paths: Paths of the files being followed
+    
+    Returns:
+        An inotify watcher on Linux, otherwise a polling watcher
+    """
+    if sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(paths)
+        except (OSError, AttributeError):
+            # No usable libc/inotify (e.g. exhausted watch limit); fall back
+            pass
+    return PollingWatcher(paths)
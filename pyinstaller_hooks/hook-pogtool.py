@@ -0,0 +1,11 @@
+"""
+PyInstaller hook for pogtool.
+
+Subcommands, formatters and parsers are imported lazily at runtime, so
+PyInstaller's static analysis cannot see them. Collect every submodule once
+here instead of listing them as hidden imports in the build script.
+"""
+
+from PyInstaller.utils.hooks import collect_submodules
+
+hiddenimports = collect_submodules("pogtool")
@@ -0,0 +1,120 @@
+"""
+Shared pytest fixtures.
+
+Parsers, processors and formatters are stateless, so one instance of each
+serves the whole session instead of being rebuilt (and their regexes
+recompiled) in every test.
+"""
+
+import re
+
+import pytest
+
+from pogtool.core.models import LogEntry, LogLevel, StatsSummary
+from pogtool.formatters.text import TextFormatter
+from pogtool.parsers.generic import GenericLogParser
+from pogtool.processors import StandardLogProcessor
+
+# Opening lines shared by the sample files of the command tests
+_LOG_HEAD = """2024-01-01 10:00:00 INFO Application started
+2024-01-01 10:00:01 DEBUG Loading configuration
+2024-01-01 10:00:02 ERROR Failed to connect to database
+2024-01-01 10:00:03 WARN Retrying connection
+2024-01-01 10:00:04 INFO Connected successfully
+"""
+
+
+@pytest.fixture(scope="session")
+def generic_parser():
+    """Shared GenericLogParser."""
+    return GenericLogParser()
+
+
+@pytest.fixture(scope="session")
+def std_processor():
+    """Shared StandardLogProcessor."""
+    return StandardLogProcessor()
+
+
+@pytest.fixture(scope="session")
+def text_formatter():
+    """Shared TextFormatter without colors."""
+    return TextFormatter(use_colors=False)
+
+
+@pytest.fixture(scope="session")
+def sample_stats():
+    """Statistics summary shared by formatter tests (treat as read-only)."""
+    return StatsSummary(
+        total_lines=100,
+        level_counts={"INFO": 70, "ERROR": 30},
+        pattern_counts={"timeout": 5},
+        time_groups={"2023-09-09 23:20": 10},
+        top_messages=[("Test message", 5)]
+    )
+
+
+@pytest.fixture(scope="session")
+def compare_log_files(tmp_path_factory):
+    """
+    Two slightly different log files for compare tests (treat as read-only).
+    
+    Tests that append to their inputs, like the follow tests, create their
+    own files instead.
+    """
+    log_dir = tmp_path_factory.mktemp("compare_logs")
+    old_log = log_dir / "old.log"
+    new_log = log_dir / "new.log"
+    old_log.write_text(_LOG_HEAD + """2024-01-01 10:00:05 ERROR DummyISTT error occurred
+2024-01-01 10:00:06 INFO Processing request
+""")
+    new_log.write_text(_LOG_HEAD + """2024-01-01 10:00:05 ERROR Different error occurred
+2024-01-01 10:00:06 INFO Processing request
+2024-01-01 10:00:07 INFO New log entry
+""")
+    return str(old_log), str(new_log)
+
+
+@pytest.fixture(scope="session")
+def stats_log_file(tmp_path_factory):
+    """Log file for stats tests, three lines mentioning DummyISTT (treat as read-only)."""
+    log_file = tmp_path_factory.mktemp("stats_logs") / "app.log"
+    log_file.write_text(_LOG_HEAD + """2024-01-01 10:00:05 ERROR DummyISTT error occurred
+2024-01-01 10:00:06 INFO Processing request
+2024-01-01 10:00:07 DEBUG DummyISTT debug message
+2024-01-01 10:00:08 WARN Low memory warning
+2024-01-01 10:00:09 ERROR Another error
+2024-01-01 10:00:10 INFO DummyISTT info message
+""")
+    return str(log_file)
+
+
+@pytest.fixture
+def sample_entries():
+    """A small batch of parsed entries: two INFO messages and one ERROR."""
+    return [
+        LogEntry("Line 1", level=LogLevel.INFO, message="Info message"),
+        LogEntry("Line 2", level=LogLevel.ERROR, message="Error message"),
+        LogEntry("Line 3", level=LogLevel.INFO, message="Info message"),
+    ]
+
+
+@pytest.fixture
+def regex_compile_calls(monkeypatch):
+    """
+    Record the patterns compiled through the re module during a test.
+    
+    Hot paths should only use patterns compiled up front; anything going
+    through re's (bounded) pattern cache shows up here.
+    """
+    if not hasattr(re, "_compile"):
+        pytest.skip("re._compile is not available on this Python")
+    compiled = []
+    original = re._compile
+    
+    def recording_compile(pattern, flags):
+        compiled.append(pattern)
+        return original(pattern, flags)
+    
+    monkeypatch.setattr(re, "_compile", recording_compile)
+    return compiled
@@ -5,167 +5,113 @@ Tests the compare command CLI functionality with actual usage scenarios
 to ensure output content and structure are correct, similar to user examples.
 """
 
-import subprocess
-import tempfile
 import os
 import json
 import pytest
+from pathlib import Path
+from click.testing import CliRunner
 
+from pogtool.cli import cli
 
-class TestCompareCommand:
-    """Integration tests for the compare command CLI."""
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP1_LOG = os.path.join(REPO_ROOT, 'testlogs', 'app1.log')
+APP2_LOG = os.path.join(REPO_ROOT, 'testlogs', 'app2.log')
 
-    @pytest.fixture
-    def test_log_files(self):
-        """Create temporary test log files with sample data for comparison."""
-        test_log_content1 = """2024-01-01 10:00:00 INFO Application started
-2024-01-01 10:00:01 DEBUG Loading configuration
-2024-01-01 10:00:02 ERROR Failed to connect to database
-2024-01-01 10:00:03 WARN Retrying connection
-2024-01-01 10:00:04 INFO Connected successfully
-2024-01-01 10:00:05 ERROR DummyISTT error occurred
-2024-01-01 10:00:06 INFO Processing request
-"""
 
-        test_log_content2 = """2024-01-01 10:00:00 INFO Application started
-2024-01-01 10:00:01 DEBUG Loading configuration
-2024-01-01 10:00:02 ERROR Failed to connect to database
-2024-01-01 10:00:03 WARN Retrying connection
-2024-01-01 10:00:04 INFO Connected successfully
-2024-01-01 10:00:05 ERROR Different error occurred
-2024-01-01 10:00:06 INFO Processing request
-2024-01-01 10:00:07 INFO New log entry
-"""
+@pytest.fixture(scope="module")
+def runner():
+    """Click runner invoking the CLI in-process (no interpreter startup per test)."""
+    return CliRunner()
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f1:
-            f1.write(test_log_content1)
-            temp_path1 = f1.name
-            
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f2:
-            f2.write(test_log_content2)
-            temp_path2 = f2.name
-        
-        yield temp_path1, temp_path2
-        
-        # Cleanup
-        os.unlink(temp_path1)
-        os.unlink(temp_path2)
 
-    def test_basic_compare(self, test_log_files):
+class TestCompareCommand:
+    """Integration tests for the compare command CLI."""
+
+    def test_basic_compare(self, runner, compare_log_files):
         """Test basic comparison between two log files."""
-        file1, file2 = test_log_files
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'compare', file1, file2], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
+        file1, file2 = compare_log_files
+        result = runner.invoke(cli, ['compare', file1, file2])
         
-        assert result.returncode == 0
+        assert result.exit_code == 0
         # Should show differences between the files
         assert len(result.stdout) > 0
 
-    def test_compare_with_only_filter(self, test_log_files):
+    def test_compare_with_only_filter(self, runner, compare_log_files):
         """Test comparison with --only flag to filter by log level."""
-        file1, file2 = test_log_files
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'compare', file1, file2, '--only', 'ERROR'], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
+        file1, file2 = compare_log_files
+        result = runner.invoke(cli, ['compare', file1, file2, '--only', 'ERROR'])
         
-        assert result.returncode == 0
+        assert result.exit_code == 0
         # Should show differences only in ERROR lines
         assert len(result.stdout) > 0
 
-    def test_compare_ignore_timestamps(self, test_log_files):
+    def test_compare_ignore_timestamps(self, runner, compare_log_files):
         """Test comparison with --ignore-timestamps flag."""
-        file1, file2 = test_log_files
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'compare', file1, file2, '--ignore-timestamps'], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
+        file1, file2 = compare_log_files
+        result = runner.invoke(cli, ['compare', file1, file2, '--ignore-timestamps'])
         
-        assert result.returncode == 0
+        assert result.exit_code == 0
         assert len(result.stdout) > 0
 
-    def test_compare_with_color(self, test_log_files):
+    def test_compare_with_color(self, runner, compare_log_files):
         """Test comparison with --color flag."""
-        file1, file2 = test_log_files
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'compare', file1, file2, '--color'], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
+        file1, file2 = compare_log_files
+        result = runner.invoke(cli, ['compare', file1, file2, '--color'])
         
-        assert result.returncode == 0
+        assert result.exit_code == 0
         assert len(result.stdout) > 0
 
-    def test_compare_with_summary(self, test_log_files):
+    def test_compare_with_summary(self, runner, compare_log_files):
         """Test comparison with --summary flag."""
-        file1, file2 = test_log_files
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'compare', file1, file2, '--summary'], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
+        file1, file2 = compare_log_files
+        result = runner.invoke(cli, ['compare', file1, file2, '--summary'])
         
-        assert result.returncode == 0
+        assert result.exit_code == 0
         assert "Comparison Summary:" in result.stdout
         assert "Added lines:" in result.stdout
         assert "Removed lines:" in result.stdout
         assert "Modified lines:" in result.stdout
         assert "Common lines:" in result.stdout
 
-    def test_compare_with_json_output(self, test_log_files):
+    def test_compare_with_json_output(self, runner, compare_log_files):
         """Test comparison with --json flag for JSON output."""
-        file1, file2 = test_log_files
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'compare', file1, file2, '--json'], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
+        file1, file2 = compare_log_files
+        result = runner.invoke(cli, ['compare', file1, file2, '--json'])
         
-        assert result.returncode == 0
+        assert result.exit_code == 0
         # Should produce JSON output (basic check for structure)
         assert len(result.stdout) > 0
 
-    def test_compare_with_fuzzy_matching(self, test_log_files):
+    def test_compare_with_fuzzy_matching(self, runner, compare_log_files):
         """Test comparison with --fuzzy flag for fuzzy matching."""
-        file1, file2 = test_log_files
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'compare', file1, file2, '--fuzzy'], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
+        file1, file2 = compare_log_files
+        result = runner.invoke(cli, ['compare', file1, file2, '--fuzzy'])
         
-        assert result.returncode == 0
+        assert result.exit_code == 0
         assert len(result.stdout) > 0
 
-    def test_compare_combined_flags(self, test_log_files):
+    def test_compare_combined_flags(self, runner, compare_log_files):
         """Test comparison with multiple flags combined."""
-        file1, file2 = test_log_files
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'compare', file1, file2, '--only', 'ERROR', '--summary'], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
+        file1, file2 = compare_log_files
+        result = runner.invoke(cli, ['compare', file1, file2, '--only', 'ERROR', '--summary'])
         
-        assert result.returncode == 0
+        assert result.exit_code == 0
         assert "Comparison Summary:" in result.stdout
 
-    def test_compare_nonexistent_files(self):
+    def test_compare_nonexistent_files(self, runner):
         """Test comparison with non-existent files returns error."""
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'compare', 'nonexistent1.log', 'nonexistent2.log'], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
+        result = runner.invoke(cli, ['compare', 'nonexistent1.log', 'nonexistent2.log'])
         
         # Should fail with appropriate error code and message
-        assert result.returncode == 2  # CLI validation error
+        assert result.exit_code == 2  # CLI validation error
         assert "does not exist" in result.stderr
 
-    def test_compare_actual_usage_basic_output_structure(self):
+    def test_compare_actual_usage_basic_output_structure(self, runner):
         """Test actual usage: validate basic output structure and content."""
         # Use real test log files
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'compare', 'testlogs/app1.log', 'testlogs/app2.log'], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
+        result = runner.invoke(cli, ['compare', APP1_LOG, APP2_LOG])
         
-        assert result.returncode == 0
+        assert result.exit_code == 0
         output = result.stdout
         
         # Validate output structure
@@ -182,14 +128,11 @@ class TestCompareCommand:
         assert "WebServer] Server starting on port 8080" in output
         assert "EmailService] Email service initialized" in output
 
-    def test_compare_actual_usage_json_output(self):
+    def test_compare_actual_usage_json_output(self, runner):
         """Test actual usage: validate JSON output structure and content."""
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'compare', 'testlogs/app1.log', 'testlogs/app2.log', '--json'], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
+        result = runner.invoke(cli, ['compare', APP1_LOG, APP2_LOG, '--json'])
         
-        assert result.returncode == 0
+        assert result.exit_code == 0
         
         # Parse and validate JSON structure
         try:
@@ -218,14 +161,11 @@ class TestCompareCommand:
         assert data["summary"]["removed_lines"] > 0
         assert data["summary"]["has_differences"] is True
 
-    def test_compare_actual_usage_only_filter(self):
+    def test_compare_actual_usage_only_filter(self, runner):
         """Test actual usage: validate --only filter works correctly."""
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'compare', 'testlogs/app1.log', 'testlogs/app2.log', '--only', 'ERROR'], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
+        result = runner.invoke(cli, ['compare', APP1_LOG, APP2_LOG, '--only', 'ERROR'])
         
-        assert result.returncode == 0
+        assert result.exit_code == 0
         output = result.stdout
         
         # Should only show ERROR level differences
@@ -238,14 +178,11 @@ class TestCompareCommand:
             if any(keyword in line for keyword in ['WebServer', 'Database', 'Auth', 'EmailService', 'FileManager', 'Security']):
                 assert "ERROR" in line
 
-    def test_compare_actual_usage_summary_only(self):
+    def test_compare_actual_usage_summary_only(self, runner):
         """Test actual usage: validate --summary flag shows only summary."""
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'compare', 'testlogs/app1.log', 'testlogs/app2.log', '--summary'], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
+        result = runner.invoke(cli, ['compare', APP1_LOG, APP2_LOG, '--summary'])
         
-        assert result.returncode == 0
+        assert result.exit_code == 0
         output = result.stdout
         
         # Should show summary
@@ -261,14 +198,11 @@ class TestCompareCommand:
         assert "Removed Lines:" not in output
         assert "WebServer] Server starting" not in output
 
-    def test_compare_actual_usage_identical_files(self):
+    def test_compare_actual_usage_identical_files(self, runner):
         """Test actual usage: validate behavior with identical files."""
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'compare', 'testlogs/app1.log', 'testlogs/app1.log'], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
+        result = runner.invoke(cli, ['compare', APP1_LOG, APP1_LOG])
         
-        assert result.returncode == 0
+        assert result.exit_code == 0
         output = result.stdout
         
         # Should show no differences
@@ -281,7 +215,7 @@ class TestCompareCommand:
         assert "Added Lines:" not in output
         assert "Removed Lines:" not in output
 
-    def test_compare_actual_usage_ignore_timestamps(self):
+    def test_compare_actual_usage_ignore_timestamps(self, runner, tmp_path):
         """Test actual usage: validate --ignore-timestamps works correctly."""
         # Create two files with same content but different timestamps
         content1 = """2024-01-01 10:00:01 INFO Test message
@@ -290,33 +224,42 @@ class TestCompareCommand:
         content2 = """2024-12-25 15:30:45 INFO Test message
 2024-12-25 15:30:46 ERROR Test error"""
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f1:
-            f1.write(content1)
-            temp_path1 = f1.name
-            
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f2:
-            f2.write(content2)
-            temp_path2 = f2.name
+        temp_path1 = str(tmp_path / "input1.log")
+        Path(temp_path1).write_text(content1)
         
-        try:
-            # Without ignore-timestamps should show differences
-            result_with_timestamps = subprocess.run(
-                ['python3', 'pogtool.py', 'compare', temp_path1, temp_path2], 
-                capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-            )
-            
-            # With ignore-timestamps should show no differences
-            result_ignore_timestamps = subprocess.run(
-                ['python3', 'pogtool.py', 'compare', temp_path1, temp_path2, '--ignore-timestamps'], 
-                capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-            )
-            
-            # With timestamps, should show differences
-            assert "Total differences: 4" in result_with_timestamps.stdout
-            
-            # Without timestamps, should show no differences (or fewer)
-            assert "Total differences: 0" in result_ignore_timestamps.stdout
-            
-        finally:
-            os.unlink(temp_path1)
-            os.unlink(temp_path2)
\ No newline at end of file
+        temp_path2 = str(tmp_path / "input2.log")
+        Path(temp_path2).write_text(content2)
+        
+        # Without ignore-timestamps should show differences
+        result_with_timestamps = runner.invoke(cli, ['compare', temp_path1, temp_path2])
+        
+        # With ignore-timestamps should show no differences
+        result_ignore_timestamps = runner.invoke(cli, ['compare', temp_path1, temp_path2, '--ignore-timestamps'])
+        
+        # With timestamps, should show differences
+        assert "Total differences: 4" in result_with_timestamps.stdout
+        
+        # Without timestamps, should show no differences (or fewer)
+        assert "Total differences: 0" in result_ignore_timestamps.stdout
+
+    @pytest.mark.parametrize("extra_args", [[], ['--summary']])
+    def test_compare_empty_files_with_only_filter(self, runner, tmp_path, extra_args):
+        """Test that empty inputs are reported as such even with --only."""
+        empty_log = tmp_path / "empty.log"
+        empty_log.write_text("")
+        
+        result = runner.invoke(cli, ['compare', str(empty_log), str(empty_log), '--only', 'ERROR', *extra_args])
+        
+        assert result.exit_code == 0
+        assert "No log entries found in either file" in result.stdout
+
+    def test_compare_only_filter_without_matches(self, runner, tmp_path):
+        """Test that inputs with no lines at the --only level give an empty comparison."""
+        info_log = tmp_path / "info.log"
+        info_log.write_text("2024-01-01 10:00:00 INFO Application started\n")
+        
+        result = runner.invoke(cli, ['compare', str(info_log), str(info_log), '--only', 'ERROR', '--summary'])
+        
+        assert result.exit_code == 0
+        assert "No log entries found" not in result.stdout
+        assert "Total differences:    0" in result.stdout
@@ -5,14 +5,18 @@ These tests verify that the main components work correctly
 and can be integrated properly.
 """
 
+import hashlib
 import pytest
 from datetime import datetime
-from io import StringIO
 
+from pogtool.core.interfaces import Command, LogProcessor
 from pogtool.core.models import LogEntry, LogLevel, TimeInterval
 from pogtool.parsers.generic import GenericLogParser
 from pogtool.processors import StandardLogProcessor
-from pogtool.formatters.text import TextFormatter
+
+# Shared sample timestamps (datetimes are immutable)
+_TS = datetime(2023, 9, 9, 23, 45, 30)
+_TS_EARLIER = datetime(2023, 9, 9, 23, 20, 15)
 
 
 class TestLogEntry:
@@ -22,7 +26,7 @@ class TestLogEntry:
         """Test basic LogEntry creation and properties."""
         entry = LogEntry(
             raw_line="2023-09-09 23:20:15 [INFO] Application started",
-            timestamp=datetime(2023, 9, 9, 23, 20, 15),
+            timestamp=_TS_EARLIER,
             level=LogLevel.INFO,
             message="Application started"
         )
@@ -31,6 +35,8 @@ class TestLogEntry:
         assert entry.level == LogLevel.INFO
         assert entry.message == "Application started"
         assert entry.timestamp.year == 2023
+        assert entry.display == "Application started"
+        assert LogEntry(raw_line="Unparsed line").display == "Unparsed line"
     
     def test_log_entry_matches_level(self):
         """Test log level matching."""
@@ -42,6 +48,11 @@ class TestLogEntry:
         assert entry.matches_level("ERROR")
         assert entry.matches_level("error")
         assert not entry.matches_level("INFO")
+        
+        unparsed = LogEntry(raw_line="2023-09-09 23:20:15 error: Connection failed")
+        assert unparsed.matches_level("ERROR")
+        assert not unparsed.matches_level("warn")
+        assert unparsed.raw_upper == "2023-09-09 23:20:15 ERROR: CONNECTION FAILED"
     
     def test_log_entry_matches_pattern(self):
         """Test pattern matching."""
@@ -58,112 +69,277 @@ class TestLogEntry:
         """Test time grouping functionality."""
         entry = LogEntry(
             raw_line="Test line",
-            timestamp=datetime(2023, 9, 9, 23, 45, 30)
+            timestamp=_TS
         )
         
         assert entry.get_time_group(TimeInterval.MINUTE) == "2023-09-09 23:45"
         assert entry.get_time_group(TimeInterval.HOUR) == "2023-09-09 23:00"
         assert entry.get_time_group(TimeInterval.DAY) == "2023-09-09"
+    
+    def test_epoch(self):
+        """Test the cached epoch used for chronological ordering."""
+        assert LogEntry("Test line", timestamp=_TS).epoch == _TS.timestamp()
+        assert LogEntry("Test line").epoch == float('inf')
+    
+    def test_level_names(self):
+        """Test level lookups by member, including aliases."""
+        from pogtool.core.models import LEVEL_NAMES
+        
+        assert LEVEL_NAMES[LogLevel.WARNING] == "WARN"
+        assert LEVEL_NAMES[LogLevel.from_string("critical")] == "FATAL"
+        assert {LogLevel.ERROR: 1}[LogLevel["ERROR"]] == 1
+    
+    def test_iso_timestamp(self):
+        """Test cached ISO formatting keeps UTC offsets of equal instants apart."""
+        from datetime import timedelta, timezone
+        from pogtool.core.models import iso_timestamp
+        utc = datetime(2023, 9, 9, 12, 0, tzinfo=timezone.utc)
+        plus_one = datetime(2023, 9, 9, 13, 0, tzinfo=timezone(timedelta(hours=1)))
+        
+        assert iso_timestamp(_TS) == "2023-09-09T23:45:30"
+        assert iso_timestamp(utc) == "2023-09-09T12:00:00+00:00"
+        assert iso_timestamp(plus_one) == "2023-09-09T13:00:00+01:00"
+    
+    def test_extra_fields(self):
+        """Test entries share an empty extra_fields mapping until one is set."""
+        import pickle
+        entry = LogEntry("Test line")
+        other = LogEntry("Other line")
+        
+        assert entry.extra_fields == {}
+        entry.set_extra("user", "alice")
+        
+        assert entry.extra_fields == {"user": "alice"}
+        assert other.extra_fields == {}
+        assert pickle.loads(pickle.dumps(entry)) == entry
+        assert pickle.loads(pickle.dumps(other)) == other
+    
+    def test_with_message(self):
+        """Test that with_message copies the entry without modifying it."""
+        entry = LogEntry("Test line", message="original", source_file="app.log")
+        
+        tagged = entry.with_message("tagged")
+        
+        assert tagged.message == "tagged"
+        assert tagged.source_file == "app.log"
+        assert entry.message == "original"
+        assert tagged != entry
+        assert tagged.with_message("original") == entry
+    
+    def test_with_message_copies_extra_fields(self):
+        """Test that extra fields set on a copy stay off the original entry."""
+        entry = LogEntry("Test line", extra_fields={"user": "alice"})
+        
+        tagged = entry.with_message("tagged")
+        tagged.set_extra("tag", "x")
+        
+        assert entry.extra_fields == {"user": "alice"}
+        assert tagged.extra_fields == {"user": "alice", "tag": "x"}
+    
+    def test_unrepresentable_timestamp_sorts_last(self):
+        """Test that a timestamp without a POSIX equivalent still builds an entry."""
+        from dateutil.tz import tzoffset
+        entry = LogEntry("Test line", timestamp=datetime(2023, 9, 9, 23, 20, 15, tzinfo=tzoffset(None, 99 * 3600)))
+        
+        assert entry.epoch == float("inf")
 
 
 class TestGenericLogParser:
     """Test GenericLogParser functionality."""
     
-    def test_parse_simple_log(self):
+    def test_parse_simple_log(self, generic_parser):
         """Test parsing a simple log line."""
-        parser = GenericLogParser()
         line = "2023-09-09 23:20:15 [INFO] Application started successfully"
         
-        entry = parser.parse_line(line)
+        entry = generic_parser.parse_line(line)
         
         assert entry.raw_line == line
         assert entry.level == LogLevel.INFO
         assert entry.timestamp is not None
         assert "Application started" in entry.message
     
-    def test_parse_error_log(self):
+    def test_parse_error_log(self, generic_parser):
         """Test parsing an error log line."""
-        parser = GenericLogParser()
         line = "2023-09-09 23:20:15 ERROR: Database connection failed"
         
-        entry = parser.parse_line(line)
+        entry = generic_parser.parse_line(line)
         
         assert entry.raw_line == line
         assert entry.level == LogLevel.ERROR
         assert "Database connection failed" in entry.message
     
-    def test_parse_line_without_timestamp(self):
+    def test_parse_line_without_timestamp(self, generic_parser):
         """Test parsing a line without timestamp."""
-        parser = GenericLogParser()
         line = "[WARN] Memory usage is high"
         
-        entry = parser.parse_line(line)
+        entry = generic_parser.parse_line(line)
         
         assert entry.raw_line == line
         assert entry.level == LogLevel.WARN
         assert entry.timestamp is None
     
-    def test_can_parse_format(self):
+    @pytest.mark.parametrize("line, expected", [
+        ("2023-09-09T23:20:15.123Z [INFO] Started", "2023-09-09T23:20:15.123000+00:00"),
+        ("2023-09-09 23:20:15+02:00 [INFO] Started", "2023-09-09T23:20:15+02:00"),
+        ("10.0.0.1 - - [09/Sep/2023:23:20:15 -0130] \"GET /\" 200", "2023-09-09T23:20:15-01:30"),
+    ])
+    def test_parse_timestamp_formats(self, generic_parser, line, expected):
+        """Test timestamps parsed without dateutil keep their offsets."""
+        entry = generic_parser.parse_line(line)
+        
+        assert entry.timestamp.isoformat() == expected
+    
+    def test_parse_invalid_timestamp_falls_through(self, generic_parser):
+        """Test an impossible date falls through to the bare time of day."""
+        entry = generic_parser.parse_line("2023-02-30 10:00:00 [INFO] Bad date")
+        
+        assert entry.timestamp.date() == datetime.now().date()
+        assert (entry.timestamp.hour, entry.timestamp.minute) == (10, 0)
+    
+    def test_can_parse_format(self, generic_parser):
         """Test format detection capability."""
-        parser = GenericLogParser()
         sample_lines = [
             "2023-09-09 23:20:15 [INFO] Test line 1",
             "2023-09-09 23:20:16 [ERROR] Test line 2"
         ]
         
         # Generic parser should always return True
-        assert parser.can_parse_format(sample_lines)
+        assert generic_parser.can_parse_format(sample_lines)
+    
+    @pytest.mark.benchmark
+    def test_parse_line_benchmark(self, request, generic_parser):
+        """Benchmark parsing a batch of lines (run with ``pytest -m benchmark``)."""
+        pytest.importorskip("pytest_benchmark")
+        benchmark = request.getfixturevalue("benchmark")
+        lines = ["2023-09-09 23:20:15 [INFO] msg %d" % i for i in range(10000)]
+        
+        entries = benchmark(lambda: [generic_parser.parse_line(line) for line in lines])
+        
+        assert len(entries) == len(lines)
+    
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize("engine", ["re", "regex", "re2"])
+    def test_regex_engine_benchmark(self, request, monkeypatch, engine):
+        """Benchmark the parser's patterns on each regex engine (run with ``pytest -m benchmark``)."""
+        pytest.importorskip("pytest_benchmark")
+        pytest.importorskip(engine)
+        benchmark = request.getfixturevalue("benchmark")
+        monkeypatch.setenv("POGTOOL_REGEX_ENGINE", engine)
+        parser = GenericLogParser()
+        lines = [
+            "2023-09-09 23:20:%02d [%s] request %d handled" % (i % 60, ("INFO", "WARN", "ERROR")[i % 3], i)
+            for i in range(100000)
+        ]
+        
+        entries = benchmark(lambda: [parser.parse_line(line) for line in lines])
+        
+        assert parser.regex_engine == engine
+        assert len(entries) == len(lines)
+    
+    def test_parsing_compiles_no_patterns(self, generic_parser, std_processor, regex_compile_calls):
+        """Test that parsing and stats only use patterns compiled up front."""
+        lines = [
+            "2023-09-09 23:20:15 [INFO] Application started",
+            "Sep  9 23:20:16 host app: ERROR: Disk full",
+            "10.0.0.1 - - [09/Sep/2023:23:20:17 +0000] \"GET /\" 200",
+            "warning: no level bracket here",
+        ]
+        
+        def process():
+            entries = [generic_parser.parse_line(line) for line in lines]
+            std_processor.compute_stats(entries, patterns=["disk"])
+            list(std_processor.filter_entries(entries, level="ERROR", patterns=["disk"]))
+        
+        # The first pass may compile strptime's format patterns (which the
+        # stdlib caches itself); repeated lines must not compile anything
+        process()
+        regex_compile_calls.clear()
+        process()
+        
+        assert regex_compile_calls == []
+    
+    def test_unavailable_regex_engine_falls_back_to_re(self, monkeypatch):
+        """Test that an unknown regex engine falls back to re and still parses."""
+        monkeypatch.setenv("POGTOOL_REGEX_ENGINE", "no-such-engine")
+        parser = GenericLogParser()
+        
+        entry = parser.parse_line("2023-09-09 23:20:15 [WARN] Disk almost full")
+        
+        assert parser.regex_engine == "re"
+        assert entry.level == LogLevel.WARN
+        assert entry.message == "Disk almost full"
 
 
 class TestStandardLogProcessor:
     """Test StandardLogProcessor functionality."""
     
-    def test_filter_by_level(self):
+    def test_filter_by_level(self, std_processor, sample_entries):
         """Test filtering entries by log level."""
-        processor = StandardLogProcessor()
-        entries = [
-            LogEntry("Line 1", level=LogLevel.INFO, message="Info message"),
-            LogEntry("Line 2", level=LogLevel.ERROR, message="Error message"),
-            LogEntry("Line 3", level=LogLevel.INFO, message="Another info"),
-        ]
-        
-        filtered = list(processor.filter_entries(iter(entries), level="ERROR"))
+        filtered = list(std_processor.filter_entries(sample_entries, level="ERROR"))
         
-        assert len(filtered) == 1
-        assert filtered[0].level == LogLevel.ERROR
+        assert filtered == [sample_entries[1]]
     
-    def test_filter_by_pattern(self):
+    def test_filter_by_pattern(self, std_processor):
         """Test filtering entries by pattern."""
-        processor = StandardLogProcessor()
         entries = [
             LogEntry("Database connection established", message="Database connection established"),
             LogEntry("User login successful", message="User login successful"),
             LogEntry("Database query timeout", message="Database query timeout"),
         ]
         
-        filtered = list(processor.filter_entries(iter(entries), patterns=["database"]))
+        filtered = list(std_processor.filter_entries(entries, patterns=["database"]))
         
-        assert len(filtered) == 2
-        assert all("database" in entry.raw_line.lower() for entry in filtered)
+        assert filtered == [entries[0], entries[2]]
     
-    def test_compute_basic_stats(self):
+    def test_compute_basic_stats(self, std_processor, sample_entries):
         """Test basic statistics computation."""
-        processor = StandardLogProcessor()
-        entries = [
-            LogEntry("Line 1", level=LogLevel.INFO, message="Info message"),
-            LogEntry("Line 2", level=LogLevel.ERROR, message="Error message"),
-            LogEntry("Line 3", level=LogLevel.INFO, message="Info message"),
-        ]
-        
-        stats = processor.compute_stats(iter(entries))
+        stats = std_processor.compute_stats(sample_entries)
         
         assert stats.total_lines == 3
         assert stats.level_counts["INFO"] == 2
         assert stats.level_counts["ERROR"] == 1
     
-    def test_compare_entries(self):
+    def test_stats_accumulator_matches_compute_stats(self, std_processor, sample_entries):
+        """Test that adding entries in batches gives the same stats as one pass."""
+        accumulator = std_processor.create_stats_accumulator(patterns=["line"])
+        assert accumulator.add(sample_entries[:2]) == 2
+        assert accumulator.add(sample_entries[2:]) == 1
+        
+        assert accumulator.summary() == std_processor.compute_stats(sample_entries, patterns=["line"])
+    
+    def test_approx_top_messages(self, std_processor):
+        """Test that approximate top messages stay bounded and find frequent messages."""
+        entries = []
+        for i in range(10000):
+            entries.append(LogEntry(f"Line {i}", message=f"Unique message {i}"))
+            if i % 10 == 0:
+                entries.append(LogEntry("Line", message="Repeated message"))
+        
+        accumulator = std_processor.create_stats_accumulator(top_n=2, approx_top=True)
+        accumulator.add(entries)
+        stats = accumulator.summary()
+        
+        assert len(accumulator.message_counts) <= 400
+        assert stats.total_lines == len(entries)
+        assert stats.top_messages[0] == ("Repeated message", 1000)
+    
+    def test_time_groups(self, std_processor):
+        """Test time grouping keeps wall-clock groups for mixed UTC offsets."""
+        from datetime import timedelta, timezone
+        entries = [
+            LogEntry("Line 1", timestamp=datetime(2023, 9, 9, 12, 0, 5)),
+            LogEntry("Line 2", timestamp=datetime(2023, 9, 9, 12, 0, 5)),
+            LogEntry("Line 3", timestamp=datetime(2023, 9, 9, 12, 0, tzinfo=timezone.utc)),
+            LogEntry("Line 4", timestamp=datetime(2023, 9, 9, 13, 0, tzinfo=timezone(timedelta(hours=1)))),
+            LogEntry("Line 5"),
+        ]
+        
+        stats = std_processor.compute_stats(entries, group_by="hour")
+        
+        assert stats.time_groups == {"2023-09-09 12:00": 3, "2023-09-09 13:00": 1}
+    
+    def test_compare_entries(self, std_processor):
         """Test entry comparison functionality."""
-        processor = StandardLogProcessor()
         entries1 = [
             LogEntry("Line 1", message="First line"),
             LogEntry("Line 2", message="Second line"),
@@ -173,55 +349,273 @@ class TestStandardLogProcessor:
             LogEntry("Line 3", message="Third line"),
         ]
         
-        result = processor.compare_entries(entries1, entries2)
+        result = std_processor.compare_entries(entries1, entries2)
         
         assert len(result.common_lines) == 1
         assert len(result.added_lines) == 1
         assert len(result.removed_lines) == 1
         assert result.has_differences
+    
+    def test_merge_deduplicates_by_message(self, std_processor):
+        """Test that deduplication drops repeated messages only, across inputs."""
+        from pogtool.processors import dedup_key
+        first = [LogEntry("a", _TS_EARLIER, message="Disk full"), LogEntry("b", _TS, message="Disk fine")]
+        second = [LogEntry("c", _TS, message="Disk full")]
+        
+        merged = list(std_processor.merge_entries([iter(first), iter(second)], deduplicate=True))
+        
+        assert merged == first
+        # Keys are digests, identical in every process (unlike str hashes)
+        assert dedup_key(first[0]) == dedup_key(second[0]) == hashlib.blake2b(b"Disk full", digest_size=16).digest()
+    
+    def test_compare_counts(self, std_processor):
+        """Test that compare_counts matches the list-based comparison."""
+        entries1 = [
+            LogEntry("Line 1", message="First line"),
+            LogEntry("Line 1", message="First line"),
+            LogEntry("Line 2", message="Second line"),
+        ]
+        entries2 = [
+            LogEntry("Line 1", message="First line"),
+            LogEntry("Line 3", message="Third line"),
+        ]
+        
+        added, removed, modified, common = std_processor.compare_counts(iter(entries1), iter(entries2))
+        result = std_processor.compare_entries(entries1, entries2)
+        
+        assert added == len(result.added_lines) == 1
+        assert removed == len(result.removed_lines) == 1
+        assert modified == 0
+        assert common == len(result.common_lines) == 2
+
+    def test_compare_fuzzy(self, std_processor):
+        """Test fuzzy comparison ignores whitespace and case."""
+        entries1 = [LogEntry("ERROR  Disk   full"), LogEntry("INFO Started")]
+        entries2 = [LogEntry("error disk full"), LogEntry("INFO Stopped")]
+        
+        result = std_processor.compare_entries(entries1, entries2, fuzzy=True)
+        
+        assert len(result.common_lines) == 1
+        assert len(result.added_lines) == 1
+        assert len(result.removed_lines) == 1
+
+
+class TestLogProcessorDefaults:
+    """Test the LogProcessor methods that have default implementations."""
+    
+    class _MinimalProcessor(LogProcessor):
+        """Processor implementing only the abstract methods, via StandardLogProcessor."""
+        
+        def __init__(self):
+            self._standard = StandardLogProcessor()
+        
+        def filter_entries(self, entries, **filters):
+            return self._standard.filter_entries(entries, **filters)
+        
+        def compute_stats(self, entries, **options):
+            return self._standard.compute_stats(entries, **options)
+        
+        def compare_entries(self, entries1, entries2, **options):
+            return self._standard.compare_entries(entries1, entries2, **options)
+        
+        def merge_entries(self, entry_iterators, **options):
+            return self._standard.merge_entries(entry_iterators, **options)
+    
+    def test_default_stats_accumulator(self, std_processor, sample_entries):
+        """Test that the default accumulator matches compute_stats, also after a merge."""
+        processor = self._MinimalProcessor()
+        accumulator = processor.create_stats_accumulator(top_n=2)
+        other = processor.create_stats_accumulator(top_n=2)
+        
+        assert accumulator.add(sample_entries[:2]) == 2
+        assert other.add(sample_entries[2:]) == 1
+        accumulator.merge(other)
+        
+        assert accumulator.summary() == std_processor.compute_stats(sample_entries, top_n=2)
+    
+    def test_default_compare_counts(self, std_processor):
+        """Test that the default compare_counts counts the compare_entries result."""
+        processor = self._MinimalProcessor()
+        entries1 = [LogEntry("a"), LogEntry("b"), LogEntry("b")]
+        entries2 = [LogEntry("b"), LogEntry("c")]
+        
+        counts = processor.compare_counts(iter(entries1), iter(entries2))
+        
+        assert counts == std_processor.compare_counts(iter(entries1), iter(entries2))
+        assert counts == (1, 1, 0, 2)
 
 
 class TestTextFormatter:
     """Test TextFormatter functionality."""
     
-    def test_format_stats(self):
+    def test_format_stats(self, text_formatter, sample_stats):
         """Test statistics formatting."""
-        formatter = TextFormatter(use_colors=False)
-        
-        from pogtool.core.models import StatsSummary
-        stats = StatsSummary(
-            total_lines=100,
-            level_counts={"INFO": 70, "ERROR": 30},
-            pattern_counts={"timeout": 5},
-            time_groups={"2023-09-09 23:20": 10},
-            top_messages=[("Test message", 5)]
-        )
-        
-        output = formatter.format_stats(stats)
+        output = text_formatter.format_stats(sample_stats)
         
         assert "Total lines: 100" in output
         assert "INFO" in output
         assert "ERROR" in output
         assert "timeout" in output
     
-    def test_format_entries(self):
+    def test_format_entries(self, text_formatter):
         """Test log entries formatting."""
-        formatter = TextFormatter(use_colors=False)
         entries = [
             LogEntry(
                 "2023-09-09 23:20:15 [INFO] Test message",
-                timestamp=datetime(2023, 9, 9, 23, 20, 15),
+                timestamp=_TS_EARLIER,
                 level=LogLevel.INFO,
                 message="Test message"
             )
         ]
         
-        output = formatter.format_entries(entries)
+        output = text_formatter.format_entries(entries)
         
         assert "2023-09-09 23:20:15" in output
         assert "[INFO]" in output
         assert "Test message" in output
 
 
+class TestCommandOutput:
+    """Test Command output helpers."""
+    
+    class _NoopCommand(Command):
+        def execute(self, **kwargs):
+            pass
+    
+    def test_write_output_to_stdout(self, capsys):
+        """Test stdout output keeps print()'s trailing newline."""
+        self._NoopCommand()._write_output("result", None)
+        
+        assert capsys.readouterr().out == "result\n"
+    
+    def test_level_filter_keeps_levels_not_named_in_line(self, tmp_path):
+        """Test --only filtering with a parser that derives levels from status codes."""
+        from pogtool.parsers import CommonLogParser
+        from pogtool.readers import StandardFileReader
+        log_file = tmp_path / "access.log"
+        log_file.write_text(
+            '127.0.0.1 - - [09/Sep/2023:23:20:15 +0000] "GET /x HTTP/1.1" 500 123\n'
+            '127.0.0.1 - - [09/Sep/2023:23:20:16 +0000] "GET /y HTTP/1.1" 200 456\n'
+        )
+        command = self._NoopCommand(file_reader=StandardFileReader(), log_parser=CommonLogParser())
+        
+        entries = list(command._parse_files([str(log_file)], only="ERROR"))
+        
+        assert [entry.line_number for entry in entries] == [1]
+        assert entries[0].level == LogLevel.ERROR
+
+
+class TestParallelParsing:
+    """Test batch parsing in worker processes."""
+    
+    def test_parse_lines_in_pool_matches_serial_parse(self, monkeypatch):
+        """Test pooled parsing keeps line order, numbering and filtering."""
+        from concurrent.futures import ProcessPoolExecutor
+        from pogtool import parallel
+        monkeypatch.setattr(parallel, "PARSE_BATCH_LINES", 3)
+        parser = GenericLogParser()
+        lines = [
+            f"2023-09-09 23:20:{i:02d} [{'ERROR' if i % 3 == 0 else 'INFO'}] Message {i}" if i % 5 else ""
+            for i in range(20)
+        ]
+        
+        expected = [
+            parser.parse_line(line, source_file="app.log", line_number=number)
+            for number, line in enumerate(lines, 1)
+            if line and "ERROR" in line
+        ]
+        
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            entries = list(parallel.parse_lines_in_pool(
+                iter(lines), parser, "app.log", executor, 2,
+                line_filter=parser.level_prefilter("error"), only="error",
+            ))
+        
+        assert entries == expected
+    
+    def test_pooled_stats_match_serial_stats(self, monkeypatch, tmp_path):
+        """Test that stats merged from worker batches equal in-process stats."""
+        from concurrent.futures import ProcessPoolExecutor
+        from pogtool import parallel
+        from pogtool.commands import stats as stats_module
+        monkeypatch.setattr(parallel, "PARSE_BATCH_LINES", 4)
+        log_file = tmp_path / "app.log"
+        log_file.write_text("".join(
+            f"2023-09-09 23:{i % 3:02d}:{i:02d} [{'ERROR' if i % 3 == 0 else 'INFO'}] Message {i % 4}\n"
+            for i in range(30)
+        ))
+        options = {"group_by": "minute", "top_n": 3, "patterns": ["message 1"]}
+        command = stats_module.StatsCommand()
+        
+        serial = command._log_processor.create_stats_accumulator(**options)
+        assert command._accumulate_files([str(log_file)], serial, options, "error") == 30
+        
+        monkeypatch.setattr(stats_module, "create_parse_executor", lambda files, max_workers: ProcessPoolExecutor(max_workers=2))
+        pooled = command._log_processor.create_stats_accumulator(**options)
+        assert command._accumulate_files([str(log_file)], pooled, options, "error") == 30
+        
+        assert pooled.summary() == serial.summary()
+        assert pooled.summary().total_lines == 10
+
+
+class TestStandardFileReader:
+    """Test StandardFileReader functionality."""
+    
+    @pytest.mark.slow
+    def test_follow_reads_appended_and_rotated_lines(self, tmp_path):
+        """Test that follow mode wakes up for appends and reopens a rotated file."""
+        import os
+        import threading
+        from pogtool.readers import StandardFileReader
+        log_file = tmp_path / "app.log"
+        log_file.write_text("existing\n")
+        
+        def append(text):
+            with open(log_file, "a") as f:
+                f.write(text)
+        
+        def rotate():
+            os.replace(log_file, tmp_path / "app.log.1")
+            log_file.write_text("after rotation\n")
+        
+        lines = StandardFileReader().read_lines(str(log_file), follow=True)
+        try:
+            assert next(lines) == "existing\n"
+            
+            threading.Timer(0.2, append, ["appended\n"]).start()
+            assert next(lines) == "appended\n"
+            
+            threading.Timer(0.2, rotate).start()
+            assert next(lines) == "after rotation\n"
+        finally:
+            lines.close()
+
+
+class TestMultiFileReader:
+    """Test MultiFileReader functionality."""
+    
+    def test_reads_each_compression_format(self, tmp_path):
+        """Test that bzip2 and xz files are decompressed, by extension or magic bytes."""
+        import bz2
+        import gzip
+        import lzma
+        from pogtool.readers import MultiFileReader
+        content = "2024-01-01 10:00:00 INFO first\n2024-01-01 10:00:01 ERROR second\n"
+        files = {
+            "app.log.gz": gzip.compress(content.encode()),
+            "app.log.bz2": bz2.compress(content.encode()),
+            "app.log.xz": lzma.compress(content.encode()),
+            "bz2-without-extension": bz2.compress(content.encode()),
+            "xz-without-extension": lzma.compress(content.encode()),
+            "plain.log": content.encode(),
+        }
+        
+        reader = MultiFileReader()
+        for name, data in files.items():
+            path = tmp_path / name
+            path.write_bytes(data)
+            assert "".join(reader.read_lines(str(path))) == content, name
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -6,17 +6,63 @@ to ensure output content and structure are correct, similar to user examples.
 """
 
 import subprocess
-import tempfile
+import sys
 import os
+import shutil
+import signal
+import time
 import json
 import pytest
+from pathlib import Path
+from click.testing import CliRunner
+
+from pogtool.cli import cli
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TESTLOGS_DIR = os.path.join(REPO_ROOT, 'testlogs')
+APP1_LOG = os.path.join(TESTLOGS_DIR, 'app1.log')
+APP2_LOG = os.path.join(TESTLOGS_DIR, 'app2.log')
+# Interpreter running the tests, isolated from user site-packages and PYTHON* variables
+PY = [sys.executable, '-I']
+POGTOOL_SCRIPT = os.path.join(REPO_ROOT, 'pogtool.py')
+
+
+def wait_for(predicate, timeout=5.0, interval=0.02):
+    """Poll ``predicate`` until it returns true or ``timeout`` seconds pass."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+    return True
+
+
+def read_text(path):
+    """Contents of a text file, or an empty string if it does not exist yet."""
+    try:
+        return Path(path).read_text()
+    except FileNotFoundError:
+        return ""
+
+
+def append_lines(path, *lines):
+    """Append lines to a followed file in a single write."""
+    with open(path, 'a') as f:
+        f.write("".join(lines))
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """Click runner invoking the CLI in-process (no interpreter startup per test)."""
+    return CliRunner()
 
 
 class TestMergeCommand:
     """Integration tests for the merge command CLI."""
 
-    @pytest.fixture
-    def test_log_files(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def test_log_files(cls, tmp_path_factory):
         """Create temporary test log files with sample data for merging."""
         test_log_content1 = """2024-01-01 10:00:00 INFO Application started
 2024-01-01 10:00:02 ERROR Failed to connect to database
@@ -24,72 +70,56 @@ class TestMergeCommand:
 2024-01-01 10:00:06 INFO Processing request
 """
 
+        # The second and third files have identical content
         test_log_content2 = """2024-01-01 10:00:01 DEBUG Loading configuration
 2024-01-01 10:00:03 WARN Retrying connection
 2024-01-01 10:00:05 ERROR DummyISTT error occurred
 2024-01-01 10:00:07 INFO Request completed
 """
 
-        test_log_content3 = """2024-01-01 10:00:01 DEBUG Loading configuration
-2024-01-01 10:00:03 WARN Retrying connection
-2024-01-01 10:00:05 ERROR DummyISTT error occurred
-2024-01-01 10:00:07 INFO Request completed
-"""
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f1:
-            f1.write(test_log_content1)
-            temp_path1 = f1.name
-            
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f2:
-            f2.write(test_log_content2)
-            temp_path2 = f2.name
-            
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f3:
-            f3.write(test_log_content3)
-            temp_path3 = f3.name
+        log_dir = tmp_path_factory.mktemp("merge_logs")
+        path1 = log_dir / "app1.log"
+        path2 = log_dir / "app2.log"
+        path3 = log_dir / "app3.log"
         
-        yield temp_path1, temp_path2, temp_path3
+        path1.write_text(test_log_content1)
+        path2.write_text(test_log_content2)
+        try:
+            # A second name for the same data instead of a second copy
+            os.link(path2, path3)
+        except OSError:
+            shutil.copyfile(path2, path3)
         
-        # Cleanup
-        os.unlink(temp_path1)
-        os.unlink(temp_path2)
-        os.unlink(temp_path3)
+        return str(path1), str(path2), str(path3)
 
     @pytest.fixture
-    def temp_output_file(self):
-        """Create a temporary output file for testing."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f:
-            temp_path = f.name
-        
-        yield temp_path
-        
-        # Cleanup
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
+    def temp_output_file(self, tmp_path):
+        """Path of an output file in a per-test directory that pytest cleans up."""
+        return str(tmp_path / "merged.log")
 
-    def test_basic_merge_to_stdout(self, test_log_files):
-        """Test basic merging of two log files to stdout."""
+    @pytest.mark.parametrize("extra_args, expected", [
+        ([], ["Application started", "Loading configuration"]),
+        (['--tag'], []),
+        (['--normalize-timestamps'], []),
+        (['--deduplicate'], []),
+        (['--deduplicate', '--tag'], []),
+    ])
+    def test_merge_variants(self, runner, test_log_files, extra_args, expected):
+        """Test merging two log files to stdout with different flag combinations."""
         file1, file2, _ = test_log_files
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'merge', file1, file2], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
+        result = runner.invoke(cli, ['merge', file1, file2, *extra_args])
         
-        assert result.returncode == 0
-        # Should contain merged content in chronological order
+        assert result.exit_code == 0
         assert len(result.stdout) > 0
-        assert "Application started" in result.stdout
-        assert "Loading configuration" in result.stdout
+        for text in expected:
+            assert text in result.stdout
 
-    def test_merge_with_output_file(self, test_log_files, temp_output_file):
+    def test_merge_with_output_file(self, runner, test_log_files, temp_output_file):
         """Test merging with --output flag to write to file."""
         file1, file2, _ = test_log_files
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'merge', file1, file2, '--output', temp_output_file], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
+        result = runner.invoke(cli, ['merge', file1, file2, '--output', temp_output_file])
         
-        assert result.returncode == 0
+        assert result.exit_code == 0
         # Check that output file was created and contains merged data
         assert os.path.exists(temp_output_file)
         with open(temp_output_file, 'r') as f:
@@ -97,113 +127,52 @@ class TestMergeCommand:
             assert len(content) > 0
             assert "Application started" in content
 
-    def test_merge_with_tag(self, test_log_files):
-        """Test merging with --tag flag to add source file tags."""
-        file1, file2, _ = test_log_files
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'merge', file1, file2, '--tag'], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
-        
-        assert result.returncode == 0
-        # Should contain source file information
-        assert len(result.stdout) > 0
-
-    def test_merge_with_normalize_timestamps(self, test_log_files):
-        """Test merging with --normalize-timestamps flag."""
-        file1, file2, _ = test_log_files
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'merge', file1, file2, '--normalize-timestamps'], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
-        
-        assert result.returncode == 0
-        assert len(result.stdout) > 0
-
-    def test_merge_with_deduplicate(self, test_log_files):
-        """Test merging with --deduplicate flag to remove duplicate entries."""
-        file2, file3, _ = test_log_files  # file2 and file3 have identical content
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'merge', file2, file3, '--deduplicate'], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
-        
-        assert result.returncode == 0
-        # Should deduplicate identical entries
-        assert len(result.stdout) > 0
-
-    def test_merge_multiple_files(self, test_log_files):
+    def test_merge_multiple_files(self, runner, test_log_files):
         """Test merging three log files."""
         file1, file2, file3 = test_log_files
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'merge', file1, file2, file3], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
+        result = runner.invoke(cli, ['merge', file1, file2, file3])
         
-        assert result.returncode == 0
+        assert result.exit_code == 0
         assert len(result.stdout) > 0
         # Should contain entries from all three files
         assert "Application started" in result.stdout
         assert "Loading configuration" in result.stdout
 
-    def test_merge_combined_flags(self, test_log_files, temp_output_file):
+    def test_merge_combined_flags(self, runner, test_log_files, temp_output_file):
         """Test merging with multiple flags combined."""
         file1, file2, _ = test_log_files
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'merge', file1, file2, '--output', temp_output_file, '--tag', '--normalize-timestamps'], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
+        result = runner.invoke(cli, ['merge', file1, file2, '--output', temp_output_file, '--tag', '--normalize-timestamps'])
         
-        assert result.returncode == 0
+        assert result.exit_code == 0
         # Check that output file was created
         assert os.path.exists(temp_output_file)
         with open(temp_output_file, 'r') as f:
             content = f.read()
             assert len(content) > 0
 
-    def test_merge_with_deduplicate_and_tag(self, test_log_files):
-        """Test merging with both --deduplicate and --tag flags."""
-        file2, file3, _ = test_log_files  # file2 and file3 have identical content
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'merge', file2, file3, '--deduplicate', '--tag'], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
-        
-        assert result.returncode == 0
-        assert len(result.stdout) > 0
-
-    def test_merge_nonexistent_files(self):
+    def test_merge_nonexistent_files(self, runner):
         """Test merging with non-existent files returns error."""
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'merge', 'nonexistent1.log', 'nonexistent2.log'], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
+        result = runner.invoke(cli, ['merge', 'nonexistent1.log', 'nonexistent2.log'])
         
         # Should fail with appropriate error code and message
-        assert result.returncode == 2  # CLI validation error
+        assert result.exit_code == 2  # CLI validation error
         assert "does not exist" in result.stderr
 
-    def test_merge_single_file(self, test_log_files):
+    def test_merge_single_file(self, runner, test_log_files):
         """Test merging with a single file (edge case)."""
         file1, _, _ = test_log_files
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'merge', file1], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
+        result = runner.invoke(cli, ['merge', file1])
         
-        assert result.returncode == 0
+        assert result.exit_code == 0
         # Should show error message for single file merge
         assert len(result.stdout) > 0
         assert "At least two files are required for merging" in result.stdout
 
-    def test_merge_actual_usage_basic_chronological_order(self):
+    def test_merge_actual_usage_basic_chronological_order(self, runner):
         """Test actual usage: validate chronological merging of real log files."""
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'merge', 'testlogs/app1.log', 'testlogs/app2.log'], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
+        result = runner.invoke(cli, ['merge', APP1_LOG, APP2_LOG])
         
-        assert result.returncode == 0
+        assert result.exit_code == 0
         output_lines = result.stdout.strip().split('\n')
         
         # Should have entries from both files
@@ -220,85 +189,62 @@ class TestMergeCommand:
         assert timestamps == sorted(timestamps), "Merged entries are not in chronological order"
         
         # Should contain entries from both files
-        assert any("WebServer] Server starting on port 8080" in line for line in output_lines)
-        assert any("EmailService] Email service initialized" in line for line in output_lines)
+        assert "WebServer] Server starting on port 8080" in result.stdout
+        assert "EmailService] Email service initialized" in result.stdout
 
-    def test_merge_actual_usage_with_tag_flag(self):
+    def test_merge_actual_usage_with_tag_flag(self, runner):
         """Test actual usage: validate --tag flag adds source file information."""
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'merge', 'testlogs/app1.log', 'testlogs/app2.log', '--tag'], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
+        result = runner.invoke(cli, ['merge', APP1_LOG, APP2_LOG, '--tag'])
         
-        assert result.returncode == 0
+        assert result.exit_code == 0
         output = result.stdout
         
         # Should contain source file tags - currently not implemented, so just check output exists
         assert len(output.strip()) > 0
 
-    def test_merge_actual_usage_deduplicate_functionality(self):
+    def test_merge_actual_usage_deduplicate_functionality(self, runner):
         """Test actual usage: validate --deduplicate removes duplicate entries."""
-        # First merge without deduplicate to see duplicates
-        result_with_dupes = subprocess.run(
-            ['python3', 'pogtool.py', 'merge', 'testlogs/app1.log', 'testlogs/app1.log'], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
+        # Merging a file with itself yields every entry twice; deduplication
+        # should leave exactly one copy of each line of the file
+        with open(APP1_LOG) as f:
+            file_lines = sum(1 for line in f if line.strip())
         
-        # Then merge with deduplicate
-        result_deduped = subprocess.run(
-            ['python3', 'pogtool.py', 'merge', 'testlogs/app1.log', 'testlogs/app1.log', '--deduplicate'], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
+        result_deduped = runner.invoke(cli, ['merge', APP1_LOG, APP1_LOG, '--deduplicate'])
         
-        assert result_with_dupes.returncode == 0
-        assert result_deduped.returncode == 0
+        assert result_deduped.exit_code == 0
         
-        lines_with_dupes = len(result_with_dupes.stdout.strip().split('\n'))
         lines_deduped = len(result_deduped.stdout.strip().split('\n'))
         
-        # Deduplicated version should have fewer lines
-        assert lines_deduped <= lines_with_dupes
-        
-        # Original should have exactly double the entries (same file twice)
-        assert lines_with_dupes == 2 * lines_deduped
+        assert lines_deduped == file_lines
 
-    def test_merge_actual_usage_output_to_file(self):
+    def test_merge_actual_usage_output_to_file(self, runner, tmp_path):
         """Test actual usage: validate --output flag writes to file correctly."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as temp_file:
-            output_path = temp_file.name
+        output_path = str(tmp_path / "merged.log")
         
-        try:
-            result = subprocess.run(
-                ['python3', 'pogtool.py', 'merge', 'testlogs/app1.log', 'testlogs/app2.log', '--output', output_path], 
-                capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-            )
-            
-            assert result.returncode == 0
-            # stdout should be empty when writing to file
-            assert len(result.stdout.strip()) == 0 or "merged" in result.stdout.lower() and "files into" in result.stdout.lower()
+        result = runner.invoke(cli, ['merge', APP1_LOG, APP2_LOG, '--output', output_path])
+        
+        assert result.exit_code == 0
+        # stdout should be empty when writing to file
+        assert len(result.stdout.strip()) == 0 or "merged" in result.stdout.lower() and "files into" in result.stdout.lower()
+        
+        # File should exist and contain merged data
+        assert os.path.exists(output_path)
+        with open(output_path, 'r') as f:
+            content = f.read()
+            assert len(content) > 0
+            # Should contain entries from both files
+            assert "WebServer] Server starting on port 8080" in content
+            assert "EmailService] Email service initialized" in content
             
-            # File should exist and contain merged data
-            assert os.path.exists(output_path)
-            with open(output_path, 'r') as f:
-                content = f.read()
-                assert len(content) > 0
-                # Should contain entries from both files
-                assert "WebServer] Server starting on port 8080" in content
-                assert "EmailService] Email service initialized" in content
-                
-                # Should be chronologically ordered
-                lines = content.strip().split('\n')
-                timestamps = []
-                for line in lines:
-                    if line.startswith('2025-09-10'):
-                        timestamps.append(line[:19])
-                assert timestamps == sorted(timestamps)
-                
-        finally:
-            if os.path.exists(output_path):
-                os.unlink(output_path)
+            # Should be chronologically ordered
+            lines = content.strip().split('\n')
+            timestamps = []
+            for line in lines:
+                if line.startswith('2025-09-10'):
+                    timestamps.append(line[:19])
+            assert timestamps == sorted(timestamps)
 
-    def test_merge_actual_usage_normalize_timestamps(self):
+    def test_merge_actual_usage_normalize_timestamps(self, runner, tmp_path):
         """Test actual usage: validate --normalize-timestamps standardizes timestamp formats."""
         # Create files with different timestamp formats
         content1 = """2024-01-01 10:00:01 INFO Message 1
@@ -307,345 +253,246 @@ Jan 1 10:00:02 2024 WARN Message 2"""
         content2 = """2024/01/01 10:00:03 ERROR Message 3
 01-01-2024 10:00:04 DEBUG Message 4"""
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f1:
-            f1.write(content1)
-            temp_path1 = f1.name
-            
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f2:
-            f2.write(content2)
-            temp_path2 = f2.name
+        temp_path1 = str(tmp_path / "input1.log")
+        Path(temp_path1).write_text(content1)
         
-        try:
-            result = subprocess.run(
-                ['python3', 'pogtool.py', 'merge', temp_path1, temp_path2, '--normalize-timestamps'], 
-                capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-            )
-            
-            assert result.returncode == 0
-            output = result.stdout
-            
-            # All timestamps should be normalized to a consistent format
-            lines = output.strip().split('\n')
-            timestamp_formats = set()
-            for line in lines:
-                if 'Message' in line:
-                    # Extract timestamp part (first 19 chars usually)
-                    timestamp_part = line[:19]
-                    # Check format pattern
-                    if timestamp_part.count('-') == 2 and timestamp_part.count(':') == 2:
-                        timestamp_formats.add('standard')
-                    else:
-                        timestamp_formats.add('other')
-            
-            # Should have consistent timestamp formatting
-            assert len(timestamp_formats) <= 1 or not timestamp_formats, "Timestamps not properly normalized"
-            
-        finally:
-            os.unlink(temp_path1)
-            os.unlink(temp_path2)
+        temp_path2 = str(tmp_path / "input2.log")
+        Path(temp_path2).write_text(content2)
+        
+        result = runner.invoke(cli, ['merge', temp_path1, temp_path2, '--normalize-timestamps'])
+        
+        assert result.exit_code == 0
+        output = result.stdout
+        
+        # All timestamps should be normalized to a consistent format
+        lines = output.strip().split('\n')
+        timestamp_formats = set()
+        for line in lines:
+            if 'Message' in line:
+                # Extract timestamp part (first 19 chars usually)
+                timestamp_part = line[:19]
+                # Check format pattern
+                if timestamp_part.count('-') == 2 and timestamp_part.count(':') == 2:
+                    timestamp_formats.add('standard')
+                else:
+                    timestamp_formats.add('other')
+        
+        # Should have consistent timestamp formatting
+        assert len(timestamp_formats) <= 1 or not timestamp_formats, "Timestamps not properly normalized"
 
-    def test_merge_actual_usage_multiple_files_ordering(self):
+    def test_merge_actual_usage_multiple_files_ordering(self, runner, tmp_path):
         """Test actual usage: validate merging three files maintains chronological order."""
         # Create a third test file
         content3 = """2025-09-10 08:00:30 INFO [ThirdApp] Third app started
 2025-09-10 08:01:30 WARN [ThirdApp] Third app warning
 2025-09-10 08:02:30 ERROR [ThirdApp] Third app error"""
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f3:
-            f3.write(content3)
-            temp_path3 = f3.name
+        temp_path3 = str(tmp_path / "input3.log")
+        Path(temp_path3).write_text(content3)
         
-        try:
-            result = subprocess.run(
-                ['python3', 'pogtool.py', 'merge', 'testlogs/app1.log', 'testlogs/app2.log', temp_path3], 
-                capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-            )
-            
-            assert result.returncode == 0
-            output_lines = result.stdout.strip().split('\n')
-            
-            # Should contain entries from all three files
-            assert any("WebServer] Server starting" in line for line in output_lines)
-            assert any("EmailService] Email service" in line for line in output_lines)
-            assert any("ThirdApp] Third app" in line for line in output_lines)
-            
-            # Should maintain chronological order
-            timestamps = []
-            for line in output_lines:
-                if line.startswith('2025-09-10'):
-                    timestamps.append(line[:19])
-            
-            assert timestamps == sorted(timestamps), "Three-file merge not chronologically ordered"
-            
-        finally:
-            os.unlink(temp_path3)
+        result = runner.invoke(cli, ['merge', APP1_LOG, APP2_LOG, temp_path3])
+        
+        assert result.exit_code == 0
+        output_lines = result.stdout.strip().split('\n')
+        
+        # Should contain entries from all three files
+        assert "WebServer] Server starting" in result.stdout
+        assert "EmailService] Email service" in result.stdout
+        assert "ThirdApp] Third app" in result.stdout
+        
+        # Should maintain chronological order
+        timestamps = []
+        for line in output_lines:
+            if line.startswith('2025-09-10'):
+                timestamps.append(line[:19])
+        
+        assert timestamps == sorted(timestamps), "Three-file merge not chronologically ordered"
 
-    def test_merge_actual_usage_error_handling_missing_files(self):
+    def test_merge_actual_usage_error_handling_missing_files(self, runner):
         """Test actual usage: validate proper error handling for missing files."""
-        result = subprocess.run(
-            ['python3', 'pogtool.py', 'merge', 'nonexistent1.log', 'nonexistent2.log'], 
-            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-        )
+        result = runner.invoke(cli, ['merge', 'nonexistent1.log', 'nonexistent2.log'])
         
         # Should fail with appropriate error
-        assert result.returncode != 0
+        assert result.exit_code != 0
         assert "does not exist" in result.stderr or "not found" in result.stderr.lower()
 
-    def test_merge_actual_usage_combined_flags(self):
+    def test_merge_actual_usage_combined_flags(self, runner, tmp_path):
         """Test actual usage: validate multiple flags work together correctly."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as temp_file:
-            output_path = temp_file.name
+        output_path = str(tmp_path / "merged.log")
         
-        try:
-            result = subprocess.run(
-                ['python3', 'pogtool.py', 'merge', 'testlogs/app1.log', 'testlogs/app2.log', 
-                 '--output', output_path, '--tag', '--normalize-timestamps'], 
-                capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__))
-            )
-            
-            assert result.returncode == 0
+        result = runner.invoke(cli, ['merge', APP1_LOG, APP2_LOG, 
+             '--output', output_path, '--tag', '--normalize-timestamps'])
+        
+        assert result.exit_code == 0
+        
+        # File should exist and contain merged data with tags
+        assert os.path.exists(output_path)
+        with open(output_path, 'r') as f:
+            content = f.read()
+            assert len(content) > 0
             
-            # File should exist and contain merged data with tags
-            assert os.path.exists(output_path)
-            with open(output_path, 'r') as f:
-                content = f.read()
-                assert len(content) > 0
-                
-                # Should have source file information due to --tag
-                assert ("app1" in content or "app2" in content or 
-                       "testlogs" in content), "Tag information not found in output"
-                
-        finally:
-            if os.path.exists(output_path):
-                os.unlink(output_path)
+            # Should have source file information due to --tag
+            assert ("app1" in content or "app2" in content or 
+                   "testlogs" in content), "Tag information not found in output"
 
-    def test_merge_follow_mode_skips_existing_content(self):
+    def _start_follow(self, output_path, *args):
+        """Start ``merge --follow`` and wait until it is tailing its inputs."""
+        process = subprocess.Popen(
+            [*PY, POGTOOL_SCRIPT, 'merge', '--follow', '--output', output_path, *args],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            cwd=REPO_ROOT
+        )
+        # The output file is created once every input is open at its end, so
+        # anything appended from then on counts as new content
+        if not wait_for(lambda: os.path.exists(output_path) or process.poll() is not None):
+            process.kill()
+            pytest.fail("merge --follow did not start")
+        return process
+
+    def _stop_follow(self, process):
+        """Stop ``merge --follow`` the way a user does, killing it if it hangs."""
+        if os.name == 'posix':
+            # Ctrl+C: merge closes its inputs and output before exiting
+            process.send_signal(signal.SIGINT)
+        else:
+            process.terminate()
+        try:
+            process.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    @pytest.mark.slow
+    def test_merge_follow_mode_skips_existing_content(self, tmp_path):
         """Test that --follow flag only processes new entries added after command starts."""
-        import time
-        import threading
-        
         # Create temporary files with initial content
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f1:
-            f1.write("2025-01-01T10:00:00 [INFO] Initial entry 1\n")
-            f1.write("2025-01-01T10:01:00 [INFO] Initial entry 2\n")
-            temp_path1 = f1.name
-            
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f2:
-            f2.write("2025-01-01T10:00:30 [INFO] Initial entry 3\n")  
-            f2.write("2025-01-01T10:01:30 [INFO] Initial entry 4\n")
-            temp_path2 = f2.name
+        temp_path1 = str(tmp_path / "input1.log")
+        Path(temp_path1).write_text(
+            "2025-01-01T10:00:00 [INFO] Initial entry 1\n"
+            "2025-01-01T10:01:00 [INFO] Initial entry 2\n"
+        )
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as output_file:
-            output_path = output_file.name
+        temp_path2 = str(tmp_path / "input2.log")
+        Path(temp_path2).write_text(
+            "2025-01-01T10:00:30 [INFO] Initial entry 3\n"
+            "2025-01-01T10:01:30 [INFO] Initial entry 4\n"
+        )
         
-        def add_new_entries():
-            """Add new entries to log files after a delay."""
-            time.sleep(1.5)  # Wait for follow mode to start
-            
-            with open(temp_path1, 'a') as f:
-                f.write("2025-01-01T10:02:00 [INFO] New entry after follow started\n")
-            
-            with open(temp_path2, 'a') as f:
-                f.write("2025-01-01T10:02:30 [INFO] Another new entry\n")
-            
-            time.sleep(1)
-            
-            with open(temp_path1, 'a') as f:
-                f.write("2025-01-01T10:03:00 [INFO] Final new entry\n")
+        output_path = str(tmp_path / "merged.log")
+        process = self._start_follow(output_path, temp_path1, temp_path2)
         
         try:
-            # Start thread to add entries
-            thread = threading.Thread(target=add_new_entries)
-            thread.start()
-            
-            # Start merge process with --follow
-            process = subprocess.Popen(
-                ['python3', 'pogtool.py', 'merge', '--follow', '--output', output_path, temp_path1, temp_path2],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=os.path.dirname(os.path.dirname(__file__))
-            )
-            
-            # Wait for new entries to be added
-            thread.join()
-            time.sleep(1)  # Let follow mode process the new entries
-            
-            # Stop the process
-            process.terminate()
-            process.wait(timeout=5)
-            
-            # Check output file - should only contain new entries
-            with open(output_path, 'r') as f:
-                content = f.read()
-            
-            lines = [line.strip() for line in content.strip().split('\n') if line.strip()]
-            
-            # Should NOT contain initial entries
-            assert not any("Initial entry" in line for line in lines), "Follow mode included existing content"
-            
-            # Should contain only new entries  
-            assert any("New entry after follow started" in line for line in lines), "Missing new entry"
-            assert any("Another new entry" in line for line in lines), "Missing another new entry"
-            assert any("Final new entry" in line for line in lines), "Missing final new entry"
-            
-            # Should be chronologically ordered
-            timestamps = []
-            for line in lines:
-                if line.startswith('2025-01-01T10:'):
-                    timestamps.append(line[:19])
-            
-            assert timestamps == sorted(timestamps), "New entries not chronologically ordered"
+            append_lines(temp_path1, "2025-01-01T10:02:00 [INFO] New entry after follow started\n")
+            append_lines(temp_path2, "2025-01-01T10:02:30 [INFO] Another new entry\n")
+            assert wait_for(lambda: "Another new entry" in read_text(output_path)), "Missing another new entry"
             
+            # A later write is picked up by the running process as well
+            append_lines(temp_path1, "2025-01-01T10:03:00 [INFO] Final new entry\n")
+            assert wait_for(lambda: "Final new entry" in read_text(output_path)), "Missing final new entry"
         finally:
-            os.unlink(temp_path1)
-            os.unlink(temp_path2)
-            if os.path.exists(output_path):
-                os.unlink(output_path)
+            self._stop_follow(process)
+        
+        # Check output file - should only contain new entries
+        content = read_text(output_path)
+        lines = [line.strip() for line in content.splitlines() if line.strip()]
+        
+        # Should NOT contain initial entries
+        assert "Initial entry" not in content, "Follow mode included existing content"
+        
+        # Should contain only new entries  
+        assert "New entry after follow started" in content, "Missing new entry"
+        assert "Another new entry" in content, "Missing another new entry"
+        assert "Final new entry" in content, "Missing final new entry"
+        
+        # Should be chronologically ordered
+        timestamps = []
+        for line in lines:
+            if line.startswith('2025-01-01T10:'):
+                timestamps.append(line[:19])
+        
+        assert timestamps == sorted(timestamps), "New entries not chronologically ordered"
 
-    def test_merge_follow_mode_with_tag_flag(self):
+    @pytest.mark.slow
+    def test_merge_follow_mode_with_tag_flag(self, tmp_path):
         """Test that --follow works correctly with --tag flag."""
-        import time
-        import threading
-        
         # Create temporary files
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f1:
-            f1.write("2025-01-01T10:00:00 [INFO] Existing entry\n")
-            temp_path1 = f1.name
-            
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f2:
-            f2.write("2025-01-01T10:00:30 [INFO] Another existing entry\n")
-            temp_path2 = f2.name
+        temp_path1 = str(tmp_path / "input1.log")
+        Path(temp_path1).write_text("2025-01-01T10:00:00 [INFO] Existing entry\n")
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as output_file:
-            output_path = output_file.name
+        temp_path2 = str(tmp_path / "input2.log")
+        Path(temp_path2).write_text("2025-01-01T10:00:30 [INFO] Another existing entry\n")
         
-        def add_tagged_entries():
-            """Add entries to be tagged."""
-            time.sleep(1.5)
-            
-            with open(temp_path1, 'a') as f:
-                f.write("2025-01-01T10:02:00 [INFO] Tagged entry from file1\n")
-            
-            with open(temp_path2, 'a') as f:
-                f.write("2025-01-01T10:02:30 [INFO] Tagged entry from file2\n")
+        output_path = str(tmp_path / "merged.log")
+        process = self._start_follow(output_path, '--tag', temp_path1, temp_path2)
         
         try:
-            # Start thread to add entries
-            thread = threading.Thread(target=add_tagged_entries)
-            thread.start()
-            
-            # Start merge process with --follow and --tag
-            process = subprocess.Popen(
-                ['python3', 'pogtool.py', 'merge', '--follow', '--tag', '--output', output_path, temp_path1, temp_path2],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=os.path.dirname(os.path.dirname(__file__))
-            )
-            
-            # Wait for entries and processing
-            thread.join()
-            time.sleep(1)
-            
-            # Stop the process
-            process.terminate()
-            process.wait(timeout=5)
-            
-            # Check output file
-            with open(output_path, 'r') as f:
-                content = f.read()
-            
-            lines = [line.strip() for line in content.strip().split('\n') if line.strip()]
-            
-            # Should not contain existing entries
-            assert not any("Existing entry" in line for line in lines), "Follow mode included existing content"
-            
-            # Should contain tagged new entries (format: [filepath] message)
-            assert any(f"[{temp_path1}]" in line and "Tagged entry from file1" in line for line in lines), "Missing tagged entry from file1"
-            assert any(f"[{temp_path2}]" in line and "Tagged entry from file2" in line for line in lines), "Missing tagged entry from file2"
-            
+            append_lines(temp_path1, "2025-01-01T10:02:00 [INFO] Tagged entry from file1\n")
+            append_lines(temp_path2, "2025-01-01T10:02:30 [INFO] Tagged entry from file2\n")
+            wait_for(lambda: read_text(output_path).count("Tagged entry") == 2)
         finally:
-            os.unlink(temp_path1)
-            os.unlink(temp_path2)
-            if os.path.exists(output_path):
-                os.unlink(output_path)
+            self._stop_follow(process)
+        
+        # Check output file
+        content = read_text(output_path)
+        lines = [line.strip() for line in content.splitlines() if line.strip()]
+        
+        # Should not contain existing entries
+        assert "Existing entry" not in content, "Follow mode included existing content"
+        
+        # Should contain tagged new entries (format: [filepath] message)
+        assert any(f"[{temp_path1}]" in line and "Tagged entry from file1" in line for line in lines), "Missing tagged entry from file1"
+        assert any(f"[{temp_path2}]" in line and "Tagged entry from file2" in line for line in lines), "Missing tagged entry from file2"
 
-    def test_merge_follow_mode_with_pattern_filter(self):
+    @pytest.mark.slow
+    def test_merge_follow_mode_with_pattern_filter(self, tmp_path):
         """Test that --follow with -e pattern only merges lines containing the pattern."""
-        import time
-        import threading
-        
         # Create temporary files
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f1:
-            f1.write("2025-01-01T10:00:00 [INFO] Existing entry\n")
-            temp_path1 = f1.name
-            
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f2:
-            f2.write("2025-01-01T10:00:30 [INFO] Another existing entry\n")
-            temp_path2 = f2.name
+        temp_path1 = str(tmp_path / "input1.log")
+        Path(temp_path1).write_text("2025-01-01T10:00:00 [INFO] Existing entry\n")
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as output_file:
-            output_path = output_file.name
+        temp_path2 = str(tmp_path / "input2.log")
+        Path(temp_path2).write_text("2025-01-01T10:00:30 [INFO] Another existing entry\n")
         
-        def add_mixed_entries():
-            """Add entries with and without the pattern."""
-            time.sleep(1.5)
-            
-            with open(temp_path1, 'a') as f:
-                f.write("2025-01-01T10:02:00 [ERROR] Database connection failed\n")
-                f.write("2025-01-01T10:02:10 [INFO] Regular info message\n")
-                f.write("2025-01-01T10:02:20 [ERROR] Another error occurred\n")
-            
-            with open(temp_path2, 'a') as f:
-                f.write("2025-01-01T10:02:30 [WARN] Warning message\n")
-                f.write("2025-01-01T10:02:40 [ERROR] Critical error detected\n")
+        output_path = str(tmp_path / "merged.log")
+        process = self._start_follow(output_path, '-e', 'ERROR', temp_path1, temp_path2)
         
         try:
-            # Start thread to add entries
-            thread = threading.Thread(target=add_mixed_entries)
-            thread.start()
-            
-            # Start merge process with --follow and -e ERROR pattern
-            process = subprocess.Popen(
-                ['python3', 'pogtool.py', 'merge', '--follow', '-e', 'ERROR', '--output', output_path, temp_path1, temp_path2],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=os.path.dirname(os.path.dirname(__file__))
+            append_lines(
+                temp_path1,
+                "2025-01-01T10:02:00 [ERROR] Database connection failed\n",
+                "2025-01-01T10:02:10 [INFO] Regular info message\n",
+                "2025-01-01T10:02:20 [ERROR] Another error occurred\n",
             )
-            
-            # Wait for entries and processing
-            thread.join()
-            time.sleep(1)
-            
-            # Stop the process
-            process.terminate()
-            process.wait(timeout=5)
-            
-            # Check output file - should only contain lines with ERROR pattern
-            with open(output_path, 'r') as f:
-                content = f.read()
-            
-            lines = [line.strip() for line in content.strip().split('\n') if line.strip()]
-            
-            # Should not contain existing entries
-            assert not any("Existing entry" in line for line in lines), "Follow mode included existing content"
-            
-            # Should only contain ERROR entries, not INFO or WARN
-            assert any("Database connection failed" in line for line in lines), "Missing ERROR entry from file1"
-            assert any("Another error occurred" in line for line in lines), "Missing second ERROR entry from file1"
-            assert any("Critical error detected" in line for line in lines), "Missing ERROR entry from file2"
-            
-            # Should NOT contain non-ERROR entries
-            assert not any("Regular info message" in line for line in lines), "Pattern filter failed - included INFO message"
-            assert not any("Warning message" in line for line in lines), "Pattern filter failed - included WARN message"
-            
-            # Should have exactly 3 ERROR entries (pattern filter worked)
-            assert len(lines) == 3, f"Expected 3 filtered lines, got {len(lines)}: {lines}"
-            
+            append_lines(
+                temp_path2,
+                "2025-01-01T10:02:30 [WARN] Warning message\n",
+                "2025-01-01T10:02:40 [ERROR] Critical error detected\n",
+            )
+            # Each file's new lines are filtered as one batch, so once the
+            # last ERROR line of each file is out, nothing else can follow
+            wait_for(lambda: all(
+                message in read_text(output_path)
+                for message in ("Another error occurred", "Critical error detected")
+            ))
         finally:
-            os.unlink(temp_path1)
-            os.unlink(temp_path2)
-            if os.path.exists(output_path):
-                os.unlink(output_path)
\ No newline at end of file
+            self._stop_follow(process)
+        
+        # Check output file - should only contain lines with ERROR pattern
+        content = read_text(output_path)
+        lines = [line.strip() for line in content.splitlines() if line.strip()]
+        
+        # Should not contain existing entries
+        assert "Existing entry" not in content, "Follow mode included existing content"
+        
+        # Should only contain ERROR entries, not INFO or WARN
+        assert "Database connection failed" in content, "Missing ERROR entry from file1"
+        assert "Another error occurred" in content, "Missing second ERROR entry from file1"
+        assert "Critical error detected" in content, "Missing ERROR entry from file2"
+        
+        # Should NOT contain non-ERROR entries
+        assert "Regular info message" not in content, "Pattern filter failed - included INFO message"
+        assert "Warning message" not in content, "Pattern filter failed - included WARN message"
+        
+        # Should have exactly 3 ERROR entries (pattern filter worked)
+        assert len(lines) == 3, f"Expected 3 filtered lines, got {len(lines)}: {lines}"
\ No newline at end of file